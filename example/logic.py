@@ -34,56 +34,66 @@ class RandomSignalStrategy(BaseStrategy):
     def handle_event(self, event: MarketEvent):
         """
         Randomly generates entry or exit signals to test the system.
+
+        Every event is answered with a signal, an empty one when there is nothing
+        to trade, so the order book can move on to the next event.
         """
         self.logger.info("IN strategy")
-        if isinstance(event.data, OhlcvMsg):
-            self.logger.info(event)
+        trade_instructions = self.random_trade_instructions(event)
 
-            # Increment the counter for each new bar
-            self.bars_processed += 1
+        # Send signal
+        self.set_signal(trade_instructions, self.order_book.last_updated)
 
-            # Wait until 10 bars have been processed before generating signals
-            if self.bars_processed < self.bars_to_wait:
-                self.logger.info(
-                    f"Waiting for {self.bars_to_wait - self.bars_processed} more bars."
-                )
-                return
-            # Randomly choose an action
-            action_choice = random.choice(
-                [
-                    Signal.Long,
-                    Signal.Short,
-                    Signal.Exit_Long,
-                    Signal.Exit_Short,
-                ]
-            )
+        if trade_instructions:
+            self.trade_id += 1
 
-            # Only generate entry signals if there's no current position
-            if action_choice in [Signal.Long, Signal.Short]:
-                if not self.portfolio_server.positions:
-                    self.last_signal = action_choice
-                else:
-                    return
-            else:
-                if self.portfolio_server.positions:
-                    self.last_signal = action_choice
-                else:
-                    return
-
-            # Calculate trade capital
-            trade_capital = self.trade_capital(self.trade_allocation)
-
-            # Generate trade instructions
-            trade_instructions = self.generate_trade_instructions(
-                self.last_signal, trade_capital
-            )
+    def random_trade_instructions(
+        self, event: MarketEvent
+    ) -> List[SignalInstruction]:
+        """
+        Randomly choose the trade instructions for an event, if any.
+        """
+        if not isinstance(event.data, OhlcvMsg):
+            return []
 
-            # Send signal
-            if trade_instructions:
-                self.set_signal(
-                    trade_instructions, self.order_book.last_updated
-                )
-                self.trade_id += 1
+        self.logger.info(event)
+
+        # Increment the counter for each new bar
+        self.bars_processed += 1
+
+        # Wait until 10 bars have been processed before generating signals
+        if self.bars_processed < self.bars_to_wait:
+            self.logger.info(
+                f"Waiting for {self.bars_to_wait - self.bars_processed} more bars."
+            )
+            return []
+
+        # Randomly choose an action
+        action_choice = random.choice(
+            [
+                Signal.Long,
+                Signal.Short,
+                Signal.Exit_Long,
+                Signal.Exit_Short,
+            ]
+        )
+
+        # Only generate entry signals if there's no current position
+        if action_choice in [Signal.Long, Signal.Short]:
+            if self.portfolio_server.positions:
+                return []
+        elif not self.portfolio_server.positions:
+            return []
+
+        self.last_signal = action_choice
+
+        # Calculate trade capital
+        trade_capital = self.trade_capital(self.trade_allocation)
+
+        # Generate trade instructions
+        return self.generate_trade_instructions(
+            self.last_signal, trade_capital
+        )
 
     def get_strategy_data(self) -> pd.DataFrame:
         return pd.DataFrame()
@@ -97,14 +107,14 @@ class RandomSignalStrategy(BaseStrategy):
         Generate trade instructions list.
         """
         quantities = {
-            ticker: 1  # Just a simple fixed quantity for testing purposes
-            for ticker in self.symbols_map.data_tickers
+            instrument_id: 1.0  # Just a simple fixed quantity for testing
+            for instrument_id in self.symbols_map.map
         }
 
         trade_instructions = []
         leg_id = 1
 
-        for ticker in self.symbols_map.data_tickers:
+        for instrument_id in self.symbols_map.map:
             if signal == Signal.Long:
                 action = Action.LONG
             elif signal == Signal.Short:
@@ -116,14 +126,14 @@ class RandomSignalStrategy(BaseStrategy):
 
             trade_instructions.append(
                 SignalInstruction(
-                    instrument=ticker,  # pyright: ignore
+                    instrument=instrument_id,
                     order_type=OrderType.MARKET,
                     action=action,
                     signal_id=1,
                     # trade_id=self.trade_id,
                     # leg_id=leg_id,
                     weight=1.0,  # Simplified for testing
-                    quantity=quantities[ticker],
+                    quantity=quantities[instrument_id],
                 )
             )
             leg_id += 1
@@ -1,6 +1,15 @@
 import argparse
-from midastrader.config import Mode
+from typing import Optional
+from midastrader.config import Config, Mode
 from midastrader.engine import EngineBuilder
+from midastrader.sweep import run_sweep
+from midastrader.walk_forward import run_walk_forward
+from midastrader.data.adaptors.historical.merge import expand_data_files
+from midastrader.data.adaptors.historical.index import (
+    DEFAULT_EVERY,
+    index_data_file,
+    sidecar_path,
+)
 
 
 def run(config_path: str, mode_str: str):
@@ -30,6 +39,34 @@ def run(config_path: str, mode_str: str):
     engine.initialize()
     engine.start()
 
+    # Results saved in the background must finish before the process exits
+    engine.wait_for_results(engine.config.save_timeout)
+
+
+def run_index(config_path: str, every: Optional[int] = None):
+    """
+    Builds the time index of each historical data file in a configuration.
+
+    Each index is saved next to its data file, where the historical adaptor picks
+    it up to seek to the start of a backtest.
+
+    Args:
+        config_path (str): The path to the configuration file (e.g., "config.toml").
+        every (Optional[int]): Records between index entries, defaults to `DEFAULT_EVERY`.
+
+    Example:
+        run_index("config.toml", 1024)
+    """
+    config = Config.from_toml(config_path)
+    data_file = config.vendors.get("historical", {}).get("data_file", "")
+
+    for path in expand_data_files(data_file):
+        index = index_data_file(path, every or DEFAULT_EVERY)
+        print(
+            f"{sidecar_path(path)}: {len(index.offsets)} entries, "
+            f"{len(index.days)} days"
+        )
+
 
 def main():
     """
@@ -41,10 +78,23 @@ def main():
 
     Command-line Arguments:
         config (str): Path to the configuration file (e.g., "config.toml").
-        mode (str): The mode to run the engine, either "backtest" or "live".
+        mode (str): The mode to run the engine, either "backtest", "live", "sweep",
+            "walkforward" or "index".
+        --grid (str): Path to the parameter grid, required for "sweep" and optimized
+            on the train windows of "walkforward".
+        --workers (int): Number of sweep or walk-forward worker processes, defaults
+            to the CPU count.
+        --train (int): Days in each walk-forward train window, 0 for none.
+        --test (int): Days in each walk-forward test window, required for "walkforward".
+        --step (int): Days between walk-forward windows, defaults to --test.
+        --metric (str): Static statistic maximized on the train windows.
+        --every (int): Records between time index entries for "index".
 
     Example Usage:
         python -m midastrader.engine.main config.toml backtest
+        python -m midastrader.engine.main config.toml sweep --grid grid.toml
+        python -m midastrader.engine.main config.toml walkforward --train 60 --test 20
+        python -m midastrader.engine.main config.toml index
 
     Raises:
         argparse.ArgumentError: If required arguments are not provided.
@@ -59,12 +109,68 @@ def main():
     )
     parser.add_argument(
         "mode",
-        help="Engine mode (Backtest or Live)",
+        help="Engine mode (Backtest, Live, Sweep, WalkForward or Index)",
+    )
+    parser.add_argument(
+        "--grid",
+        help="Path to the parameter grid for a sweep (e.g., grid.toml)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for a sweep or walk-forward study",
+    )
+    parser.add_argument(
+        "--train",
+        type=int,
+        default=0,
+        help="Days in each walk-forward train window",
+    )
+    parser.add_argument(
+        "--test",
+        type=int,
+        help="Days in each walk-forward test window",
+    )
+    parser.add_argument(
+        "--step",
+        type=int,
+        help="Days between walk-forward windows, defaults to --test",
+    )
+    parser.add_argument(
+        "--metric",
+        default="sharpe_ratio",
+        help="Statistic maximized on the walk-forward train windows",
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        help="Records between entries of the time index of data files",
     )
 
     args = parser.parse_args()
 
-    run(args.config, args.mode)
+    if args.mode.lower() == "sweep":
+        if not args.grid:
+            parser.error("sweep requires --grid")
+
+        run_sweep(args.config, args.grid, args.workers)
+    elif args.mode.lower() == "walkforward":
+        if not args.test:
+            parser.error("walkforward requires --test")
+
+        run_walk_forward(
+            args.config,
+            args.train,
+            args.test,
+            args.step,
+            args.grid,
+            args.metric,
+            args.workers,
+        )
+    elif args.mode.lower() == "index":
+        run_index(args.config, args.every)
+    else:
+        run(args.config, args.mode)
 
 
 if __name__ == "__main__":
@@ -56,6 +56,20 @@ class Config:
         log_level (str): Logging level, defaulting to "INFO".
         log_output (str): Output method for logs (e.g., "file" or "console").
         output_path (str): Path for saving output files.
+        output_format (str): Format of exported results ("xlsx", "parquet", "arrow" or "csv.gz").
+        excel_summary (bool): Also write parameters and static statistics to Excel when
+            `output_format` is not "xlsx".
+        background_save (bool): Save backtest results on worker threads, letting the
+            engine return before the export and upload finish.
+        save_workers (int): Number of worker threads saving results in the background.
+        save_timeout (Optional[float]): Seconds the CLI waits for background saving before
+            moving on, indefinitely if unset. A save still running delays the exit of the
+            process until it finishes.
+        upload_results (bool): Upload backtest results to the database after exporting them.
+        synchronous_backtest (bool): Run backtests on a single thread with the `BacktestKernel`.
+        queue_capacity (Optional[int]): Default capacity of the market data channels (DATA and ORDER_BOOK), unbounded if unset. Live mode only.
+        queue_policy (str): Default overflow policy of the market data channels ("block", "drop_oldest", "conflate" or "latest"). Live mode only.
+        queues (dict): Per-topic overrides keyed by `EventType` name, each with `capacity` and `policy`, for market data topics only.
         train_data_file (str): Path to the training dataset file.
         test_data_file (str): Path to the testing dataset file.
         data_file (str): Path to general data files.
@@ -86,6 +100,18 @@ class Config:
         self.log_level = self.general.get("log_level", "INFO")
         self.log_output = self.general.get("log_output", "file")
         self.output_path = self.general.get("output_path", "")
+        self.output_format = self.general.get("output_format", "xlsx")
+        self.excel_summary = self.general.get("excel_summary", False)
+        self.background_save = self.general.get("background_save", False)
+        self.save_workers = self.general.get("save_workers", 4)
+        self.save_timeout = self.general.get("save_timeout")
+        self.upload_results = self.general.get("upload_results", True)
+        self.synchronous_backtest = self.general.get(
+            "synchronous_backtest", False
+        )
+        self.queue_capacity = self.general.get("queue_capacity")
+        self.queue_policy = self.general.get("queue_policy", "block")
+        self.queues = self.general.get("queues", {})
 
         # Strategy settings
         self.strategy_module = self.strategy.get("logic", {}).get("module")
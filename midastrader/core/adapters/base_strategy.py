@@ -3,7 +3,7 @@ import threading
 import pandas as pd
 import importlib.util
 from typing import Type
-from typing import List
+from typing import List, Optional
 from abc import abstractmethod
 
 from midastrader.structs.symbol import SymbolMap
@@ -32,19 +32,31 @@ class BaseStrategy(CoreAdapter):
         historical_data (Any): Placeholder for loaded historical data.
     """
 
-    def __init__(self, symbols_map: SymbolMap, bus: MessageBus):
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        order_book: Optional[OrderBook] = None,
+        portfolio_server: Optional[PortfolioServer] = None,
+    ):
         """
         Initializes the strategy with required components.
 
+        Subclasses may keep the two-argument constructor, the engine running the strategy
+        makes its own order book and portfolio server the current ones while building it.
+
         Args:
             symbols_map (SymbolMap): Mapping of instrument symbols to `Symbol` objects.
-            portfolio_server (PortfolioServer): The portfolio server for managing account and positions.
-            order_book (OrderBook): The order book that maintains market data.
-            hist_data_client (DataClient): Client for accessing historical market data.
+            order_book (Optional[OrderBook]): The order book that maintains market data, the
+                current one if None.
+            portfolio_server (Optional[PortfolioServer]): The portfolio server for managing
+                account and positions, the current one if None.
         """
         super().__init__(symbols_map, bus)
-        self.order_book = OrderBook.get_instance()
-        self.portfolio_server = PortfolioServer.get_instance()
+        self.order_book = order_book or OrderBook.get_instance()
+        self.portfolio_server = (
+            portfolio_server or PortfolioServer.get_instance()
+        )
         self.historical_data = None
         self.threads = []
 
@@ -98,7 +110,7 @@ class BaseStrategy(CoreAdapter):
 
     def process_initial_data(self) -> None:
         while not self.shutdown_event.is_set():
-            if self.bus.get_flag(EventType.INITIAL_DATA):
+            if self.bus.wait_for_flag(EventType.INITIAL_DATA, True, 0.01):
                 self.handle_initial_data()
                 break
 
@@ -152,7 +164,6 @@ class BaseStrategy(CoreAdapter):
             if len(trade_instructions) > 0:
                 signal_event = SignalEvent(timestamp, trade_instructions)
                 self.bus.publish(EventType.SIGNAL, signal_event)
-                self.bus.publish(EventType.SIGNAL_UPDATE, signal_event)
             else:
                 self.bus.publish(EventType.UPDATE_SYSTEM, False)
 
@@ -1,8 +1,9 @@
 import queue
-from typing import Dict
+from typing import Dict, List
 from mbinary import RecordMsg
-from threading import Lock
-from typing import Optional
+from threading import Lock, local
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from midastrader.config import Mode
 from midastrader.structs.events.rollover_event import RolloverEvent
@@ -15,20 +16,18 @@ from midastrader.utils.logger import SystemLogger
 
 class OrderBook:
     """
-    Singleton OrderBook for shared access to market data.
+    OrderBook for shared access to market data within an engine.
 
     Provides thread-safe read access to components like strategies and brokers,
-    and controlled write access via the OrderBookManager.
+    and controlled write access via the OrderBookManager. Each engine creates its own
+    instance and passes it to its components.
     """
 
     _instance: Optional["OrderBook"] = None
-    _lock: Lock = Lock()  # Thread-safe singleton initialization
+    _lock: Lock = Lock()  # Thread-safe default initialization
+    _local = local()  # Instances activated per thread
 
     def __init__(self):
-        if OrderBook._instance is not None:
-            raise Exception(
-                "OrderBook is a singleton. Use get_instance() to access."
-            )
         self.logger = SystemLogger.get_logger()
         self._book: Dict[int, RecordMsg] = {}
         self._last_updated: int = 0
@@ -38,11 +37,45 @@ class OrderBook:
 
     @staticmethod
     def get_instance() -> "OrderBook":
+        """
+        Current order book, used by components created without one.
+
+        Kept for compatibility, engines inject their own `OrderBook` instead. Returns the
+        instance activated on the calling thread with `activate`, or else the process
+        default.
+
+        Returns:
+            OrderBook: The current instance.
+        """
+        stack = getattr(OrderBook._local, "stack", None)
+
+        if stack:
+            return stack[-1]
+
         with OrderBook._lock:
             if OrderBook._instance is None:
                 OrderBook._instance = OrderBook()
         return OrderBook._instance
 
+    @contextmanager
+    def activate(self) -> Iterator["OrderBook"]:
+        """
+        Make this instance the current order book of the calling thread.
+
+        Components created inside the block without one use this instance.
+
+        Yields:
+            OrderBook: This instance.
+        """
+        if not hasattr(OrderBook._local, "stack"):
+            OrderBook._local.stack = []
+
+        OrderBook._local.stack.append(self)
+        try:
+            yield self
+        finally:
+            OrderBook._local.stack.pop()
+
     # Read methods (thread-safe)
     def retrieve(self, instrument_id: int) -> RecordMsg:
         """
@@ -100,16 +133,24 @@ class OrderBookManager(CoreAdapter):
     for retrieving market data.
     """
 
-    def __init__(self, symbols_map: SymbolMap, bus: MessageBus, mode: Mode):
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        mode: Mode,
+        order_book: Optional[OrderBook] = None,
+    ):
         """
         Initializes the OrderBook with a symbol map and prepares internal state.
 
         Args:
             symbol_map (SymbolMap): Mapping of instrument IDs to `Symbol` objects.
+            order_book (Optional[OrderBook]): Order book to update, the process default
+                if None.
         """
         super().__init__(symbols_map, bus)
         self.mode = mode
-        self.book = OrderBook.get_instance()
+        self.book = order_book or OrderBook.get_instance()
 
         # Subscribe to events
         self.data_queue = self.bus.subscribe(EventType.DATA)
@@ -129,6 +170,8 @@ class OrderBookManager(CoreAdapter):
                 item = self.data_queue.get(timeout=0.01)
                 if RecordMsg.is_record(item):
                     self.handle_record(item)
+                elif isinstance(item, list):
+                    self.handle_batch(item)
                 elif isinstance(item, EODEvent):
                     self.handle_eod(item)
             except queue.Empty:
@@ -142,6 +185,8 @@ class OrderBookManager(CoreAdapter):
                 item = self.data_queue.get(timeout=1)
                 if RecordMsg.is_record(item):
                     self.handle_record(item)
+                elif isinstance(item, list):
+                    self.handle_batch(item)
                 elif isinstance(item, EODEvent):
                     self.handle_eod(item)
             except queue.Empty:
@@ -153,13 +198,74 @@ class OrderBookManager(CoreAdapter):
     def handle_eod(self, event: EODEvent) -> None:
         self.logger.debug(event)
         self.bus.publish(EventType.EOD, True)
+        self.bus.wait_for_flag(EventType.EOD, False)
+        self.bus.publish(EventType.EOD_PROCESSED, True)
 
-        while self.bus.get_flag(EventType.EOD):
-            continue
+    def handle_batch(self, records: List[RecordMsg]) -> None:
+        """
+        Processes a batch of records published by a historical adaptor in order.
 
-        self.bus.publish(EventType.EOD_PROCESSED, True)
+        In backtests the batch is split into runs of records sharing a timestamp,
+        each handled by `handle_slice`, so the equity is marked once per timestamp
+        rather than once per record.
+
+        Args:
+            records (List[RecordMsg]): Records to apply to the order book.
+        """
+        if self.mode != Mode.BACKTEST:
+            for record in records:
+                self.handle_record(record)
+            return
+
+        start = 0
+
+        for i in range(1, len(records) + 1):
+            if (
+                i == len(records)
+                or records[i].ts_event != records[start].ts_event
+            ):
+                self.handle_slice(records[start:i])
+                start = i
+
+    def handle_slice(self, records: List[RecordMsg]) -> None:
+        """
+        Processes records sharing a timestamp in a backtest.
+
+        Every record is applied to the order book before the equity is marked,
+        then each is passed to the strategy in order, so the strategy sees the
+        book as of the timestamp for every instrument.
+
+        Args:
+            records (List[RecordMsg]): Records with the same `ts_event`.
+        """
+        for record in records:
+            self.update_book(record)
+
+        self.await_equity_updated()
+
+        for record in records:
+            market_event = MarketEvent(record.ts_event, record)
+            self.await_market_data_processed(market_event)
 
     def handle_record(self, record: RecordMsg) -> None:
+        self.update_book(record)
+
+        # Put market event in the event queue
+        market_event = MarketEvent(record.ts_event, record)
+
+        if self.mode == Mode.BACKTEST:
+            self.await_equity_updated()
+            self.await_market_data_processed(market_event)
+        else:
+            self.bus.publish(EventType.ORDER_BOOK, market_event)
+
+    def update_book(self, record: RecordMsg) -> None:
+        """
+        Applies a record to the order book, rolling over first if it is flagged.
+
+        Args:
+            record (RecordMsg): The market data record.
+        """
         if self.mode == Mode.BACKTEST:
             if record.rollover_flag == 1:
                 self.handle_rollover(record)
@@ -167,19 +273,10 @@ class OrderBookManager(CoreAdapter):
         # Update the order book with the new market data
         self.book._update(record)
 
-        # Put market event in the event queue
-        market_event = MarketEvent(record.ts_event, record)
-
         # Check inital data loaded
         if not self.book.tickers_loaded:
             self.book._tickers_loaded = self.check_tickers_loaded()
 
-        if self.mode == Mode.BACKTEST:
-            self.await_equity_updated()
-            self.await_market_data_processed(market_event)
-        else:
-            self.bus.publish(EventType.ORDER_BOOK, market_event)
-
     def handle_rollover(self, record: RecordMsg) -> None:
         id = record.hd.instrument_id
         symbol = self.symbols_map.get_symbol_by_id(id)
@@ -222,12 +319,15 @@ class OrderBookManager(CoreAdapter):
         self.bus.publish(EventType.OB_ROLLED, False)
         self.bus.publish(EventType.ROLLOVER, event)
 
-        while True:
-            if self.bus.get_flag(EventType.ROLLED_OVER):
-                break
-            elif self.bus.get_flag(EventType.ROLLOVER_EXITED):
-                self.book._update(event.entry_record)
-                self.bus.publish(EventType.OB_ROLLED, True)
+        flag = self.bus.wait_for_any(
+            {EventType.ROLLED_OVER: True, EventType.ROLLOVER_EXITED: True}
+        )
+
+        # Position exited on the old contract, roll the book before re-entry
+        if flag == EventType.ROLLOVER_EXITED:
+            self.book._update(event.entry_record)
+            self.bus.publish(EventType.OB_ROLLED, True)
+            self.bus.wait_for_flag(EventType.ROLLED_OVER, True)
 
     def await_equity_updated(self):
         """
@@ -235,10 +335,7 @@ class OrderBookManager(CoreAdapter):
         should be updated to reflect these changes (would be done automatically live).
         """
         self.bus.publish(EventType.UPDATE_EQUITY, True)
-
-        while True:
-            if not self.bus.get_flag(EventType.UPDATE_EQUITY):
-                break
+        self.bus.wait_for_flag(EventType.UPDATE_EQUITY, False)
 
     def await_market_data_processed(self, event: MarketEvent):
         """
@@ -248,7 +345,4 @@ class OrderBookManager(CoreAdapter):
         """
         self.bus.publish(EventType.UPDATE_SYSTEM, True)
         self.bus.publish(EventType.ORDER_BOOK, event)
-
-        while True:
-            if not self.bus.get_flag(EventType.UPDATE_SYSTEM):
-                break
+        self.bus.wait_for_flag(EventType.UPDATE_SYSTEM, False)
@@ -1,5 +1,5 @@
 import queue
-from typing import List
+from typing import List, Optional
 
 from midastrader.structs.symbol import SymbolMap
 from midastrader.structs.events import SignalEvent, OrderEvent
@@ -20,18 +20,28 @@ class OrderExecutionManager(CoreAdapter):
     are validated against existing active orders and positions before executing any trades.
     """
 
-    def __init__(self, symbols_map: SymbolMap, bus: MessageBus):
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        order_book: Optional[OrderBook] = None,
+        portfolio_server: Optional[PortfolioServer] = None,
+    ):
         """
         Initializes the OrderExecutionManager with required components.
 
         Args:
             symbols_map (SymbolMap): Mapping of symbol strings to `Symbol` objects.
-            order_book (OrderBook): The order book reference for price lookups.
-            portfolio_server (PortfolioServer): The portfolio server managing positions and account details.
+            order_book (Optional[OrderBook]): The order book reference for price lookups, the
+                process default if None.
+            portfolio_server (Optional[PortfolioServer]): The portfolio server managing positions
+                and account details, the process default if None.
         """
         super().__init__(symbols_map, bus)
-        self.order_book = OrderBook.get_instance()
-        self.portfolio_server = PortfolioServer.get_instance()
+        self.order_book = order_book or OrderBook.get_instance()
+        self.portfolio_server = (
+            portfolio_server or PortfolioServer.get_instance()
+        )
 
         # Subcriptions
         self.signal_queue = self.bus.subscribe(EventType.SIGNAL)
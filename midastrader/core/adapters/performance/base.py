@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import Dict, Optional
+import copy
 import mbinary
 import math
 import queue
 import threading
 import pandas as pd
+from dataclasses import dataclass
 from datetime import datetime
 from mbinary import BacktestData, PRICE_SCALE
 from midas_client.client import DatabaseClient
@@ -11,7 +13,7 @@ from midas_client.client import DatabaseClient
 from midastrader.structs.symbol import SymbolMap
 from midastrader.config import Parameters, Mode
 from midastrader.core.adapters.base_strategy import BaseStrategy
-from midastrader.utils.unix import unix_to_iso
+from midastrader.utils.unix import unix_to_datetime
 from midastrader.message_bus import MessageBus, EventType
 from midastrader.structs.events import TradeCommissionEvent, TradeEvent
 from midastrader.core.adapters.base import CoreAdapter
@@ -21,6 +23,8 @@ from .managers import (
     TradeManager,
     SignalManager,
 )
+from .export import OutputFormat, write_results
+from .pipeline import ResultsPipeline, SaveHandle
 
 
 def replace_nan_inf_in_dict(d: dict) -> None:
@@ -47,9 +51,29 @@ def _convert_timestamp(df: pd.DataFrame, column: str = "ts_event") -> None:
         df (pd.DataFrame): The DataFrame containing the timestamp column.
         column (str): The name of the timestamp column to convert. Defaults to "ts_event".
     """
-    df[column] = pd.to_datetime(df[column].map(lambda x: unix_to_iso(x)))
-    df[column] = df[column].dt.tz_convert("America/New_York")
-    df[column] = df[column].dt.tz_localize(None)
+    df[column] = unix_to_datetime(
+        df[column], "America/New_York"
+    ).dt.tz_localize(None)
+
+
+@dataclass
+class ResultsSnapshot:
+    """
+    Data a backtest is saved from, captured when saving starts.
+
+    Attributes:
+        params (Parameters): Parameters of the strategy.
+        trade_manager (TradeManager): Recorded trades.
+        equity_manager (EquityManager): Recorded equity.
+        signal_manager (SignalManager): Recorded signals.
+        strategy_data (pd.DataFrame): Strategy-specific data, empty without a strategy.
+    """
+
+    params: Parameters
+    trade_manager: TradeManager
+    equity_manager: EquityManager
+    signal_manager: SignalManager
+    strategy_data: pd.DataFrame
 
 
 class PerformanceManager(CoreAdapter):
@@ -68,6 +92,10 @@ class PerformanceManager(CoreAdapter):
         params: Parameters,
         mode: Mode,
         output_dir: str,
+        output_format: OutputFormat = OutputFormat.XLSX,
+        excel_summary: bool = False,
+        pipeline: Optional[ResultsPipeline] = None,
+        upload_results: bool = True,
     ) -> None:
         """
         Initializes the PerformanceManager with necessary components.
@@ -76,6 +104,13 @@ class PerformanceManager(CoreAdapter):
             database (DatabaseClient): Client for database operations related to performance data.
             params (Parameters): Configuration parameters for performance tracking.
             symbols_map (SymbolMap): Mapping of instrument symbols to `Symbol` objects.
+            output_format (OutputFormat): File format of exported results. Defaults to `XLSX`.
+            excel_summary (bool): Also write the parameters and static statistics to Excel
+                when exporting in another format. Defaults to False.
+            pipeline (Optional[ResultsPipeline]): Pipeline saving backtest results in the
+                background. Defaults to None, saving them before `save` returns.
+            upload_results (bool): Upload backtest results to the database after
+                exporting them. Defaults to True.
         """
         super().__init__(symbols_map, bus)
         self.trade_manager = TradeManager()
@@ -86,13 +121,19 @@ class PerformanceManager(CoreAdapter):
         self.params = params
         self.mode = mode
         self.output_dir = output_dir
+        self.output_format = output_format
+        self.excel_summary = excel_summary
+        self.pipeline = pipeline
+        self.upload_results = upload_results
+        self.save_handle: Optional[SaveHandle] = None
+        self.static_stats: dict = {}
         self._strategy: Optional[BaseStrategy] = None
         self.threads = []
 
         # Subscribe to events
-        self.account_queue = self.bus.subscribe(EventType.ACCOUNT_UPDATE_LOG)
+        self.account_queue = self.bus.subscribe(EventType.ACCOUNT_UPDATE)
         self.equity_queue = self.bus.subscribe(EventType.EQUITY_UPDATE)
-        self.signal_queue = self.bus.subscribe(EventType.SIGNAL_UPDATE)
+        self.signal_queue = self.bus.subscribe(EventType.SIGNAL)
         self.trade_queue = self.bus.subscribe(EventType.TRADE_UPDATE)
         self.trade_commission_queue = self.bus.subscribe(
             EventType.TRADE_COMMISSION_UPDATE
@@ -175,15 +216,35 @@ class PerformanceManager(CoreAdapter):
         Continuously processes market data events in a loop.
 
         This function runs as the main loop for the `OrderBook` to handle
-        incoming market data messages from the `MessageBus`.
+        incoming market data messages from the `MessageBus`. In live mode the
+        running statistics are logged after every update.
         """
         while not self.shutdown_event.is_set():
             try:
                 item = self.equity_queue.get(timeout=0.01)
                 self.equity_manager.update_equity(item)
+
+                if self.mode == Mode.LIVE:
+                    self.log_running_statistics()
             except queue.Empty:
                 continue
 
+    def log_running_statistics(self) -> None:
+        """
+        Logs the equity statistics as of the latest update and keeps them in `static_stats`.
+
+        Nothing is logged before the first equity update.
+        """
+        try:
+            stats = self.equity_manager.running_statistics(
+                self.params.risk_free_rate
+            )
+        except ValueError:
+            return
+
+        self.static_stats = stats
+        self.logger.info(f"Running statistics: {stats}")
+
     def process_signal(self) -> None:
         """
         Continuously processes market data events in a loop.
@@ -198,76 +259,139 @@ class PerformanceManager(CoreAdapter):
             except queue.Empty:
                 continue
 
-    def export_results(self, static_stats: dict, output_path: str) -> None:
+    def snapshot(self, copy_data: bool = True) -> ResultsSnapshot:
+        """
+        Captures the data saved from a backtest.
+
+        Args:
+            copy_data (bool): Copy the managers' data, so the snapshot is not affected
+                by later updates. Defaults to True.
+
+        Returns:
+            ResultsSnapshot: The captured data.
+        """
+        strategy_data = pd.DataFrame()
+
+        if self._strategy:
+            strategy_data = self._strategy.get_strategy_data()
+
+        if not copy_data:
+            return ResultsSnapshot(
+                self.params,
+                self.trade_manager,
+                self.equity_manager,
+                self.signal_manager,
+                strategy_data,
+            )
+
+        return ResultsSnapshot(
+            copy.copy(self.params),
+            self.trade_manager.copy(),
+            self.equity_manager.copy(),
+            self.signal_manager.copy(),
+            strategy_data.copy(),
+        )
+
+    def results_tables(
+        self,
+        static_stats: dict,
+        snapshot: Optional[ResultsSnapshot] = None,
+    ) -> Dict[str, pd.DataFrame]:
         """
-        Exports performance results, including static statistics, trades, equity, and signals,
-        into an Excel workbook.
+        Builds the exported performance tables, including static statistics, trades,
+        equity, and signals.
 
         This method consolidates various performance metrics, including static statistics,
         aggregated trade data, equity statistics, signals, and strategy-specific data,
-        and writes them to separate sheets in an Excel file.
+        into separate DataFrames that no longer reference the managers' data.
 
         Args:
             static_stats (dict): A dictionary containing static performance statistics.
-            output_path (str): The file path where the Excel workbook will be saved.
+            snapshot (Optional[ResultsSnapshot]): Data the tables are built from. Defaults
+                to the managers' current data.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Tables keyed by name.
 
         Behavior:
-            - Static statistics are written to the "Static Stats" sheet.
+            - Static statistics are written to the "Static Stats" table.
             - Strategy parameters, trades, equity data (daily and period), and signals are exported.
             - Each dataset is converted into a structured DataFrame and timestamps are localized.
-            - The resulting Excel file contains multiple sheets with organized performance data.
         """
+        snapshot = snapshot or self.snapshot(copy_data=False)
+
         # Summary Stats
-        static_stats_df = pd.DataFrame([static_stats]).T
+        static_stats_df = pd.DataFrame([static_stats])
 
         # Parameters
-        params_df = pd.DataFrame(self.params.to_dict())
+        params_df = pd.DataFrame(snapshot.params.to_dict())
         params_df["tickers"] = ", ".join(params_df["tickers"])
         params_df = params_df.iloc[0:1]
 
         columns = ["start", "end"]
         for column in columns:
             _convert_timestamp(params_df, column)
-        params_df = params_df.T
 
         # Trades
-        trades_df = pd.DataFrame(self.trade_manager.trades.values())
+        trades_df = snapshot.trade_manager.trades.to_frame()
         _convert_timestamp(trades_df, "timestamp")
 
-        agg_trade_df = self.trade_manager._aggregate_trades()
+        agg_trade_df = snapshot.trade_manager._aggregate_trades()
         _convert_timestamp(agg_trade_df, "start_date")
         _convert_timestamp(agg_trade_df, "end_date")
 
         # Equity
-        period_df = self.equity_manager.period_stats.copy()
+        period_df = snapshot.equity_manager.period_stats.copy()
         _convert_timestamp(period_df, "timestamp")
 
-        daily_df = self.equity_manager.daily_stats.copy()
+        daily_df = snapshot.equity_manager.daily_stats.copy()
         _convert_timestamp(daily_df, "timestamp")
 
         # Signals
-        signals_df = self.signal_manager._flatten_trade_instructions()
+        signals_df = snapshot.signal_manager._flatten_trade_instructions()
         _convert_timestamp(signals_df, "timestamp")
 
         # Strategy
-        strategy_data = pd.DataFrame()  # ensure its defined
+        strategy_data = snapshot.strategy_data
+
+        if len(strategy_data) > 0:
+            _convert_timestamp(strategy_data, "timestamp")
+
+        return {
+            "Parameters": params_df,
+            "Static Stats": static_stats_df,
+            "Period Equity": period_df,
+            "Daily Equity": daily_df,
+            "Trades": trades_df,
+            "Agg Trades": agg_trade_df,
+            "Signals": signals_df,
+            "Strategy": strategy_data,
+        }
 
-        if self._strategy:
-            strategy_data = self._strategy.get_strategy_data()
-            if len(strategy_data) > 0:
-                _convert_timestamp(strategy_data, "timestamp")
-
-        with pd.ExcelWriter(
-            output_path + "output.xlsx", engine="xlsxwriter"
-        ) as writer:
-            params_df.to_excel(writer, sheet_name="Parameters")
-            static_stats_df.to_excel(writer, sheet_name="Static Stats")
-            period_df.to_excel(writer, index=False, sheet_name="Period Equity")
-            daily_df.to_excel(writer, index=False, sheet_name="Daily Equity")
-            trades_df.to_excel(writer, index=False, sheet_name="Trades")
-            agg_trade_df.to_excel(writer, index=False, sheet_name="Agg Trades")
-            signals_df.to_excel(writer, index=False, sheet_name="Signals")
-            strategy_data.to_excel(writer, index=False, sheet_name="Strategy")
+    def export_results(self, static_stats: dict, output_path: str) -> None:
+        """
+        Exports performance results in the configured output format.
+
+        Excel output is a single workbook with one sheet per table, other formats write
+        one file per table (see `write_results`).
+
+        Args:
+            static_stats (dict): A dictionary containing static performance statistics.
+            output_path (str): The path prefix the results are written under.
+        """
+        self._write_results(self.results_tables(static_stats), output_path)
+
+    def _write_results(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        output_path: str,
+    ) -> None:
+        write_results(
+            tables,
+            output_path,
+            self.output_format,
+            self.excel_summary,
+        )
 
     def save(self) -> None:
         """
@@ -280,11 +404,29 @@ class PerformanceManager(CoreAdapter):
             mode (Mode): The mode of the strategy (`Mode.LIVE` or `Mode.BACKTEST`).
             output_path (str, optional): The directory where the results will be saved. Defaults to an empty string.
 
+        With a results pipeline, a backtest is saved on its worker threads and `save`
+        returns immediately, leaving `save_handle` to wait on. The data is copied into a
+        snapshot before `save` returns, since other components, such as the strategy,
+        may still be running and updating it while the pipeline reads it.
+
         Raises:
             ValueError: If the mode is neither `LIVE` nor `BACKTEST`.
         """
         if self.mode == Mode.BACKTEST:
-            self._save_backtest(self.output_dir)
+            if self.pipeline:
+                snapshot = self.snapshot()
+                consumers = [
+                    lambda tables: self._write_results(tables, self.output_dir)
+                ]
+
+                if self.upload_results:
+                    consumers.append(lambda _: self._upload_backtest())
+
+                self.save_handle = self.pipeline.submit(
+                    lambda: self._prepare_backtest(snapshot), consumers
+                )
+            else:
+                self._save_backtest(self.output_dir)
         elif self.mode == Mode.LIVE:
             self._save_live()
 
@@ -376,7 +518,8 @@ class PerformanceManager(CoreAdapter):
             - Aggregates trade and equity statistics.
             - Exports performance data to an Excel file using `export_results`.
             - Creates a `BacktestData` object containing all backtest-related metrics and data.
-            - Saves the backtest to the database using the `create_backtest` method of the database client.
+            - Saves the backtest to the database using the `create_backtest` method of the database client,
+              unless `upload_results` is False.
             - Logs the result of the save operation.
 
         Args:
@@ -386,33 +529,57 @@ class PerformanceManager(CoreAdapter):
         Raises:
             RuntimeError: If the database save operation fails.
         """
+        tables = self._prepare_backtest()
+        self._write_results(tables, output_path)
+
+        if self.upload_results:
+            self._upload_backtest()
+
+    def _prepare_backtest(
+        self, snapshot: Optional[ResultsSnapshot] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Calculates the backtest statistics and builds everything saved from them.
+
+        Creates the `BacktestData` object uploaded by `_upload_backtest` and returns the
+        exported tables.
+
+        Args:
+            snapshot (Optional[ResultsSnapshot]): Data the backtest is saved from. Defaults
+                to the managers' current data.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Tables keyed by name, see `results_tables`.
+        """
+        snapshot = snapshot or self.snapshot(copy_data=False)
+
         # Aggregate trades and equity statistics
-        trade_stats = self.trade_manager.calculate_trade_statistics()
-        equity_stats = self.equity_manager.calculate_equity_statistics(
-            self.params.risk_free_rate
+        trade_stats = snapshot.trade_manager.calculate_trade_statistics()
+        equity_stats = snapshot.equity_manager.calculate_equity_statistics(
+            snapshot.params.risk_free_rate
         )
 
         # Summary stats
-        all_stats = {**trade_stats, **equity_stats}
-        static_stats = all_stats
-
-        # Export to Excel
-        self.export_results(static_stats, output_path)
+        static_stats = {**trade_stats, **equity_stats}
+        self.static_stats = static_stats
+        tables = self.results_tables(static_stats, snapshot)
 
         # Create Backtest Object
         self.backtest = BacktestData(
             metadata=mbinary.BacktestMetaData(
                 backtest_id=0,  # dummy value server will assign a unique id
                 backtest_name=self.generate_backtest_name(),
-                parameters=self.params.to_mbinary(),
+                parameters=snapshot.params.to_mbinary(),
                 static_stats=self.mbinary_static_stats(static_stats),
             ),
-            period_timeseries_stats=self.equity_manager.period_stats_mbinary,
-            daily_timeseries_stats=self.equity_manager.daily_stats_mbinary,
-            trades=self.trade_manager.to_mbinary(self.symbols_map),
-            signals=self.signal_manager.to_mbinary(self.symbols_map),
+            period_timeseries_stats=snapshot.equity_manager.period_stats_mbinary,
+            daily_timeseries_stats=snapshot.equity_manager.daily_stats_mbinary,
+            trades=snapshot.trade_manager.to_mbinary(self.symbols_map),
+            signals=snapshot.signal_manager.to_mbinary(self.symbols_map),
         )
-        # Save Backtest Object
+        return tables
+
+    def _upload_backtest(self) -> None:
         response = self.database.trading.create_backtest(self.backtest)
         self.logger.info(f"Backtest saved with response : {response}")
 
@@ -494,7 +661,7 @@ class PerformanceManager(CoreAdapter):
             - Converts account data into an `mbinary.AccountSummary` object using `mbinary_account_summary`.
             - Creates an `mbinary.LiveData` object containing session parameters, trades, signals, and account summary.
             - Saves the live session data to the database via the `create_live_session` method.
-            - Logs the results of the save operation.
+            - Logs the results of the save operation and the session's running statistics.
 
         Args:
             output_path (str, optional): The directory path where logs or additional outputs can be saved.
@@ -503,6 +670,8 @@ class PerformanceManager(CoreAdapter):
         Raises:
             RuntimeError: If the database save operation fails.
         """
+        self.log_running_statistics()
+
         # Create a dictionary of start and end account values
         combined_data = {
             **self.account_manager.account_log[0].to_dict(prefix="start_"),
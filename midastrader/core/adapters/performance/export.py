@@ -0,0 +1,153 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.feather as feather
+from enum import Enum
+from typing import Dict, Optional
+
+# Single-row tables written as transposed sheets in Excel
+SUMMARY_TABLES = ("Parameters", "Static Stats")
+
+
+class OutputFormat(Enum):
+    """
+    File format of exported backtest results.
+
+    Members:
+        XLSX: One Excel workbook with a sheet per table.
+        PARQUET: One Parquet file per table.
+        ARROW: One Arrow IPC (Feather v2) file per table.
+        CSV_GZ: One gzip-compressed CSV file per table.
+    """
+
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    CSV_GZ = "csv.gz"
+
+    @classmethod
+    def from_string(cls, format_str: str) -> "OutputFormat":
+        """Convert a string to an OutputFormat enum, ensuring case-insensitivity."""
+        try:
+            return cls(format_str.lower())
+        except ValueError:
+            raise ValueError(
+                f"Invalid output format: {format_str}. "
+                "Expected 'xlsx', 'parquet', 'arrow' or 'csv.gz'."
+            )
+
+
+def table_path(
+    output_path: str, name: str, output_format: OutputFormat
+) -> str:
+    """
+    Build the file path of an exported table.
+
+    Args:
+        output_path (str): Prefix the results are written under.
+        name (str): Table name, e.g. 'Period Equity'.
+        output_format (OutputFormat): Format of the file.
+
+    Returns:
+        str: The path, e.g. '<output_path>period_equity.parquet'.
+    """
+    slug = name.lower().replace(" ", "_")
+    return f"{output_path}{slug}.{output_format.value}"
+
+
+def write_excel(tables: Dict[str, pd.DataFrame], path: str) -> None:
+    """
+    Write tables to an Excel workbook, one sheet per table.
+
+    Summary tables are transposed so each field is a row.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tables keyed by sheet name.
+        path (str): Path of the workbook.
+    """
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        for name, df in tables.items():
+            if name in SUMMARY_TABLES:
+                df.T.to_excel(writer, sheet_name=name)
+            else:
+                df.to_excel(writer, index=False, sheet_name=name)
+
+
+def _to_text(value: object) -> Optional[str]:
+    try:
+        missing = bool(pd.isna(value))
+    except (TypeError, ValueError):  # Containers
+        missing = False
+
+    return None if missing else str(value)
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    # Mixed-type object columns (e.g. optional prices) are written as text,
+    # keeping missing values null
+    df = df.copy()
+
+    for column in df.select_dtypes("object"):
+        df[column] = df[column].map(_to_text)
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_table(
+    df: pd.DataFrame,
+    path: str,
+    output_format: OutputFormat,
+) -> None:
+    """
+    Write a table to a single columnar or CSV file.
+
+    Args:
+        df (pd.DataFrame): The table.
+        path (str): Path of the file.
+        output_format (OutputFormat): Format of the file, other than `XLSX`.
+
+    Raises:
+        ValueError: If `output_format` is `XLSX`.
+    """
+    if output_format == OutputFormat.PARQUET:
+        pq.write_table(_to_arrow(df), path)
+    elif output_format == OutputFormat.ARROW:
+        feather.write_feather(_to_arrow(df), path)
+    elif output_format == OutputFormat.CSV_GZ:
+        df.to_csv(path, index=False, compression="gzip")
+    else:
+        raise ValueError(f"{output_format} is not a single-table format.")
+
+
+def write_results(
+    tables: Dict[str, pd.DataFrame],
+    output_path: str,
+    output_format: OutputFormat = OutputFormat.XLSX,
+    excel_summary: bool = False,
+) -> None:
+    """
+    Write result tables in the requested format.
+
+    Excel output is a single 'output.xlsx' workbook. Other formats write one file per
+    table, skipping tables without columns, and optionally a 'summary.xlsx' workbook
+    with the summary tables.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tables keyed by name.
+        output_path (str): Prefix the files are written under.
+        output_format (OutputFormat): Format of the files. Defaults to `XLSX`.
+        excel_summary (bool): Also write the summary tables to Excel when using
+            another format. Defaults to False.
+    """
+    if output_format == OutputFormat.XLSX:
+        write_excel(tables, output_path + "output.xlsx")
+        return
+
+    for name, df in tables.items():
+        if len(df.columns) > 0:
+            path = table_path(output_path, name, output_format)
+            write_table(df, path, output_format)
+
+    if excel_summary:
+        summary = {name: tables[name] for name in SUMMARY_TABLES}
+        write_excel(summary, output_path + "summary.xlsx")
@@ -1,11 +1,11 @@
+import copy
 import mbinary
 import numpy as np
 import pandas as pd
 from typing import List, Dict
-from mbinary import PRICE_SCALE
+from mbinary import PRICE_SCALE, QUANTITY_SCALE
 from quant_analytics.backtest.metrics import Metrics
 
-from midastrader.structs.trade import Trade
 from midastrader.utils.unix import resample_timestamp
 from midastrader.structs.account import EquityDetails, Account
 from midastrader.structs.symbol import SymbolMap
@@ -15,6 +15,12 @@ from midastrader.structs.events import (
     TradeEvent,
     TradeCommissionEvent,
 )
+from midastrader.core.adapters.performance.store import (
+    EquityCurve,
+    TradeBlotter,
+    SignalLog,
+)
+from midastrader.core.adapters.performance.statistics import EquityStatistics
 
 
 class TradeManager:
@@ -31,11 +37,22 @@ class TradeManager:
             logger (SystemLogger): Logger for recording trade updates and calculations.
 
         Attributes:
-            trades (Dict[str, Trade]): A dictionary storing trades with their IDs as keys.
+            trades (TradeBlotter): Columnar store of trades keyed by trade ID.
             logger (SystemLogger): Logger for recording trade operations.
         """
         self.logger = SystemLogger.get_logger()
-        self.trades: Dict[str, Trade] = {}
+        self.trades = TradeBlotter()
+
+    def copy(self) -> "TradeManager":
+        """
+        Copies the manager, with trades independent of later updates to this one.
+
+        Returns:
+            TradeManager: The copy, sharing the logger.
+        """
+        manager = copy.copy(self)
+        manager.trades = copy.deepcopy(self.trades)
+        return manager
 
     def update_trades(self, event: TradeEvent) -> None:
         """
@@ -45,7 +62,7 @@ class TradeManager:
             trade_id (str): The unique identifier for the trade.
             trade_data (Trade): Trade object containing trade details.
         """
-        self.trades[event.trade_id] = event.trade
+        self.trades.append(event.trade_id, event.trade)
         trade_str = event.trade.pretty_print("  ")
         self.logger.debug(f"\nTrade Updated:\n{trade_str}\n")
 
@@ -60,8 +77,7 @@ class TradeManager:
         Raises:
             KeyError: If the trade ID does not exist in the trades dictionary.
         """
-        if event.trade_id in self.trades:
-            self.trades[event.trade_id].fees = event.commission
+        if self.trades.set_fees(event.trade_id, event.commission):
             self.logger.debug(f"Commission Updated : {event.trade_id}")
             trade_str = self.trades[event.trade_id].pretty_print("  ")
             self.logger.debug(f"\nTrade Updated:\n{trade_str}")
@@ -93,66 +109,54 @@ class TradeManager:
         if not self.trades:
             return pd.DataFrame()  # Return an empty DataFrame for consistency
 
-        df = pd.DataFrame(self.trades.values())
+        trades = self.trades.records
+        signal_ids, group = np.unique(trades["signal_id"], return_inverse=True)
+        group = group.ravel()
+        groups = len(signal_ids)
+        rows = np.arange(len(trades))
+
+        # First and last trade of each signal in insertion order
+        first = np.full(groups, len(trades))
+        last = np.full(groups, -1)
+        np.minimum.at(first, group, rows)
+        np.maximum.at(last, group, rows)
+
+        is_entry = np.isin(trades["action"], ["LONG", "SHORT"])
+        is_exit = np.isin(trades["action"], ["SELL", "COVER"])
+        is_rollover = trades["is_rollover"]
+        # Treat rollovers as exit cost for futures & options
+        is_derivative = np.isin(trades["security_type"], ["FUT", "OPT"])
+
+        def total(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            return np.bincount(
+                group,
+                weights=np.where(mask, values, 0.0),
+                minlength=groups,
+            )
 
-        # Group by trade_id to calculate aggregated values
-        aggregated = df.groupby("signal_id").agg(
+        aggregated = pd.DataFrame(
             {
-                "timestamp": ["first", "last"],
-                "trade_value": [
-                    (
-                        "entry_value",
-                        lambda x: x[
-                            df["action"].isin(["LONG", "SHORT"])
-                        ].sum(),
-                    ),
-                    (
-                        "exit_value",
-                        lambda x: x[
-                            df["action"].isin(["SELL", "COVER"])
-                        ].sum(),
-                    ),
-                ],
-                "trade_cost": [
-                    (
-                        "entry_cost",
-                        lambda x: x[
-                            (df["action"].isin(["LONG", "SHORT"]))
-                            & (~df["is_rollover"])
-                        ].sum(),
-                    ),
-                    (
-                        "exit_cost",
-                        # Treat rollovers as exit cost for futures & options
-                        lambda x: x[
-                            (
-                                (df["action"].isin(["SELL", "COVER"]))
-                                & (~df["is_rollover"])
-                            )
-                            | (
-                                (df["security_type"].isin(["FUT", "OPT"]))
-                                & df["is_rollover"]
-                            )
-                        ].sum(),
-                    ),
-                ],
-                "fees": "sum",
+                "signal_id": signal_ids,
+                "start_date": trades["timestamp"][first],
+                "end_date": trades["timestamp"][last],
+                "entry_value": total(trades["trade_value"], is_entry),
+                "exit_value": total(trades["trade_value"], is_exit),
+                "entry_cost": total(
+                    trades["trade_cost"],
+                    is_entry & ~is_rollover,
+                ),
+                "exit_cost": total(
+                    trades["trade_cost"],
+                    (is_exit & ~is_rollover) | (is_derivative & is_rollover),
+                ),
+                "fees": np.bincount(
+                    group,
+                    weights=trades["fees"],
+                    minlength=groups,
+                ),
             }
         )
 
-        aggregated = pd.DataFrame(aggregated)
-
-        # Simplify column names after aggregation
-        aggregated.columns = [
-            "start_date",
-            "end_date",
-            "entry_value",
-            "exit_value",
-            "entry_cost",
-            "exit_cost",
-            "fees",
-        ]
-
         # Calculate percentage gain/loss based on the entry value
         aggregated["gain/loss"] = (
             aggregated["exit_value"] + aggregated["entry_value"]
@@ -166,9 +170,6 @@ class TradeManager:
             "entry_cost"
         ].replace(0, np.nan)
 
-        # Reset index to make 'trade_id' a column again
-        aggregated.reset_index(inplace=True)
-
         return aggregated
 
     def calculate_trade_statistics(self) -> Dict[str, float]:
@@ -216,13 +217,52 @@ class TradeManager:
         Returns:
             List[mbinary.Trades]: A list of trades in MBN format.
         """
-        mbinary_trades = []
+        trades = self.trades.records
+        tickers = {
+            instrument: symbols_map.map[instrument].midas_ticker
+            for instrument in np.unique(trades["instrument"]).tolist()
+        }
 
-        for i in self.trades.values():
-            ticker = symbols_map.map[i.instrument].midas_ticker
-            mbinary_trades.append(i.to_mbinary(ticker))
+        def scaled(column: str) -> list:
+            return (trades[column] * PRICE_SCALE).astype(np.int64).tolist()
 
-        return mbinary_trades
+        return [
+            mbinary.Trades(
+                trade_id=trade_id,
+                signal_id=signal_id,
+                timestamp=timestamp,
+                ticker=tickers[instrument],
+                quantity=quantity,
+                avg_price=avg_price,
+                trade_value=trade_value,
+                trade_cost=trade_cost,
+                action=action,
+                fees=fees,
+            )
+            for (
+                trade_id,
+                signal_id,
+                timestamp,
+                instrument,
+                quantity,
+                avg_price,
+                trade_value,
+                trade_cost,
+                action,
+                fees,
+            ) in zip(
+                trades["trade_id"].tolist(),
+                trades["signal_id"].tolist(),
+                trades["timestamp"].tolist(),
+                trades["instrument"].tolist(),
+                scaled("quantity"),
+                scaled("avg_price"),
+                scaled("trade_value"),
+                scaled("trade_cost"),
+                trades["action"].tolist(),
+                scaled("fees"),
+            )
+        ]
 
     @property
     def trades_dict(self) -> List[dict]:
@@ -232,7 +272,8 @@ class TradeManager:
         Returns:
             List[dict]: List of trade details in dictionary format.
         """
-        return [trade.to_dict() for trade in self.trades.values()]
+        df = self.trades.to_frame().rename(columns={"instrument": "ticker"})
+        return df.to_dict(orient="records")
 
     @staticmethod
     def total_trades(trades_pnl: np.ndarray) -> int:
@@ -438,9 +479,11 @@ class EquityManager:
     drawdowns, and generation of performance statistics.
 
     Attributes:
-        equity_value (List[EquityDetails]): List of equity details recorded during trading.
+        equity_curve (EquityCurve): Columnar store of the equity values recorded during trading,
+            one per timestamp.
         daily_stats (pd.DataFrame): DataFrame containing daily equity statistics.
         period_stats (pd.DataFrame): DataFrame containing period-specific equity statistics.
+        statistics (EquityStatistics): Running statistics updated with every equity update.
         logger (SystemLogger): Logger instance for logging equity updates and calculations.
     """
 
@@ -452,27 +495,69 @@ class EquityManager:
             logger (SystemLogger): Logger for recording equity updates and calculations.
         """
         self.logger = SystemLogger.get_logger()
-        self.equity_value: List[EquityDetails] = []
+        self.equity_curve = EquityCurve()
         self.daily_stats: pd.DataFrame = pd.DataFrame()
         self.period_stats: pd.DataFrame = pd.DataFrame()
+        self.statistics = EquityStatistics()
+
+    def copy(self) -> "EquityManager":
+        """
+        Copies the manager, with equity independent of later updates to this one.
+
+        Returns:
+            EquityManager: The copy, sharing the logger.
+        """
+        manager = copy.copy(self)
+        manager.equity_curve = copy.deepcopy(self.equity_curve)
+        manager.daily_stats = self.daily_stats.copy()
+        manager.period_stats = self.period_stats.copy()
+        manager.statistics = copy.deepcopy(self.statistics)
+        return manager
 
     def update_equity(self, equity_details: EquityDetails) -> None:
         """
         Updates the equity details and logs the update if not already recorded.
 
+        An update sharing the timestamp of the latest entry replaces its value, and an
+        update earlier than the latest entry is logged as an error and dropped.
+
         Args:
             equity_details (EquityDetails): The equity details to be logged.
         """
-        if not self.equity_value or equity_details != self.equity_value[-1]:
-            self.equity_value.append(equity_details)
-            self.logger.debug(
-                f"\nEQUITY UPDATED: \n  {self.equity_value[-1]}\n"
-            )
+        timestamp = equity_details["timestamp"]
+        equity_value = equity_details["equity_value"]
+
+        try:
+            appended = self.equity_curve.append(timestamp, equity_value)
+        except ValueError as e:
+            self.logger.error(f"Out-of-order equity update dropped: {e}")
+            return
+
+        if appended:
+            self.statistics.update(timestamp, equity_value)
+            self.logger.debug(f"\nEQUITY UPDATED: \n  {equity_details}\n")
         else:
             self.logger.debug(
                 f"Equity update already included ignoring: {equity_details}"
             )
 
+    def running_statistics(
+        self,
+        risk_free_rate: float = 0.04,
+    ) -> Dict[str, float]:
+        """
+        Returns the equity statistics as of the latest update without recomputing
+        them from the full equity curve.
+
+        Args:
+            risk_free_rate (float, optional): Risk-free rate for calculating Sharpe and Sortino ratios.
+                Defaults to 0.04.
+
+        Returns:
+            Dict[str, float]: The same statistics as `calculate_equity_statistics`.
+        """
+        return self.statistics.statistics(risk_free_rate)
+
     @property
     def period_stats_mbinary(self) -> List[mbinary.TimeseriesStats]:
         """
@@ -562,20 +647,6 @@ class EquityManager:
         data.fillna(0, inplace=True)
         return data
 
-    def _remove_intermediate_updates(self, data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Removes intermediate updates, retaining only the last equity value for each timestamp.
-
-        Args:
-            data (pd.DataFrame): DataFrame containing equity updates with timestamps.
-
-        Returns:
-            pd.DataFrame: DataFrame with only the last entry per timestamp.
-        """
-        # Group by the timestamp and keep the last entry for each group
-        data = data.groupby("timestamp").last()
-        return data
-
     def calculate_equity_statistics(
         self,
         risk_free_rate: float = 0.04,
@@ -591,11 +662,8 @@ class EquityManager:
             Dict[str, float]: A dictionary containing equity statistics such as net profit, total return,
                 standard deviation, drawdowns, and ratios.
         """
-        raw_equity_df = pd.DataFrame(self.equity_value)
-        raw_equity_df.set_index("timestamp", inplace=True)
-
-        # Remove intermediate updates before calculating returns/drawdowns
-        raw_equity_df = self._remove_intermediate_updates(raw_equity_df)
+        # The curve holds one entry per timestamp, so no intermediate updates
+        raw_equity_df = self.equity_curve.to_frame()
 
         # This is off
         daily_equity_curve = resample_timestamp(
@@ -612,7 +680,7 @@ class EquityManager:
         )
         self.daily_stats.reset_index(inplace=True)
 
-        raw_equity_curve = raw_equity_df["equity_value"].to_numpy()
+        raw_equity_curve = self.equity_curve.values
         daily_returns = self.daily_stats["period_return"].to_numpy()
         period_returns = self.period_stats["period_return"].to_numpy()
 
@@ -689,7 +757,7 @@ class SignalManager:
     processing and exporting signal-related data.
 
     Attributes:
-        signals (List[SignalEvent]): A list of recorded signal events.
+        signals (SignalLog): Columnar log of the recorded signals, one row per trade instruction.
         logger (SystemLogger): Logger instance for recording updates and logs.
     """
 
@@ -701,7 +769,18 @@ class SignalManager:
             logger (SystemLogger): Logger for recording signal updates.
         """
         self.logger = SystemLogger.get_logger()
-        self.signals: List[SignalEvent] = []
+        self.signals = SignalLog()
+
+    def copy(self) -> "SignalManager":
+        """
+        Copies the manager, with signals independent of later updates to this one.
+
+        Returns:
+            SignalManager: The copy, sharing the logger.
+        """
+        manager = copy.copy(self)
+        manager.signals = copy.deepcopy(self.signals)
+        return manager
 
     def update_signals(self, signal: SignalEvent) -> None:
         """
@@ -730,30 +809,31 @@ class SignalManager:
 
     def _flatten_trade_instructions(self) -> pd.DataFrame:
         """
-        Flattens the nested trade instructions from signal events into a tabular DataFrame format.
+        Builds a DataFrame of the recorded trade instructions, one row per instruction.
 
         Returns:
-            pd.DataFrame: A DataFrame containing individual trade instructions,
-                          expanded from the nested signal events.
+            pd.DataFrame: A DataFrame containing individual trade instructions with the
+                          timestamp of their signal.
         """
-        signals_dict = [signal.to_dict() for signal in self.signals]
+        instructions = self.signals.records
 
-        df = pd.DataFrame(signals_dict)
-        column = "instructions"
+        def price(column: str) -> np.ndarray:
+            prices = instructions[column]
+            return np.where(prices != 0, prices.astype(object), "")
 
-        # Expand the 'trade_instructions' column into separate rows
-        expanded_rows = []
-        for _, row in df.iterrows():
-            for instruction in row[column]:
-                new_row = row.to_dict()
-                new_row.update(instruction)
-                expanded_rows.append(new_row)
-        expanded_df = pd.DataFrame(expanded_rows)
-
-        # Drop the original nested column
-        if column in expanded_df.columns:
-            expanded_df = expanded_df.drop(columns=[column])
-        return expanded_df
+        return pd.DataFrame(
+            {
+                "timestamp": instructions["timestamp"],
+                "ticker": instructions["instrument"],
+                "order_type": instructions["order_type"].astype(object),
+                "action": instructions["action"].astype(object),
+                "signal_id": instructions["signal_id"],
+                "weight": instructions["weight"].round(4),
+                "quantity": instructions["quantity"],
+                "limit_price": price("limit_price"),
+                "aux_price": price("aux_price"),
+            }
+        )
 
     def to_mbinary(self, symbols_map: SymbolMap) -> List[mbinary.Signals]:
         """
@@ -765,4 +845,57 @@ class SignalManager:
         Returns:
             List[mbinary.Signals]: A list of signals converted into the `mbinary.Signals` format.
         """
-        return [signal.to_mbinary(symbols_map) for signal in self.signals]
+        instructions = self.signals.records
+        tickers = {
+            instrument: symbols_map.map[instrument].midas_ticker
+            for instrument in np.unique(instructions["instrument"]).tolist()
+        }
+
+        weights = (instructions["weight"] * PRICE_SCALE).astype(np.int64)
+        quantities = (instructions["quantity"] * QUANTITY_SCALE).astype(
+            np.int64
+        )
+
+        mbinary_instructions = [
+            mbinary.SignalInstructions(
+                ticker=tickers[instrument],
+                order_type=order_type,
+                action=action,
+                signal_id=signal_id,
+                weight=weight,
+                quantity=quantity,
+                limit_price=str(limit_price) if limit_price else "",
+                aux_price=str(aux_price) if aux_price else "",
+            )
+            for (
+                instrument,
+                order_type,
+                action,
+                signal_id,
+                weight,
+                quantity,
+                limit_price,
+                aux_price,
+            ) in zip(
+                instructions["instrument"].tolist(),
+                instructions["order_type"].tolist(),
+                instructions["action"].tolist(),
+                instructions["signal_id"].tolist(),
+                weights.tolist(),
+                quantities.tolist(),
+                instructions["limit_price"].tolist(),
+                instructions["aux_price"].tolist(),
+            )
+        ]
+
+        starts = self.signals.starts.tolist()
+        ends = starts[1:] + [len(instructions)]
+        timestamps = instructions["timestamp"].tolist()
+
+        return [
+            mbinary.Signals(
+                timestamp=timestamps[start],
+                trade_instructions=mbinary_instructions[start:end],
+            )
+            for start, end in zip(starts, ends)
+        ]
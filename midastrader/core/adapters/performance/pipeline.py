@@ -0,0 +1,157 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+
+class SaveHandle:
+    """
+    Tracks the completion of results submitted to a `ResultsPipeline`.
+
+    Attributes:
+        errors (List[BaseException]): Exceptions raised by the pipeline stages.
+    """
+
+    def __init__(self):
+        self.errors: List[BaseException] = []
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def _expect(self, count: int) -> None:
+        with self._lock:
+            self._pending = count
+
+            if count == 0:
+                self._done.set()
+
+    def _complete(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if error is not None:
+                self.errors.append(error)
+
+            self._pending -= 1
+
+            if self._pending <= 0:
+                self._done.set()
+
+    def done(self) -> bool:
+        """
+        Check if all stages have finished.
+
+        Returns:
+            bool: True once every stage has completed or failed.
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all stages have finished.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, indefinitely if None.
+
+        Returns:
+            bool: True if the results were saved, False if the timeout expired first.
+
+        Raises:
+            RuntimeError: If a stage failed.
+        """
+        if not self._done.wait(timeout):
+            return False
+
+        if self.errors:
+            raise RuntimeError(
+                f"Saving results failed: {self.errors[0]}"
+            ) from self.errors[0]
+
+        return True
+
+
+class ResultsPipeline:
+    """
+    Runs result saving on a pool of worker threads.
+
+    A submission is a compute stage, which builds everything the outputs need from a
+    finished run, followed by consumer stages such as file export and database upload
+    that run concurrently on its result. The caller gets a `SaveHandle` immediately
+    and can start the next run while the pool works.
+
+    Attributes:
+        executor (ThreadPoolExecutor): Pool running the stages.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_workers (int): Number of worker threads. Defaults to 4.
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="results",
+        )
+
+    def submit(
+        self,
+        compute: Callable[[], Any],
+        consumers: List[Callable[[Any], None]],
+    ) -> SaveHandle:
+        """
+        Schedule a compute stage and the consumers of its result.
+
+        Args:
+            compute (Callable[[], Any]): Builds the data to save.
+            consumers (List[Callable[[Any], None]]): Stages run concurrently with the
+                result of `compute`.
+
+        Returns:
+            SaveHandle: Handle to wait on the submission.
+        """
+        handle = SaveHandle()
+        future = self.executor.submit(compute)
+        future.add_done_callback(
+            lambda future: self._dispatch(future, consumers, handle)
+        )
+        return handle
+
+    def _dispatch(
+        self,
+        future: Future,
+        consumers: List[Callable[[Any], None]],
+        handle: SaveHandle,
+    ) -> None:
+        error = future.exception()
+
+        if error is not None:
+            handle._expect(1)
+            handle._complete(error)
+            return
+
+        result = future.result()
+        # Count every consumer before any can complete
+        handle._expect(len(consumers))
+
+        for consumer in consumers:
+            try:
+                future = self.executor.submit(consumer, result)
+            except RuntimeError as e:
+                # The pipeline was shut down while the compute stage ran
+                handle._complete(e)
+                continue
+
+            future.add_done_callback(
+                lambda future: handle._complete(future.exception())
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting submissions and release the worker threads.
+
+        Consumers of a compute stage still running are not scheduled, and fail the
+        handle of their submission.
+
+        Args:
+            wait (bool): Block until pending stages finish. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,280 @@
+import math
+from copy import copy
+from typing import Dict, Optional
+
+NS_PER_DAY = 86_400_000_000_000
+PERIODS_PER_YEAR = 252
+DECIMALS = 6
+
+
+class ReturnStatistics:
+    """
+    Running statistics over a stream of simple returns, updated in O(1) per return.
+
+    Mean and variance are maintained with Welford's algorithm, for all returns and for
+    the negative returns used by the Sortino ratio. The compounded growth of the stream
+    and its running peak give the drawdown without storing the return history.
+
+    Returns are rounded to the same precision as `Metrics.simple_returns`, so results
+    agree with the batch calculation in `EquityManager.calculate_equity_statistics`.
+
+    Attributes:
+        count (int): Number of returns pushed.
+        mean (float): Mean of the returns.
+        m2 (float): Sum of squared deviations from the mean.
+        downside_count (int): Number of negative returns pushed.
+        downside_mean (float): Mean of the negative returns.
+        downside_m2 (float): Sum of squared deviations of the negative returns.
+        growth (float): Compounded growth of the returns, product of (1 + r).
+        peak (float): Highest compounded growth reached.
+        max_drawdown (float): Lowest drawdown from the peak, as a negative decimal.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.downside_count = 0
+        self.downside_mean = 0.0
+        self.downside_m2 = 0.0
+        self.growth = 1.0
+        self.peak = 1.0
+        self.max_drawdown = 0.0
+
+    def push(self, value: float) -> None:
+        """
+        Add a return to the statistics.
+
+        Args:
+            value (float): Simple return of the period.
+        """
+        value = round(value, DECIMALS)
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if value < 0:
+            self.downside_count += 1
+            delta = value - self.downside_mean
+            self.downside_mean += delta / self.downside_count
+            self.downside_m2 += delta * (value - self.downside_mean)
+
+        self.growth *= 1 + value
+        self.peak = max(self.peak, self.growth)
+        drawdown = round((self.growth - self.peak) / self.peak, DECIMALS)
+        self.max_drawdown = min(self.max_drawdown, drawdown)
+
+    @property
+    def std(self) -> float:
+        """
+        Sample standard deviation of the returns, NaN with fewer than two returns.
+        """
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    @property
+    def downside_std(self) -> float:
+        """
+        Sample standard deviation of the negative returns, NaN with fewer than two.
+        """
+        if self.downside_count < 2:
+            return math.nan
+        return math.sqrt(self.downside_m2 / (self.downside_count - 1))
+
+    def annualized_return(self) -> float:
+        """
+        Compounded return scaled to a year of `PERIODS_PER_YEAR` periods.
+
+        Returns:
+            float: The annualized return.
+        """
+        if self.count == 0:
+            return 0.0
+        exponent = PERIODS_PER_YEAR / self.count
+        return round(self.growth**exponent - 1, DECIMALS)
+
+    def sharpe_ratio(self, risk_free_rate: float) -> float:
+        """
+        Annualized excess return per unit of annualized volatility.
+
+        Args:
+            risk_free_rate (float): Annual risk-free rate.
+
+        Returns:
+            float: The Sharpe ratio.
+        """
+        excess = self.mean * PERIODS_PER_YEAR - risk_free_rate
+        std = self.std * math.sqrt(PERIODS_PER_YEAR)
+        return round(excess / std, DECIMALS) if std else math.nan
+
+    def sortino_ratio(self, risk_free_rate: float) -> float:
+        """
+        Annualized excess return per unit of annualized downside volatility.
+
+        Args:
+            risk_free_rate (float): Annual risk-free rate.
+
+        Returns:
+            float: The Sortino ratio, 0.0 if there are no negative returns.
+        """
+        if self.downside_count == 0:
+            return 0.0
+
+        excess = self.mean * PERIODS_PER_YEAR - risk_free_rate
+        std = self.downside_std * math.sqrt(PERIODS_PER_YEAR)
+        return round(excess / std, DECIMALS) if std else math.nan
+
+
+class ReturnSeries:
+    """
+    Return statistics of an equity curve sampled by bucket, keeping the last value
+    of each bucket.
+
+    The latest bucket stays pending until a value arrives for a new bucket, so later
+    updates within it replace its value rather than adding returns. Queries fold the
+    pending value into a copy of the committed statistics.
+
+    Attributes:
+        stats (ReturnStatistics): Statistics of the committed buckets.
+        last_value (Optional[float]): Equity value of the last committed bucket.
+        bucket (Optional[int]): Key of the pending bucket.
+        value (Optional[float]): Equity value of the pending bucket.
+    """
+
+    def __init__(self):
+        self.stats = ReturnStatistics()
+        self.last_value: Optional[float] = None
+        self.bucket: Optional[int] = None
+        self.value: Optional[float] = None
+
+    def update(self, bucket: int, value: float) -> None:
+        """
+        Record the latest equity value of a bucket.
+
+        Args:
+            bucket (int): Bucket key, increasing over time.
+            value (float): Equity value.
+        """
+        if bucket != self.bucket and self.value is not None:
+            self._commit(self.stats, self.value)
+            self.last_value = self.value
+
+        self.bucket = bucket
+        self.value = value
+
+    def _commit(self, stats: ReturnStatistics, value: float) -> None:
+        if self.last_value is None:
+            # First bucket has no prior value, matching the batch placeholder
+            stats.push(0.0)
+        else:
+            stats.push((value - self.last_value) / self.last_value)
+
+    def snapshot(self) -> ReturnStatistics:
+        """
+        Statistics including the pending bucket.
+
+        Returns:
+            ReturnStatistics: A copy of the committed statistics with the pending
+                bucket's return added.
+        """
+        stats = copy(self.stats)
+
+        if self.value is not None:
+            self._commit(stats, self.value)
+
+        return stats
+
+
+class EquityStatistics:
+    """
+    Incrementally maintained performance statistics of an equity curve.
+
+    Each equity update is folded into per-update (period) and per-UTC-day (daily)
+    return series in constant time, so statistics can be read at any point during a
+    session without retaining the curve. Updates sharing a timestamp keep the last
+    value, as in `EquityCurve`.
+
+    Attributes:
+        period (ReturnSeries): Returns between consecutive timestamps.
+        daily (ReturnSeries): Returns between consecutive UTC daily closes.
+        beginning_equity (Optional[float]): Equity value of the first timestamp recorded.
+    """
+
+    def __init__(self):
+        self.period = ReturnSeries()
+        self.daily = ReturnSeries()
+        self.beginning_equity: Optional[float] = None
+
+    def update(self, timestamp: int, equity_value: float) -> None:
+        """
+        Add an equity update to the statistics.
+
+        Args:
+            timestamp (int): UNIX timestamp in nanoseconds.
+            equity_value (float): Equity value at the timestamp.
+        """
+        self.period.update(timestamp, equity_value)
+        self.daily.update(timestamp // NS_PER_DAY, equity_value)
+
+        # Follow the first timestamp's value until a later timestamp commits it
+        if self.period.last_value is None:
+            self.beginning_equity = equity_value
+
+    @property
+    def ending_equity(self) -> Optional[float]:
+        """
+        Most recent equity value recorded.
+        """
+        return self.period.value
+
+    def current_drawdown(self) -> float:
+        """
+        Drawdown of the latest equity value from the running peak.
+
+        Returns:
+            float: The drawdown as a negative decimal, 0.0 at a new high.
+        """
+        stats = self.period.snapshot()
+        return round((stats.growth - stats.peak) / stats.peak, DECIMALS)
+
+    def statistics(self, risk_free_rate: float = 0.04) -> Dict[str, float]:
+        """
+        Statistics of the equity curve recorded so far.
+
+        Args:
+            risk_free_rate (float, optional): Risk-free rate for calculating Sharpe and
+                Sortino ratios. Defaults to 0.04.
+
+        Returns:
+            Dict[str, float]: The statistics returned by
+                `EquityManager.calculate_equity_statistics`.
+
+        Raises:
+            ValueError: If no equity updates have been recorded.
+        """
+        if self.beginning_equity is None or self.ending_equity is None:
+            raise ValueError("No equity updates recorded.")
+
+        period = self.period.snapshot()
+        daily = self.daily.snapshot()
+        beginning = self.beginning_equity
+        ending = self.ending_equity
+
+        return {
+            "net_profit": round(ending - beginning, DECIMALS),
+            "beginning_equity": beginning,
+            "ending_equity": ending,
+            "total_return": round(ending / beginning - 1, DECIMALS),
+            "annualized_return": daily.annualized_return(),
+            "daily_standard_deviation_percentage": round(daily.std, DECIMALS),
+            "annual_standard_deviation_percentage": round(
+                daily.std * math.sqrt(PERIODS_PER_YEAR), DECIMALS
+            ),
+            "max_drawdown_percentage_period": period.max_drawdown,
+            "max_drawdown_percentage_daily": daily.max_drawdown,
+            "sharpe_ratio": daily.sharpe_ratio(risk_free_rate),
+            "sortino_ratio": daily.sortino_ratio(risk_free_rate),
+        }
@@ -0,0 +1,442 @@
+import numpy as np
+import pandas as pd
+from enum import Enum
+from typing import Dict, Iterator, Type
+
+from midastrader.structs.trade import Trade
+from midastrader.structs.orders import Action, OrderType
+from midastrader.structs.signal import SignalInstruction
+from midastrader.structs.symbol import SecurityType
+from midastrader.structs.account import EquityDetails
+from midastrader.structs.events import SignalEvent
+
+
+class EquityCurve:
+    """
+    Columnar store of equity updates backed by preallocated NumPy arrays.
+
+    Timestamps and values are written into int64 and float64 arrays that double in
+    size when full, so an update costs a couple of array writes instead of a dict.
+    Updates must arrive in timestamp order, earlier ones are rejected; an update for
+    the latest timestamp replaces its value, leaving one sorted entry per timestamp.
+
+    Attributes:
+        size (int): Number of timestamps stored.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty curve.
+
+        Args:
+            capacity (int): Number of entries to preallocate.
+
+        Raises:
+            ValueError: If `capacity` is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be at least 1.")
+
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> EquityDetails:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("EquityCurve index out of range.")
+
+        return EquityDetails(
+            timestamp=int(self._timestamps[index]),
+            equity_value=float(self._values[index]),
+        )
+
+    @property
+    def capacity(self) -> int:
+        """
+        Number of entries that fit before the arrays are grown.
+        """
+        return len(self._timestamps)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        Read-only view of the stored timestamps in nanoseconds.
+        """
+        view = self._timestamps[: self.size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the stored equity values.
+        """
+        view = self._values[: self.size]
+        view.flags.writeable = False
+        return view
+
+    def append(self, timestamp: int, equity_value: float) -> bool:
+        """
+        Record an equity value, replacing the latest one if the timestamp repeats.
+
+        Args:
+            timestamp (int): UNIX timestamp in nanoseconds.
+            equity_value (float): Equity value at the timestamp.
+
+        Returns:
+            bool: False if the update matches the latest entry and was ignored.
+
+        Raises:
+            ValueError: If the timestamp is earlier than the latest entry.
+        """
+        last = self.size - 1
+
+        if last >= 0 and timestamp < self._timestamps[last]:
+            raise ValueError(
+                f"Equity update at {timestamp} is earlier than the latest "
+                f"entry at {self._timestamps[last]}."
+            )
+
+        if last >= 0 and self._timestamps[last] == timestamp:
+            if self._values[last] == equity_value:
+                return False
+            self._values[last] = equity_value
+            return True
+
+        if self.size == self.capacity:
+            self._grow()
+
+        self._timestamps[self.size] = timestamp
+        self._values[self.size] = equity_value
+        self.size += 1
+        return True
+
+    def _grow(self) -> None:
+        capacity = self.capacity * 2
+        self._timestamps = np.resize(self._timestamps, capacity)
+        self._values = np.resize(self._values, capacity)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build a DataFrame of equity values indexed by timestamp.
+
+        Returns:
+            pd.DataFrame: Frame with an `equity_value` column and `timestamp` index.
+        """
+        return pd.DataFrame(
+            {"equity_value": self.values},
+            index=pd.Index(self.timestamps, name="timestamp"),
+        )
+
+
+def _enum_dtype(enum: Type[Enum]) -> str:
+    """
+    Unicode dtype wide enough for the longest string value of an enum.
+    """
+    return f"U{max(len(member.value) for member in enum)}"
+
+
+TRADE_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("trade_id", np.int64),
+        ("signal_id", np.int64),
+        ("instrument", np.int64),
+        ("security_type", _enum_dtype(SecurityType)),
+        ("quantity", np.float64),
+        ("avg_price", np.float64),
+        ("trade_value", np.float64),
+        ("trade_cost", np.float64),
+        ("action", _enum_dtype(Action)),
+        ("fees", np.float64),
+        ("is_rollover", np.bool_),
+    ]
+)
+
+
+class TradeBlotter:
+    """
+    Columnar store of trades backed by a growable NumPy structured array.
+
+    Each trade is one row, located through its trade id, so commissions are written
+    in place and aggregations run over whole columns. Security types and actions are
+    stored as strings sized to the longest enum value.
+
+    Attributes:
+        index (Dict[str, int]): Row of each trade keyed by trade id.
+        size (int): Number of trades stored.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty blotter.
+
+        Args:
+            capacity (int): Number of trades to preallocate.
+
+        Raises:
+            ValueError: If `capacity` is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be at least 1.")
+
+        self._records = np.zeros(capacity, dtype=TRADE_DTYPE)
+        self.index: Dict[str, int] = {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self.index
+
+    def __getitem__(self, trade_id: str) -> Trade:
+        return self._to_trade(self._records[self.index[trade_id]])
+
+    @property
+    def capacity(self) -> int:
+        """
+        Number of trades that fit before the array is grown.
+        """
+        return len(self._records)
+
+    @property
+    def records(self) -> np.ndarray:
+        """
+        Read-only view of the stored trades in insertion order.
+        """
+        view = self._records[: self.size]
+        view.flags.writeable = False
+        return view
+
+    def append(self, trade_id: str, trade: Trade) -> None:
+        """
+        Record a trade, replacing the row of an existing trade id.
+
+        Args:
+            trade_id (str): Unique identifier of the trade.
+            trade (Trade): The trade details.
+        """
+        row = self.index.get(trade_id)
+
+        if row is None:
+            if self.size == self.capacity:
+                self._records = np.resize(self._records, self.capacity * 2)
+            row = self.size
+            self.index[trade_id] = row
+            self.size += 1
+
+        self._records[row] = (
+            trade.timestamp,
+            trade.trade_id,
+            trade.signal_id,
+            trade.instrument,
+            trade.security_type.value,
+            trade.quantity,
+            trade.avg_price,
+            trade.trade_value,
+            trade.trade_cost,
+            trade.action,
+            trade.fees,
+            trade.is_rollover,
+        )
+
+    def set_fees(self, trade_id: str, fees: float) -> bool:
+        """
+        Overwrite the fees of a trade.
+
+        Args:
+            trade_id (str): Unique identifier of the trade.
+            fees (float): Fees incurred for the trade.
+
+        Returns:
+            bool: False if the trade id is unknown.
+        """
+        row = self.index.get(trade_id)
+
+        if row is None:
+            return False
+
+        self._records["fees"][row] = fees
+        return True
+
+    def values(self) -> Iterator[Trade]:
+        """
+        Iterate over the stored trades as `Trade` objects.
+
+        Returns:
+            Iterator[Trade]: Trades in insertion order.
+        """
+        return (self._to_trade(record) for record in self.records)
+
+    @staticmethod
+    def _to_trade(record: np.void) -> Trade:
+        return Trade(
+            timestamp=int(record["timestamp"]),
+            trade_id=int(record["trade_id"]),
+            signal_id=int(record["signal_id"]),
+            instrument=int(record["instrument"]),
+            security_type=SecurityType(str(record["security_type"])),
+            quantity=float(record["quantity"]),
+            avg_price=float(record["avg_price"]),
+            trade_value=float(record["trade_value"]),
+            trade_cost=float(record["trade_cost"]),
+            action=str(record["action"]),
+            fees=float(record["fees"]),
+            is_rollover=bool(record["is_rollover"]),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build a DataFrame with one column per trade field.
+
+        Returns:
+            pd.DataFrame: The stored trades in insertion order.
+        """
+        return pd.DataFrame(self.records)
+
+
+INSTRUCTION_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("instrument", np.int64),
+        ("order_type", _enum_dtype(OrderType)),
+        ("action", _enum_dtype(Action)),
+        ("signal_id", np.int64),
+        ("weight", np.float64),
+        ("quantity", np.float64),
+        ("limit_price", np.float64),
+        ("aux_price", np.float64),
+    ]
+)
+
+
+class SignalLog:
+    """
+    Columnar store of signals with one row per trade instruction.
+
+    Instructions are written into a growable NumPy structured array as signals
+    arrive, alongside the first row of each signal, so exports read flat columns
+    directly. Enums are stored as strings sized to their longest value and missing
+    prices as 0.0.
+
+    Attributes:
+        size (int): Number of instructions stored.
+        count (int): Number of signals stored.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty log.
+
+        Args:
+            capacity (int): Number of instructions and signals to preallocate.
+
+        Raises:
+            ValueError: If `capacity` is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be at least 1.")
+
+        self._records = np.zeros(capacity, dtype=INSTRUCTION_DTYPE)
+        self._starts = np.zeros(capacity, dtype=np.int64)
+        self.size = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> SignalEvent:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("SignalLog index out of range.")
+
+        start, end = self._bounds(index)
+        rows = self._records[start:end]
+        return SignalEvent(
+            int(rows["timestamp"][0]),
+            [self._to_instruction(row) for row in rows],
+        )
+
+    def __iter__(self) -> Iterator[SignalEvent]:
+        return (self[i] for i in range(self.count))
+
+    @property
+    def records(self) -> np.ndarray:
+        """
+        Read-only view of the stored instructions in arrival order.
+        """
+        view = self._records[: self.size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def starts(self) -> np.ndarray:
+        """
+        Read-only view of the first instruction row of each signal.
+        """
+        view = self._starts[: self.count]
+        view.flags.writeable = False
+        return view
+
+    def append(self, signal: SignalEvent) -> None:
+        """
+        Record the instructions of a signal.
+
+        Args:
+            signal (SignalEvent): The signal to record.
+        """
+        end = self.size + len(signal.instructions)
+
+        if end > len(self._records):
+            capacity = max(len(self._records) * 2, end)
+            self._records = np.resize(self._records, capacity)
+
+        if self.count == len(self._starts):
+            self._starts = np.resize(self._starts, self.count * 2)
+
+        self._records[self.size : end] = [
+            (
+                signal.timestamp,
+                instruction.instrument,
+                instruction.order_type.value,
+                instruction.action.value,
+                instruction.signal_id,
+                instruction.weight,
+                instruction.quantity,
+                instruction.limit_price or 0.0,
+                instruction.aux_price or 0.0,
+            )
+            for instruction in signal.instructions
+        ]
+        self._starts[self.count] = self.size
+        self.size = end
+        self.count += 1
+
+    def _bounds(self, index: int) -> tuple:
+        start = int(self._starts[index])
+        end = (
+            int(self._starts[index + 1])
+            if index + 1 < self.count
+            else self.size
+        )
+        return start, end
+
+    @staticmethod
+    def _to_instruction(record: np.void) -> SignalInstruction:
+        return SignalInstruction(
+            instrument=int(record["instrument"]),
+            order_type=OrderType(str(record["order_type"])),
+            action=Action(str(record["action"])),
+            signal_id=int(record["signal_id"]),
+            weight=float(record["weight"]),
+            quantity=float(record["quantity"]),
+            limit_price=float(record["limit_price"]),
+            aux_price=float(record["aux_price"]),
+        )
@@ -2,8 +2,9 @@ import queue
 import time
 import threading
 from typing import Dict
-from threading import Lock
-from typing import Optional
+from threading import Lock, local
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from midastrader.structs.account import Account
 from midastrader.structs.positions import Position
@@ -22,6 +23,7 @@ class PortfolioServer:
     The `PortfolioServer` class acts as both a subject and an observer, handling updates to the portfolio
     and notifying observers of any changes. It integrates with position, order, and account managers to
     ensure accurate state management and provides utility methods for accessing portfolio details.
+    Each engine creates its own instance and passes it to its components.
 
     Attributes:
         logger (SystemLogger): Logger instance for recording system events.
@@ -32,7 +34,8 @@ class PortfolioServer:
     """
 
     _instance: Optional["PortfolioServer"] = None
-    _lock: Lock = Lock()  # For thread-safe singleton initialization
+    _lock: Lock = Lock()  # For thread-safe default initialization
+    _local = local()  # Instances activated per thread
 
     def __init__(self):
         """
@@ -41,10 +44,6 @@ class PortfolioServer:
         Parameters:
             symbols_map (SymbolMap): Mapping of symbol strings to `Symbol` objects for instruments.
         """
-        if PortfolioServer._instance is not None:
-            raise Exception(
-                "PortfolioServer is a singleton. Use get_instance() to access."
-            )
         self.logger = SystemLogger.get_logger()
         self.order_manager = OrderManager()
         self.position_manager = PositionManager()
@@ -53,11 +52,45 @@ class PortfolioServer:
 
     @staticmethod
     def get_instance() -> "PortfolioServer":
+        """
+        Current portfolio server, used by components created without one.
+
+        Kept for compatibility, engines inject their own `PortfolioServer` instead. Returns the
+        instance activated on the calling thread with `activate`, or else the process
+        default.
+
+        Returns:
+            PortfolioServer: The current instance.
+        """
+        stack = getattr(PortfolioServer._local, "stack", None)
+
+        if stack:
+            return stack[-1]
+
         with PortfolioServer._lock:
             if PortfolioServer._instance is None:
                 PortfolioServer._instance = PortfolioServer()
         return PortfolioServer._instance
 
+    @contextmanager
+    def activate(self) -> Iterator["PortfolioServer"]:
+        """
+        Make this instance the current portfolio server of the calling thread.
+
+        Components created inside the block without one use this instance.
+
+        Yields:
+            PortfolioServer: This instance.
+        """
+        if not hasattr(PortfolioServer._local, "stack"):
+            PortfolioServer._local.stack = []
+
+        PortfolioServer._local.stack.append(self)
+        try:
+            yield self
+        finally:
+            PortfolioServer._local.stack.pop()
+
     @property
     def capital(self) -> float:
         """
@@ -121,9 +154,23 @@ class PortfolioServerManager(CoreAdapter):
     controlled and consistent.
     """
 
-    def __init__(self, symbols_map: SymbolMap, bus: MessageBus):
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        portfolio_server: Optional[PortfolioServer] = None,
+    ):
+        """
+        Initializes the manager.
+
+        Args:
+            symbols_map (SymbolMap): Mapping of symbol strings to `Symbol` objects.
+            bus (MessageBus): Bus the portfolio updates are received from.
+            portfolio_server (Optional[PortfolioServer]): Portfolio server to update, the
+                process default if None.
+        """
         super().__init__(symbols_map, bus)
-        self.server = PortfolioServer.get_instance()
+        self.server = portfolio_server or PortfolioServer.get_instance()
         self.threads = []
 
         # Subscribe to events
@@ -1,13 +1,18 @@
 import threading
+from typing import Optional
 
 from midastrader.config import Parameters, Mode
 from midastrader.structs.symbol import SymbolMap
 from midastrader.utils.logger import SystemLogger
 from midastrader.message_bus import MessageBus
+from midastrader.core.adapters.performance.export import OutputFormat
+from midastrader.core.adapters.performance.pipeline import ResultsPipeline
 from midastrader.core.adapters import (
     BaseStrategy,
+    OrderBook,
     OrderExecutionManager,
     OrderBookManager,
+    PortfolioServer,
     PortfolioServerManager,
     PerformanceManager,
 )
@@ -21,6 +26,12 @@ class CoreEngine:
         mode: Mode,
         params: Parameters,
         output_dir: str,
+        output_format: OutputFormat = OutputFormat.XLSX,
+        excel_summary: bool = False,
+        pipeline: Optional[ResultsPipeline] = None,
+        order_book: Optional[OrderBook] = None,
+        portfolio_server: Optional[PortfolioServer] = None,
+        upload_results: bool = True,
     ):
         self.logger = SystemLogger.get_logger()
         self.mode = mode
@@ -28,6 +39,14 @@ class CoreEngine:
         self.message_bus = message_bus
         self.symbols_map = symbols_map
         self.output_dir = output_dir
+        self.output_format = output_format
+        self.excel_summary = excel_summary
+        self.pipeline = pipeline
+        self.upload_results = upload_results
+        self.order_book = order_book or OrderBook.get_instance()
+        self.portfolio_server = (
+            portfolio_server or PortfolioServer.get_instance()
+        )
         self.adapters = {}
 
         self.porfolio_manager = None
@@ -55,16 +74,20 @@ class CoreEngine:
             self.symbols_map,
             self.message_bus,
             self.mode,
+            self.order_book,
         )
 
         self.adapters["portfolio_server"] = PortfolioServerManager(
             self.symbols_map,
             self.message_bus,
+            self.portfolio_server,
         )
 
         self.adapters["order_manager"] = OrderExecutionManager(
             self.symbols_map,
             self.message_bus,
+            self.order_book,
+            self.portfolio_server,
         )
 
         self.adapters["performance_manager"] = PerformanceManager(
@@ -73,6 +96,10 @@ class CoreEngine:
             self.params,
             self.mode,
             self.output_dir,
+            self.output_format,
+            self.excel_summary,
+            self.pipeline,
+            self.upload_results,
         )
 
         return self
@@ -98,10 +125,16 @@ class CoreEngine:
         Load and initialize the trading strategy.
 
         Attaches the strategy to key components such as the order book, order manager, and performance manager.
+        The strategy is pointed at this engine's order book and portfolio server.
+
+        Raises:
+            TypeError: If the strategy is not a `BaseStrategy`.
         """
         if not isinstance(strategy, BaseStrategy):
             raise TypeError("Strategy must be an instance of BaseStrategy")
 
+        strategy.order_book = self.order_book
+        strategy.portfolio_server = self.portfolio_server
         self.adapters["strategy"] = strategy
         self.adapters["performance_manager"].set_strategy(strategy)
 
@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from mbinary import BufferStore
+from typing import IO, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from midastrader.config import Parameters
+from midastrader.utils.unix import iso_to_unix
+from midastrader.utils.logger import SystemLogger
+from midastrader.data.adaptors.historical.reader import MappedDataFile
+
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+DEFAULT_MAX_SIZE = 10 * 1024**3  # 10 GiB
+
+
+class HistoricalCache:
+    """
+    On-disk cache of historical data retrieved from the database.
+
+    Each retrieval is stored as an mbinary file named by the hash of its request, and
+    recorded in an index shared by every process using the directory. Requests for the
+    same tickers, schema, dataset and stype are served from any cached range covering
+    them, so a January to December retrieval also serves a March to June backtest.
+    Once the cached files exceed `max_size` bytes, the least recently used are evicted.
+    A file that cannot be removed, such as one another process still has mapped on
+    Windows, stays in the index and is evicted later.
+
+    Ranges are half-open, a request from `start` to `end` holds the records with
+    `start <= ts_event < end`.
+
+    Attributes:
+        directory (str): Directory holding the cached files and their index.
+        max_size (int): Maximum total size of the cached files in bytes.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Args:
+            directory (str): Directory holding the cached files and their index.
+            max_size (int): Maximum total size of the cached files in bytes.
+
+        Raises:
+            ValueError: If `max_size` is not positive.
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be a positive integer.")
+
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def group_key(parameters: Parameters) -> str:
+        """
+        Hash of the request fields other than its time range.
+
+        Args:
+            parameters (Parameters): Parameters of the request.
+
+        Returns:
+            str: Hex digest identifying the tickers, schema, dataset and stype.
+        """
+        fields = [
+            sorted(parameters.tickers),
+            parameters.schema.value,
+            parameters.dataset.value,
+            parameters.stype.value,
+        ]
+        encoded = json.dumps(fields, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, parameters: Parameters) -> Optional[BufferStore]:
+        """
+        Load the data of a request from the cache.
+
+        Args:
+            parameters (Parameters): Parameters of the request.
+
+        Returns:
+            Optional[BufferStore]: The records in the requested range, or None on a miss.
+        """
+        group = self.group_key(parameters)
+        start = iso_to_unix(parameters.start)
+        end = iso_to_unix(parameters.end)
+
+        with self._index() as entries:
+            covering = [
+                e
+                for e in entries
+                if e["group"] == group
+                and e["start"] <= start
+                and e["end"] >= end
+                and os.path.exists(self._path(e))
+            ]
+
+            if not covering:
+                return None
+
+            entry = min(covering, key=lambda e: e["size"])
+            entry["last_used"] = time.time()
+
+        try:
+            data = MappedDataFile(self._path(entry))
+        except FileNotFoundError:
+            # Evicted by another process once the index was unlocked
+            return None
+
+        try:
+            if entry["start"] == start and entry["end"] == end:
+                return data.buffer(data.header_size, data.size)
+
+            first = data.find_offset(start)
+            last = data.find_offset(end, first)
+            return data.buffer(first, last)
+        finally:
+            data.close()
+
+    def put(self, parameters: Parameters, data: BufferStore) -> None:
+        """
+        Store the data of a request, then evict files beyond the size limit.
+
+        Cached ranges of the same group covered by the new one are dropped.
+
+        Args:
+            parameters (Parameters): Parameters of the request.
+            data (BufferStore): The records retrieved for the request.
+        """
+        group = self.group_key(parameters)
+        start = iso_to_unix(parameters.start)
+        end = iso_to_unix(parameters.end)
+        name = hashlib.sha256(f"{group}:{start}:{end}".encode()).hexdigest()
+        entry = {
+            "group": group,
+            "start": start,
+            "end": end,
+            "file": f"{name}.bin",
+        }
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            data.write_to_file(tmp)
+            os.replace(tmp, self._path(entry))
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+        entry["size"] = os.path.getsize(self._path(entry))
+        entry["last_used"] = time.time()
+
+        with self._index() as entries:
+            kept = [
+                e
+                for e in entries
+                if e["file"] != entry["file"]
+                and not (
+                    e["group"] == group
+                    and e["start"] >= start
+                    and e["end"] <= end
+                )
+            ]
+            kept += self._remove([e for e in entries if e not in kept], entry)
+            kept.append(entry)
+            entries[:] = kept
+            self._evict(entries, entry)
+
+    def _evict(self, entries: List[dict], keep: dict) -> None:
+        total = sum(e["size"] for e in entries)
+
+        for e in sorted(entries, key=lambda e: e["last_used"]):
+            if total <= self.max_size:
+                break
+
+            if e is keep or self._remove([e], keep):
+                continue
+
+            total -= e["size"]
+            entries.remove(e)
+
+    def _remove(self, entries: List[dict], keep: dict) -> List[dict]:
+        # Returns the entries whose files could not be removed
+        failed = []
+
+        for e in entries:
+            if e["file"] == keep["file"]:
+                continue
+
+            try:
+                os.remove(self._path(e))
+            except FileNotFoundError:
+                pass
+            except OSError as error:
+                SystemLogger.get_logger().warning(
+                    f"Cached file {e['file']} left for a later eviction: {error}"
+                )
+                failed.append(e)
+
+        return failed
+
+    def _path(self, entry: dict) -> str:
+        return os.path.join(self.directory, entry["file"])
+
+    @contextmanager
+    def _index(self) -> Iterator[List[dict]]:
+        # Entries are read and rewritten under an exclusive lock shared by processes
+        with _locked(os.path.join(self.directory, LOCK_FILE)):
+            path = os.path.join(self.directory, INDEX_FILE)
+
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                entries = []
+
+            yield entries
+
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+
+            os.replace(tmp, path)
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[IO[str]]:
+    # Exclusive lock on a file, with flock on POSIX and msvcrt on Windows
+    with open(path, "w") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            yield f
+            return
+
+        # LK_LOCK gives up with OSError after 10 attempts a second apart
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+
+        try:
+            yield f
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -1,16 +1,99 @@
 import threading
+from dataclasses import replace
 from mbinary import BufferStore, RecordMsg
 from midas_client.client import DatabaseClient
 from midas_client.historical import RetrieveParams
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
 
-from midastrader.utils.unix import unix_to_iso
+from midastrader.utils.unix import iso_to_unix, unix_to_iso
+from midastrader.utils.session import session_calendar
 from midastrader.structs.events import EODEvent
 from midastrader.structs.symbol import SymbolMap
 from midastrader.config import Parameters, Mode
 from midastrader.data.adaptors.base import DataAdapter
+from midastrader.data.adaptors.historical.reader import MappedDataFile
+from midastrader.data.adaptors.historical.cache import HistoricalCache
+from midastrader.data.adaptors.historical.index import TimeIndex
+from midastrader.data.adaptors.historical.stream import (
+    ChunkedRecords,
+    chunk_ranges,
+)
+from midastrader.data.adaptors.historical.merge import (
+    MergedRecords,
+    expand_data_files,
+)
 from midastrader.message_bus import MessageBus, EventType
 
+# Data files mapped once and replayed by every later run in the process
+_shared_files: Dict[str, MappedDataFile] = {}
+
+
+def share_data_files(paths: List[str]) -> None:
+    """
+    Memory-maps data files once for every later run in this process.
+
+    `load_data_file` then hands each run a view of the shared mapping instead of
+    opening and parsing the file again. Used to initialize the worker processes of
+    sweeps and walk-forward studies, which run many backtests on the same data.
+
+    Args:
+        paths (List[str]): Paths to the mbinary data files.
+    """
+    for path in paths:
+        if path not in _shared_files:
+            _shared_files[path] = MappedDataFile(
+                path, index=TimeIndex.for_file(path)
+            )
+
+
+def load_data_file(
+    path: str, memory_map: bool = False
+) -> Union[BufferStore, MappedDataFile]:
+    """
+    Loads a data file, either read into memory or memory-mapped.
+
+    A memory-mapped file is decoded lazily as it is replayed, so loading is
+    independent of the file size and processes replaying the same file share it
+    through the page cache. A file with a time index next to it is always
+    memory-mapped, so replay can seek through the index. A file shared with
+    `share_data_files` is replayed from a view of its mapping.
+
+    Args:
+        path (str): Path to the mbinary data file.
+        memory_map (bool): Memory-map the file instead of reading it. Defaults to False.
+
+    Returns:
+        Union[BufferStore, MappedDataFile]: A buffer over the records in the file.
+    """
+    if path in _shared_files:
+        return _shared_files[path].view()
+
+    index = TimeIndex.for_file(path)
+
+    if memory_map or index is not None:
+        return MappedDataFile(path, index=index)
+
+    return BufferStore.from_file(path)
+
+
+def load_data_files(
+    paths: List[str], memory_map: bool = False
+) -> Union[BufferStore, MappedDataFile, MergedRecords]:
+    """
+    Loads one or more data files, merging several into a single stream ordered by time.
+
+    Args:
+        paths (List[str]): Paths to the mbinary data files.
+        memory_map (bool): Memory-map the files instead of reading them. Defaults to False.
+
+    Returns:
+        Union[BufferStore, MappedDataFile, MergedRecords]: A buffer over the records in the files.
+    """
+    if len(paths) == 1:
+        return load_data_file(paths[0], memory_map)
+
+    return MergedRecords([load_data_file(path, memory_map) for path in paths])
+
 
 class HistoricalAdaptor(DataAdapter):
     """
@@ -23,11 +106,24 @@ class HistoricalAdaptor(DataAdapter):
     Attributes:
         database_client (DatabaseClient): A client class based on a Django Rest-Framework API for interacting with the database.
         symbols_map (SymbolMap): Maps symbols to unique identifiers for instruments.
-        data (BufferStore): A buffer storing historical market data.
+        data_files (List[str]): Data files named by the `data_file` path, glob or list, replayed merged by time.
+        data (Union[BufferStore, MappedDataFile, ChunkedRecords, MergedRecords]): A buffer storing historical market data.
         last_ts (Optional[int]): The timestamp of the last processed record.
         next_date (Optional[datetime.date]): The next date for processing data.
         current_date (Optional[datetime.date]): The current trading date being processed.
         eod_triggered (bool): Flag indicating if the end-of-day event has been triggered for the current date.
+        batch_size (int): Records replayed and published to the bus per call of `data_stream`, 1 by
+            default. Above 1, backtests apply all records sharing a timestamp to the order book before
+            marking equity and passing them to the strategy, which can change fills and equity
+            when several instruments share a timestamp, see `OrderBookManager.handle_slice`.
+        id_map (Dict[int, int]): Maps source instrument ids in the data to system instrument ids.
+        memory_map (bool): Memory-map the data file instead of reading it into memory.
+        cache (Optional[HistoricalCache]): On-disk cache of data retrieved from the database, set by `cache_dir`.
+        chunk_days (int): Retrieve data from the database in slices of this many days while replaying, 0 to retrieve it at once.
+        restrict_window (bool): Replay data files only from the strategy's `start` to its `end`, instead of over their whole range.
+        restrict_symbols (bool): Skip instruments in the data that are not in the symbols map, instead of raising.
+        window (Optional[Tuple[int, int]]): Start and end in nanoseconds of the replayed records, None for all.
+        exhausted (bool): Set once replay has reached the end of the data, so the buffer is not read again.
     """
 
     def __init__(self, symbols_map: SymbolMap, bus: MessageBus, **kwargs):
@@ -40,13 +136,37 @@ class HistoricalAdaptor(DataAdapter):
         """
         super().__init__(symbols_map, bus)
         self.data_file = kwargs["data_file"]
+        self.data_files = expand_data_files(self.data_file)
+        self.batch_size = int(kwargs.get("batch_size", 1))
+        self.memory_map = bool(kwargs.get("memory_map", False))
+        self.chunk_days = int(kwargs.get("chunk_days", 0))
+        self.restrict_window = bool(kwargs.get("restrict_window", False))
+        self.restrict_symbols = bool(kwargs.get("restrict_symbols", False))
+        self.window: Optional[Tuple[int, int]] = None
         self.database_client = DatabaseClient()
-        self.data: BufferStore
+        self.cache: Optional[HistoricalCache] = None
+        self.data: Union[
+            BufferStore, MappedDataFile, ChunkedRecords, MergedRecords
+        ]
         self.mode: Mode
         self.last_ts = None
         self.next_date = None
         self.current_date = None
         self.eod_triggered = False
+        self.exhausted = False
+        self.id_map: Dict[int, int] = {}
+
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        if self.chunk_days < 0:
+            raise ValueError("chunk_days must be a non-negative integer.")
+
+        if kwargs.get("cache_dir"):
+            self.cache = HistoricalCache(
+                kwargs["cache_dir"],
+                int(kwargs.get("cache_size_mb", 10240)) * 1024**2,
+            )
 
         self.eod_event = threading.Event()  # Thread-safe synchronization
 
@@ -69,6 +189,12 @@ class HistoricalAdaptor(DataAdapter):
         Main processing loop that streams data and handles EOD synchronization.
         """
         self.logger.info("HistoricalAdaptor shutting down ...")
+
+        if isinstance(
+            getattr(self, "data", None), (ChunkedRecords, MergedRecords)
+        ):
+            self.data.close()
+
         self.is_shutdown.set()
 
     def set_mode(self, mode: Mode) -> None:
@@ -90,28 +216,212 @@ class HistoricalAdaptor(DataAdapter):
 
         Returns:
             bool: True if data retrieval is successful.
+
+        Raises:
+            RuntimeError: If an instrument in the data has no matching symbol.
         """
-        if self.data_file:
-            data = BufferStore.from_file(self.data_file)
+        if self.data_files:
+            data = load_data_files(self.data_files, self.memory_map)
             metadata = data.metadata
             self.logger.info(metadata)
-            parameters.start = unix_to_iso(metadata.start)
-            parameters.end = unix_to_iso(metadata.end)
+
+            if self.restrict_window:
+                self.window = (
+                    iso_to_unix(parameters.start),
+                    iso_to_unix(parameters.end),
+                )
+            else:
+                parameters.start = unix_to_iso(metadata.start)
+                parameters.end = unix_to_iso(metadata.end)
+
             parameters.schema = metadata.schema
-        else:
-            params = RetrieveParams(
-                parameters.tickers,
-                parameters.start,
-                parameters.end,
-                parameters.schema,
-                parameters.dataset,
-                parameters.stype,
+        elif self.chunk_days:
+            data = ChunkedRecords(
+                lambda start, end: self.load_records(
+                    replace(parameters, start=start, end=end)
+                ),
+                chunk_ranges(
+                    parameters.start, parameters.end, self.chunk_days
+                ),
             )
-            data = self.database_client.historical.get_records(params)
+        else:
+            data = self.load_records(parameters)
 
         self.data = data
+        self.exhausted = False
+        self.id_map = self.build_id_map(
+            data.metadata.mappings.map, self.restrict_symbols
+        )
+        self.restrict_data()
         return True
 
+    def restrict_data(self) -> None:
+        """
+        Pushes the replay window and the mapped instruments down to the data reader.
+
+        Readers supporting it skip the records outside them without decoding them;
+        `next_record` drops any that remain.
+        """
+        if not hasattr(self.data, "restrict"):
+            return
+
+        if self.window is None and not self.restrict_symbols:
+            return
+
+        start, end = self.window if self.window else (None, None)
+        ids = self.id_map.keys() if self.restrict_symbols else None
+        self.data.restrict(start, end, ids)
+
+    def load_records(self, parameters: Parameters) -> BufferStore:
+        """
+        Loads the records of the requested range from the cache, or else the database.
+
+        Args:
+            parameters (Parameters): Tickers, range, schema, dataset and stype of the request.
+
+        Returns:
+            BufferStore: A buffer over the records.
+        """
+        data = self.cache.get(parameters) if self.cache else None
+
+        if data is None:
+            data = self.fetch_records(parameters)
+
+            if self.cache:
+                self.cache.put(parameters, data)
+
+        return data
+
+    def fetch_records(self, parameters: Parameters) -> BufferStore:
+        """
+        Retrieves the records of the requested range from the database.
+
+        Args:
+            parameters (Parameters): Tickers, range, schema, dataset and stype of the request.
+
+        Returns:
+            BufferStore: A buffer over the retrieved records.
+        """
+        params = RetrieveParams(
+            parameters.tickers,
+            parameters.start,
+            parameters.end,
+            parameters.schema,
+            parameters.dataset,
+            parameters.stype,
+        )
+        return self.database_client.historical.get_records(params)
+
+    def build_id_map(
+        self, mappings: Dict[int, str], skip_missing: bool = False
+    ) -> Dict[int, int]:
+        """
+        Builds the source-id to system-id table used to remap every replayed record.
+
+        All instruments in the data are validated before the run starts, so an
+        unmapped instrument fails fast instead of mid-stream.
+
+        Args:
+            mappings (Dict[int, str]): Source instrument ids mapped to tickers, from the data metadata.
+            skip_missing (bool): Leave out tickers with no matching symbol instead of raising. Defaults to False.
+
+        Returns:
+            Dict[int, int]: Source instrument ids mapped to system instrument ids.
+
+        Raises:
+            RuntimeError: If a ticker in the mappings has no matching symbol.
+        """
+        id_map = {}
+        missing = []
+
+        for id, ticker in mappings.items():
+            symbol = self.symbols_map.get_symbol(ticker)
+
+            if not symbol:
+                missing.append(ticker)
+                continue
+
+            id_map[id] = symbol.instrument_id
+
+        if missing and not skip_missing:
+            raise RuntimeError(
+                f"Tickers in data not found in symbols map: {missing}"
+            )
+
+        return id_map
+
+    def next_record(self) -> Optional[RecordMsg]:
+        """
+        Replays the next record in the data buffer with its instrument id mapped to the system id.
+
+        Records outside the replay window, or of unmapped instruments when
+        `restrict_symbols` is set, are skipped. Once the data is exhausted the
+        buffer is no longer replayed.
+
+        Returns:
+            Optional[RecordMsg]: The next record, or None if no more records are available.
+        """
+        while not self.exhausted:
+            record = self.data.replay()
+
+            if record is None:
+                break
+
+            if self.window is not None:
+                if record.ts_event >= self.window[1]:
+                    break
+                if record.ts_event < self.window[0]:
+                    continue
+
+            # Adjust instrument id
+            new_id = self.id_map.get(record.hd.instrument_id)
+
+            # Chunks only map the instruments they contain
+            if new_id is None and isinstance(self.data, ChunkedRecords):
+                self.id_map.update(
+                    self.build_id_map(
+                        self.data.metadata.mappings.map,
+                        self.restrict_symbols,
+                    )
+                )
+                new_id = self.id_map.get(record.hd.instrument_id)
+
+            if new_id is None:
+                if self.restrict_symbols:
+                    continue
+                raise RuntimeError(
+                    "Record instrument_id not found in mappings."
+                )
+
+            record.instrument_id = new_id
+
+            return record
+
+        self.exhausted = True
+        return None
+
+    def next_batch(self, size: int) -> List[RecordMsg]:
+        """
+        Replays up to `size` records from the data buffer.
+
+        Args:
+            size (int): Maximum number of records to replay.
+
+        Returns:
+            List[RecordMsg]: The replayed records, empty if no more records are available.
+        """
+        batch = []
+
+        for _ in range(size):
+            record = self.next_record()
+
+            if record is None:
+                break
+
+            batch.append(record)
+
+        return batch
+
     def data_stream(self) -> bool:
         """
         Simulates streaming of market data by processing the next record in the data buffer.
@@ -119,22 +429,14 @@ class HistoricalAdaptor(DataAdapter):
         Returns:
             bool: True if a record was processed, False if no more records are available.
         """
-        record = self.data.replay()
+        if self.batch_size > 1:
+            return self.batch_stream()
+
+        record = self.next_record()
 
         if record is None:
             return False
 
-        # Adjust instrument id
-        id = record.hd.instrument_id
-        ticker = self.data.metadata.mappings.get_ticker(id)
-        symbol = self.symbols_map.get_symbol(ticker)
-
-        if not symbol:
-            raise RuntimeError("Record instrument_id not found in mappings.")
-
-        new_id = symbol.instrument_id
-        record.instrument_id = new_id
-
         if self.mode == Mode.BACKTEST:
             self._check_eod(record)
 
@@ -143,6 +445,39 @@ class HistoricalAdaptor(DataAdapter):
 
         return True
 
+    def batch_stream(self) -> bool:
+        """
+        Streams the next `batch_size` records as a single list message on the bus.
+
+        In backtests the batch is split at the end of the trading day, so the
+        records before the close are published and processed ahead of the
+        end-of-day event and the rest follow once it has been handled.
+
+        Returns:
+            bool: True if records were processed, False if no more records are available.
+        """
+        batch = self.next_batch(self.batch_size)
+
+        if not batch:
+            return False
+
+        start = 0
+
+        if self.mode == Mode.BACKTEST:
+            for i, record in enumerate(batch):
+                if self.eod_reached(record):
+                    if i > start:
+                        self.bus.publish(EventType.DATA, batch[start:i])
+                    self._publish_eod()
+                    start = i
+
+        if start:
+            batch = batch[start:]
+
+        self.bus.publish(EventType.DATA, batch)
+
+        return True
+
     def _check_eod(self, record: RecordMsg) -> None:
         """
         Checks if the current record marks the end of a trading day and triggers the end-of-day event if necessary.
@@ -150,10 +485,30 @@ class HistoricalAdaptor(DataAdapter):
         Args:
             record (RecordMsg): The current record being processed.
         """
-        ts = datetime.fromisoformat(
-            unix_to_iso(record.ts_event, tz_info="America/New_York")
+        if self.eod_reached(record):
+            self._publish_eod()
+
+    def _publish_eod(self) -> None:
+        """
+        Publishes the end-of-day event for the current date and waits until it is processed.
+        """
+        self.bus.publish(
+            EventType.DATA,
+            EODEvent(timestamp=self.current_date),
         )
-        date = ts.date()
+        self._await_eod_processed()
+
+    def eod_reached(self, record: RecordMsg) -> bool:
+        """
+        Tracks the current trading date and determines if the record is the first after the day session close.
+
+        Args:
+            record (RecordMsg): The current record being processed.
+
+        Returns:
+            bool: True if the end-of-day event should be triggered before this record.
+        """
+        date = session_calendar.trading_date(record.ts_event)
 
         if not self.current_date or date > self.current_date:
             self.current_date = date
@@ -166,17 +521,12 @@ class HistoricalAdaptor(DataAdapter):
             record.ts_event
         ):
             self.eod_triggered = True
-            self.bus.publish(
-                EventType.DATA,
-                EODEvent(timestamp=self.current_date),
-            )
-            self._await_eod_processed()
+            return True
+        return False
 
     def _await_eod_processed(self):
         """
         Waits for the EOD_PROCESSED flag to be set.
         """
-        while True:
-            if self.bus.get_flag(EventType.EOD_PROCESSED):
-                self.bus.publish(EventType.EOD_PROCESSED, False)
-                break
+        self.bus.wait_for_flag(EventType.EOD_PROCESSED, True)
+        self.bus.publish(EventType.EOD_PROCESSED, False)
@@ -0,0 +1,320 @@
+import os
+import hashlib
+import numpy as np
+from datetime import date
+from typing import List, Optional
+
+from midastrader.data.adaptors.historical.reader import (
+    HEADER_SIZE,
+    MappedDataFile,
+)
+
+# Records between consecutive entries of the sparse index
+DEFAULT_EVERY = 1024
+NANOS_PER_DAY = 86_400 * 10**9
+EPOCH = date(1970, 1, 1)
+
+
+def sidecar_path(path: str) -> str:
+    """
+    Path of the time index of a data file, next to the file.
+
+    Args:
+        path (str): Path to the mbinary data file.
+
+    Returns:
+        str: The path of its index.
+    """
+    return f"{path}.idx"
+
+
+def fingerprint(path: str, last_offset: int) -> int:
+    """
+    Hash of the metadata header and the first and last record headers of a data file.
+
+    Args:
+        path (str): Path to the mbinary data file.
+        last_offset (int): Byte offset of the last record.
+
+    Returns:
+        int: The hash as a signed 64-bit integer.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+
+    with open(path, "rb") as f:
+        prefix = f.read(2)
+        length = int.from_bytes(prefix, "little")
+        digest.update(prefix)
+        digest.update(f.read(length + HEADER_SIZE))
+        f.seek(last_offset)
+        digest.update(f.read(HEADER_SIZE))
+
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+class TimeIndex:
+    """
+    Sparse index of a time-sorted mbinary data file, mapping timestamps to byte offsets.
+
+    Holds the timestamp and offset of every `every`-th record and the offset of the
+    first record of each UTC day. Seeking to a timestamp reads at most `every` record
+    headers past the nearest entry, whatever the record layout of the file.
+
+    The index is saved next to its data file, see `sidecar_path`. It records the size
+    and modification time of the file it was built from, and a `fingerprint` of its
+    metadata and first and last record headers, so a stale index is ignored even when
+    the file was rewritten with the same size.
+
+    Attributes:
+        timestamps (np.ndarray): `ts_event` of the indexed records.
+        offsets (np.ndarray): Byte offsets of the indexed records.
+        days (np.ndarray): UTC days since the epoch holding records.
+        day_offsets (np.ndarray): Byte offset of the first record of each day.
+        file_size (int): Size of the indexed data file in bytes.
+        every (int): Records between consecutive entries.
+        file_mtime (int): Modification time of the indexed data file in nanoseconds.
+        last_offset (int): Byte offset of the last record of the indexed data file.
+        fingerprint (int): `fingerprint` of the indexed data file.
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        offsets: np.ndarray,
+        days: np.ndarray,
+        day_offsets: np.ndarray,
+        file_size: int,
+        every: int,
+        file_mtime: int,
+        last_offset: int,
+        fingerprint: int,
+    ):
+        self.timestamps = timestamps
+        self.offsets = offsets
+        self.days = days
+        self.day_offsets = day_offsets
+        self.file_size = file_size
+        self.every = every
+        self.file_mtime = file_mtime
+        self.last_offset = last_offset
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(
+        cls, data: MappedDataFile, every: int = DEFAULT_EVERY
+    ) -> "TimeIndex":
+        """
+        Index a data file by reading its record headers.
+
+        Args:
+            data (MappedDataFile): The memory-mapped data file.
+            every (int): Records between consecutive entries.
+
+        Returns:
+            TimeIndex: The index of the file.
+
+        Raises:
+            ValueError: If `every` is not positive.
+        """
+        if every < 1:
+            raise ValueError("'every' must be a positive integer.")
+
+        timestamps: List[int] = []
+        offsets: List[int] = []
+        days: List[int] = []
+        day_offsets: List[int] = []
+        offset = data.header_size
+        last_offset = offset
+        count = 0
+
+        while offset < data.size:
+            ts = data.ts_event(offset)
+            day = ts // NANOS_PER_DAY
+
+            if count % every == 0:
+                timestamps.append(ts)
+                offsets.append(offset)
+
+            if not days or day > days[-1]:
+                days.append(day)
+                day_offsets.append(offset)
+
+            last_offset = offset
+            offset = data.record_end(offset)
+            count += 1
+
+        return cls(
+            np.array(timestamps, dtype=np.uint64),
+            np.array(offsets, dtype=np.int64),
+            np.array(days, dtype=np.int64),
+            np.array(day_offsets, dtype=np.int64),
+            data.size,
+            every,
+            os.stat(data.path).st_mtime_ns,
+            last_offset,
+            fingerprint(data.path, last_offset),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "TimeIndex":
+        """
+        Load an index saved with `save`.
+
+        Args:
+            path (str): Path of the index.
+
+        Returns:
+            TimeIndex: The loaded index.
+        """
+        with np.load(path) as arrays:
+            file_size, every, file_mtime, last_offset, fingerprint = (
+                int(value) for value in arrays["info"]
+            )
+            return cls(
+                arrays["timestamps"],
+                arrays["offsets"],
+                arrays["days"],
+                arrays["day_offsets"],
+                file_size,
+                every,
+                file_mtime,
+                last_offset,
+                fingerprint,
+            )
+
+    @classmethod
+    def for_file(cls, path: str) -> Optional["TimeIndex"]:
+        """
+        Load the index next to a data file, if it exists and matches the file.
+
+        Args:
+            path (str): Path to the mbinary data file.
+
+        Returns:
+            Optional[TimeIndex]: The index, or None if missing or stale.
+        """
+        index_path = sidecar_path(path)
+
+        if not os.path.exists(index_path):
+            return None
+
+        index = cls.load(index_path)
+        stat = os.stat(path)
+
+        if (
+            index.file_size != stat.st_size
+            or index.file_mtime != stat.st_mtime_ns
+            or index.fingerprint != fingerprint(path, index.last_offset)
+        ):
+            return None
+
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a file.
+
+        Args:
+            path (str): Path of the index.
+        """
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                timestamps=self.timestamps,
+                offsets=self.offsets,
+                days=self.days,
+                day_offsets=self.day_offsets,
+                info=np.array(
+                    [
+                        self.file_size,
+                        self.every,
+                        self.file_mtime,
+                        self.last_offset,
+                        self.fingerprint,
+                    ],
+                    dtype=np.int64,
+                ),
+            )
+
+    def offset_before(self, ts: int) -> Optional[int]:
+        """
+        Offset of the last indexed record earlier than a timestamp.
+
+        Records from this offset on include the first at or after `ts`.
+
+        Args:
+            ts (int): Timestamp in nanoseconds.
+
+        Returns:
+            Optional[int]: The offset, or None if no indexed record is earlier.
+        """
+        position = int(np.searchsorted(self.timestamps, ts, side="left")) - 1
+
+        if position < 0:
+            return None
+
+        return int(self.offsets[position])
+
+    def offset_at(self, ts: int) -> Optional[int]:
+        """
+        Exact offset of the first record at or after a timestamp, if the index holds it.
+
+        The per-day offsets hold it for timestamps at the start of a UTC day, such as
+        those of date-only `start` and `end` values.
+
+        Args:
+            ts (int): Timestamp in nanoseconds.
+
+        Returns:
+            Optional[int]: The offset, `file_size` if every record is earlier, or None
+                if `ts` is not at the start of a day.
+        """
+        if ts % NANOS_PER_DAY:
+            return None
+
+        position = int(np.searchsorted(self.days, ts // NANOS_PER_DAY))
+
+        if position == len(self.days):
+            return self.file_size
+
+        return int(self.day_offsets[position])
+
+    def day_offset(self, day: date) -> Optional[int]:
+        """
+        Offset of the first record of a UTC day.
+
+        Args:
+            day (date): The day.
+
+        Returns:
+            Optional[int]: The offset, or None if the file has no records on that day.
+        """
+        days = (day - EPOCH).days
+        position = int(np.searchsorted(self.days, days))
+
+        if position == len(self.days) or self.days[position] != days:
+            return None
+
+        return int(self.day_offsets[position])
+
+
+def index_data_file(path: str, every: int = DEFAULT_EVERY) -> TimeIndex:
+    """
+    Build the index of a data file and save it next to the file.
+
+    Args:
+        path (str): Path to the mbinary data file.
+        every (int): Records between consecutive entries.
+
+    Returns:
+        TimeIndex: The built index.
+    """
+    data = MappedDataFile(path)
+
+    try:
+        index = TimeIndex.build(data, every)
+    finally:
+        data.close()
+
+    index.save(sidecar_path(path))
+    return index
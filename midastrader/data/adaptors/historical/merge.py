@@ -0,0 +1,196 @@
+import glob
+import heapq
+from dataclasses import dataclass, field
+from mbinary import RecordMsg
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+
+def expand_data_files(data_file: Union[str, List[str]]) -> List[str]:
+    """
+    Expand the `data_file` setting into the paths it names.
+
+    Each entry is a path or a glob pattern, whose matches are sorted.
+
+    Args:
+        data_file (Union[str, List[str]]): A path or pattern, or a list of them. Empty for none.
+
+    Returns:
+        List[str]: The data file paths, in order.
+
+    Raises:
+        FileNotFoundError: If a pattern matches no files.
+    """
+    entries = [data_file] if isinstance(data_file, str) else list(data_file)
+    paths = []
+
+    for entry in entries:
+        if not entry:
+            continue
+
+        if not glob.has_magic(entry):
+            paths.append(entry)
+            continue
+
+        matches = sorted(glob.glob(entry))
+
+        if not matches:
+            raise FileNotFoundError(f"No data files match '{entry}'.")
+
+        paths.extend(matches)
+
+    return paths
+
+
+@dataclass
+class MergedMappings:
+    """
+    Instrument mappings of the merged sources.
+
+    Attributes:
+        map (Dict[int, str]): Source instrument ids mapped to tickers.
+    """
+
+    map: Dict[int, str] = field(default_factory=dict)
+
+
+@dataclass
+class MergedMetadata:
+    """
+    Metadata spanning the merged sources, mirroring the fields of mbinary's `Metadata`.
+
+    Attributes:
+        schema (Schema): Schema shared by the sources.
+        start (int): Earliest start of the sources in nanoseconds.
+        end (int): Latest end of the sources in nanoseconds.
+        mappings (MergedMappings): Union of the instrument mappings of the sources.
+    """
+
+    schema: Any
+    start: int
+    end: int
+    mappings: MergedMappings
+
+
+class MergedRecords:
+    """
+    Replays several time-sorted record sources as one stream ordered by `ts_event`.
+
+    Sources are merged with a heap holding the next record of each, so they are
+    streamed without being concatenated. Records with equal timestamps are replayed
+    in the order of their sources. Records are passed through unchanged, including
+    their rollover flags.
+
+    Provides the `metadata` and `replay` interface of `BufferStore`, so it can replace one
+    in `HistoricalAdaptor`.
+
+    Attributes:
+        sources (List): Buffers or readers providing `metadata` and `replay`.
+    """
+
+    def __init__(self, sources: List[Any]):
+        """
+        Merge the metadata of the sources and read their first records.
+
+        Args:
+            sources (List): Buffers or readers providing `metadata` and `replay`.
+
+        Raises:
+            ValueError: If there are no sources, their schemas differ or they map an id to different tickers.
+        """
+        if not sources:
+            raise ValueError("'sources' must contain at least one source.")
+
+        self.sources = sources
+        self._metadata = self._merge_metadata()
+        self._heap: List[Tuple[int, int, RecordMsg]] = []
+
+        for index in range(len(sources)):
+            self._advance(index)
+
+    @property
+    def metadata(self) -> MergedMetadata:
+        """
+        Metadata spanning the sources.
+        """
+        return self._metadata
+
+    def replay(self) -> Optional[RecordMsg]:
+        """
+        Return the earliest pending record across the sources.
+
+        Returns:
+            Optional[RecordMsg]: The next record, or None once every source is exhausted.
+        """
+        if not self._heap:
+            return None
+
+        _, index, record = heapq.heappop(self._heap)
+        self._advance(index)
+        return record
+
+    def restrict(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        instrument_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Restrict the sources that support it to a time window and a set of instruments.
+
+        Restricted sources restart from the first record of the window, others keep
+        their position.
+
+        Args:
+            start (Optional[int]): Earliest `ts_event` replayed in nanoseconds, None for no bound.
+            end (Optional[int]): Replay stops at the first `ts_event` at or after it, None for no bound.
+            instrument_ids (Optional[Iterable[int]]): Source instrument ids replayed, None for all.
+        """
+        ids = None if instrument_ids is None else set(instrument_ids)
+        restricted = set()
+
+        for index, source in enumerate(self.sources):
+            if hasattr(source, "restrict"):
+                source.restrict(start, end, ids)
+                restricted.add(index)
+
+        self._heap = [e for e in self._heap if e[1] not in restricted]
+        heapq.heapify(self._heap)
+
+        for index in restricted:
+            self._advance(index)
+
+    def close(self) -> None:
+        """
+        Close the sources that hold resources.
+        """
+        for source in self.sources:
+            if hasattr(source, "close"):
+                source.close()
+
+    def _advance(self, index: int) -> None:
+        record = self.sources[index].replay()
+
+        if record is not None:
+            heapq.heappush(self._heap, (record.ts_event, index, record))
+
+    def _merge_metadata(self) -> MergedMetadata:
+        metadata = [source.metadata for source in self.sources]
+        schema = metadata[0].schema
+        mappings: Dict[int, str] = {}
+
+        for m in metadata:
+            if m.schema != schema:
+                raise ValueError("Data files must share the same schema.")
+
+            for id, ticker in m.mappings.map.items():
+                if mappings.setdefault(id, ticker) != ticker:
+                    raise ValueError(
+                        f"Instrument id {id} maps to both {mappings[id]} and {ticker}."
+                    )
+
+        return MergedMetadata(
+            schema=schema,
+            start=min(m.start for m in metadata),
+            end=max(m.end for m in metadata),
+            mappings=MergedMappings(mappings),
+        )
@@ -0,0 +1,400 @@
+import copy
+import mmap
+import struct
+from mbinary import BufferStore, Metadata, RecordMsg
+from typing import TYPE_CHECKING, Iterable, Optional, Set
+
+if TYPE_CHECKING:
+    from midastrader.data.adaptors.historical.index import TimeIndex
+
+# Records store their size in units of this many bytes in their first byte
+LENGTH_MULTIPLIER = 4
+# Size of the record header: length, rtype, instrument_id, ts_event, rollover_flag
+HEADER_SIZE = 24
+# Offset of the rtype byte within a record
+RTYPE_OFFSET = 1
+# Offset of the little-endian u32 instrument_id within a record
+INSTRUMENT_ID_OFFSET = 4
+# Offset of the little-endian u64 ts_event within a record
+TS_EVENT_OFFSET = 8
+DEFAULT_CHUNK_SIZE = 1 << 22  # 4 MiB
+# Records checked before trusting a guessed uniform record length
+RECORD_SIZE_SAMPLES = 64
+
+
+class MappedDataFile:
+    """
+    Reader of an mbinary data file that decodes records lazily from a memory map.
+
+    An mbinary file is a u16 length-prefixed metadata header followed by records, each
+    starting with its length. The header is parsed when the file is opened, while records
+    are decoded a window of about `chunk_size` bytes at a time, by handing the header and
+    the window to mbinary's decoder. Memory use is bounded by the window rather than the
+    file, and processes reading the same file share its pages through the page cache.
+    Each window is copied once, from the map straight into the buffer handed to the
+    decoder, so loading is not zero-copy, only bounded.
+
+    Replay can be restricted to a time window and a set of instruments with `restrict`.
+    Records outside them are skipped by reading their headers, without being decoded.
+
+    Several readers can replay one mapping from their own positions, see `view`.
+
+    Provides the `metadata` and `replay` interface of `BufferStore`, so it can replace one
+    in `HistoricalAdaptor`.
+
+    Attributes:
+        path (str): Path of the data file.
+        chunk_size (int): Approximate number of record bytes decoded at a time.
+        header_size (int): Size of the metadata header, the offset of the first record.
+        record_size (Optional[int]): Length shared by every record, allowing binary search by time, None if unknown.
+        offset (int): Offset of the next record not yet handed to the decoder.
+        end_offset (int): Offset at which replay stops.
+        instrument_ids (Optional[Set[int]]): Instruments replayed, None for all.
+        index (Optional[TimeIndex]): Sparse time index of the file, used to seek when set.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        index: Optional["TimeIndex"] = None,
+    ):
+        """
+        Map the file and parse its metadata.
+
+        Args:
+            path (str): Path of the mbinary data file.
+            chunk_size (int): Approximate number of record bytes decoded at a time.
+            index (Optional[TimeIndex]): Sparse time index of the file.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive or the file has no metadata header.
+        """
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be a positive integer.")
+
+        self.path = path
+        self.chunk_size = chunk_size
+        self.index = index
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < 2:
+            raise ValueError(f"{path} has no metadata header.")
+
+        (length,) = struct.unpack_from("<H", self._map, 0)
+        self.header_size = 2 + length
+        self._header = self._map[: self.header_size]
+        self._metadata = BufferStore(self._header).metadata
+        self.record_size = self._uniform_record_size()
+        self.offset = self.header_size
+        self.end_offset = len(self._map)
+        self.instrument_ids: Optional[Set[int]] = None
+        self._window: Optional[BufferStore] = None
+        self._owner = True
+
+    @property
+    def metadata(self) -> Metadata:
+        """
+        Metadata of the file.
+        """
+        return self._metadata
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the file in bytes.
+        """
+        return len(self._map)
+
+    def ts_event(self, offset: int) -> int:
+        """
+        Read the event timestamp of the record at an offset without decoding it.
+
+        Args:
+            offset (int): Offset of the start of a record.
+
+        Returns:
+            int: The record's `ts_event` in nanoseconds.
+        """
+        (ts_event,) = struct.unpack_from(
+            "<Q", self._map, offset + TS_EVENT_OFFSET
+        )
+        return ts_event
+
+    def instrument_id(self, offset: int) -> int:
+        """
+        Read the instrument id of the record at an offset without decoding it.
+
+        Args:
+            offset (int): Offset of the start of a record.
+
+        Returns:
+            int: The record's source instrument id.
+        """
+        (instrument_id,) = struct.unpack_from(
+            "<I", self._map, offset + INSTRUMENT_ID_OFFSET
+        )
+        return instrument_id
+
+    def record_end(self, offset: int) -> int:
+        """
+        Offset just past the record starting at an offset.
+
+        Args:
+            offset (int): Offset of the start of a record.
+
+        Returns:
+            int: The offset of the following record.
+
+        Raises:
+            ValueError: If the record length is shorter than a record header.
+        """
+        length = self._map[offset] * LENGTH_MULTIPLIER
+
+        if length < HEADER_SIZE:
+            raise ValueError(
+                f"Invalid record length {length} at offset {offset}."
+            )
+
+        return offset + length
+
+    def find_offset(self, ts: int, offset: Optional[int] = None) -> int:
+        """
+        Offset of the first record with an event timestamp at or after `ts`.
+
+        Only record headers are read, so no records are decoded. With an index, a
+        timestamp at the start of a UTC day is looked up in the per-day offsets without
+        reading any record, and others are scanned from the nearest indexed record.
+        Without one, records of a single length are binary searched and others scanned
+        in order. If the binary search lands on an offset that is not a record start,
+        the file is treated as having records of several lengths and scanned.
+
+        Args:
+            ts (int): Timestamp in nanoseconds.
+            offset (Optional[int]): Offset of the record to start from. Defaults to the first record.
+
+        Returns:
+            int: The offset of the record, or `size` if every record is earlier.
+        """
+        offset = self.header_size if offset is None else offset
+        size = len(self._map)
+
+        if self.index is not None:
+            exact = self.index.offset_at(ts)
+
+            if exact is not None:
+                return max(offset, exact)
+
+            indexed = self.index.offset_before(ts)
+
+            if indexed is not None:
+                offset = max(offset, indexed)
+        elif self.record_size:
+            low = (offset - self.header_size) // self.record_size
+            high = (size - self.header_size) // self.record_size
+
+            while low < high:
+                mid = (low + high) // 2
+                mid_offset = self.header_size + mid * self.record_size
+
+                if self.ts_event(mid_offset) < ts:
+                    low = mid + 1
+                else:
+                    high = mid
+
+            found = self.header_size + low * self.record_size
+
+            if found >= size or self._is_record_start(found):
+                return found
+
+            # The guessed uniform length was wrong, scan record by record
+            self.record_size = None
+
+        while offset < size and self.ts_event(offset) < ts:
+            offset = self.record_end(offset)
+
+        return offset
+
+    def buffer(self, start: int, end: int) -> BufferStore:
+        """
+        Copy the records between two offsets into a buffer with the file's metadata.
+
+        The records are copied once, from the map into the buffer.
+
+        Args:
+            start (int): Offset of the first record.
+            end (int): Offset just past the last record.
+
+        Returns:
+            BufferStore: A buffer over the records.
+        """
+        with memoryview(self._map) as view:
+            return BufferStore(b"".join((self._header, view[start:end])))
+
+    def restrict(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        instrument_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Replay only the records in a time window and for a set of instruments.
+
+        Replay restarts from the first record of the window.
+
+        Args:
+            start (Optional[int]): Earliest `ts_event` replayed in nanoseconds, None for no bound.
+            end (Optional[int]): Replay stops at the first `ts_event` at or after it, None for no bound.
+            instrument_ids (Optional[Iterable[int]]): Source instrument ids replayed, None for all.
+        """
+        first = self.header_size if start is None else self.find_offset(start)
+        self.end_offset = (
+            len(self._map) if end is None else self.find_offset(end, first)
+        )
+        self.instrument_ids = (
+            None if instrument_ids is None else set(instrument_ids)
+        )
+        self.seek(first)
+
+    def view(self) -> "MappedDataFile":
+        """
+        Independent reader of the same mapping, starting from the first record.
+
+        The view shares the map, metadata and index of this reader, so the file is
+        neither reopened nor parsed again. Closing the view leaves the map open.
+
+        Returns:
+            MappedDataFile: The view.
+        """
+        view = copy.copy(self)
+        view._owner = False
+        view.restrict()
+        return view
+
+    def seek(self, offset: int) -> None:
+        """
+        Continue replay from the record starting at an offset.
+
+        Args:
+            offset (int): Offset of the start of a record, at least `header_size`.
+        """
+        self.offset = max(offset, self.header_size)
+        self._window = None
+
+    def replay(self) -> Optional[RecordMsg]:
+        """
+        Decode the next record.
+
+        Returns:
+            Optional[RecordMsg]: The next record, or None once the file is exhausted.
+        """
+        while True:
+            if self._window is not None:
+                record = self._window.replay()
+
+                if record is not None:
+                    return record
+
+            if not self._next_window():
+                return None
+
+    def _next_window(self) -> bool:
+        start = self.offset
+        size = self.end_offset
+
+        if start >= size:
+            self._window = None
+            return False
+
+        # Extend to the record boundary at or past the chunk size
+        target = min(start + self.chunk_size, size)
+        end = start
+
+        while end < target:
+            end = self.record_end(end)
+
+        end = min(end, size)
+        self._window = (
+            self.buffer(start, end)
+            if self.instrument_ids is None
+            else self._filtered_buffer(start, end)
+        )
+        self.offset = end
+        return True
+
+    def _filtered_buffer(self, start: int, end: int) -> BufferStore:
+        # Runs of consecutive kept records are joined straight from the map
+        with memoryview(self._map) as view:
+            parts = [self._header]
+            run = start
+            offset = start
+
+            while offset < end:
+                next_offset = self.record_end(offset)
+
+                if self.instrument_id(offset) not in self.instrument_ids:
+                    if run < offset:
+                        parts.append(view[run:offset])
+                    run = next_offset
+
+                offset = next_offset
+
+            if run < end:
+                parts.append(view[run:end])
+
+            return BufferStore(b"".join(parts))
+
+    def _uniform_record_size(self) -> Optional[int]:
+        # Guess that all records share the first record's length, then check the guess
+        # on records spread over the file, since merged or rewritten files can mix
+        # lengths and still divide evenly
+        body = len(self._map) - self.header_size
+
+        if body <= 0:
+            return None
+
+        size = self.record_end(self.header_size) - self.header_size
+
+        if body % size:
+            return None
+
+        count = body // size
+        step = max(count // RECORD_SIZE_SAMPLES, 1)
+        previous = 0
+
+        for i in [*range(0, count, step), count - 1]:
+            offset = self.header_size + i * size
+
+            if not self._is_record_start(offset, size):
+                return None
+
+            ts_event = self.ts_event(offset)
+
+            if ts_event < previous:
+                return None
+
+            previous = ts_event
+
+        return size
+
+    def _is_record_start(
+        self, offset: int, size: Optional[int] = None
+    ) -> bool:
+        # A record start has the expected length and the rtype of the first record
+        size = self.record_size if size is None else size
+        return (
+            self._map[offset] * LENGTH_MULTIPLIER == size
+            and self._map[offset + RTYPE_OFFSET]
+            == self._map[self.header_size + RTYPE_OFFSET]
+        )
+
+    def close(self) -> None:
+        """
+        Release the memory map, unless this reader is a view of another.
+        """
+        self._window = None
+
+        if self._owner:
+            self._map.close()
@@ -0,0 +1,176 @@
+import queue
+import threading
+from datetime import datetime, timedelta
+from mbinary import BufferStore, Metadata, RecordMsg
+from typing import Callable, List, Optional, Tuple
+
+# Marks the end of the chunks in the prefetch queue
+_DONE = object()
+
+
+def chunk_ranges(start: str, end: str, days: int) -> List[Tuple[str, str]]:
+    """
+    Split a time range into consecutive slices of a number of days.
+
+    Boundaries keep the format of `start`, dates stay dates and datetimes stay
+    datetimes, and the last slice ends at `end`.
+
+    Args:
+        start (str): Start of the range in ISO format.
+        end (str): End of the range in ISO format.
+        days (int): Length of each slice in days.
+
+    Returns:
+        List[Tuple[str, str]]: The (start, end) of each slice, in order.
+
+    Raises:
+        ValueError: If `days` is not positive.
+    """
+    if days < 1:
+        raise ValueError("'days' must be a positive integer.")
+
+    date_only = len(start) == 10
+    last = datetime.fromisoformat(end)
+    boundary = datetime.fromisoformat(start) + timedelta(days=days)
+    ranges = []
+    lower = start
+
+    while boundary < last:
+        upper = (
+            boundary.date().isoformat() if date_only else boundary.isoformat()
+        )
+        ranges.append((lower, upper))
+        lower = upper
+        boundary += timedelta(days=days)
+
+    ranges.append((lower, end))
+    return ranges
+
+
+class ChunkedRecords:
+    """
+    Replays a time range retrieved one slice at a time, downloading ahead on a thread.
+
+    While a chunk is replayed, the thread fetches the following ones until `prefetch`
+    chunks are waiting, so at most `prefetch + 2` chunks are held at once and replay
+    starts as soon as the first chunk arrives. An error raised by a fetch is re-raised
+    by `replay` when the chunk is reached.
+
+    Provides the `metadata` and `replay` interface of `BufferStore`, so it can replace one
+    in `HistoricalAdaptor`. The metadata is that of the chunk being replayed, whose
+    mappings only cover the instruments in that chunk.
+
+    Attributes:
+        fetch (Callable[[str, str], BufferStore]): Retrieves the records between two ISO timestamps.
+        ranges (List[Tuple[str, str]]): The (start, end) of each chunk, in order.
+        chunk (Optional[BufferStore]): The chunk being replayed, None once all are replayed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], BufferStore],
+        ranges: List[Tuple[str, str]],
+        prefetch: int = 1,
+    ):
+        """
+        Start downloading and wait for the first chunk.
+
+        Args:
+            fetch (Callable[[str, str], BufferStore]): Retrieves the records between two ISO timestamps.
+            ranges (List[Tuple[str, str]]): The (start, end) of each chunk, in order.
+            prefetch (int): Number of downloaded chunks waiting to be replayed.
+
+        Raises:
+            ValueError: If `ranges` is empty or `prefetch` is not positive.
+        """
+        if not ranges:
+            raise ValueError("'ranges' must contain at least one range.")
+        if prefetch < 1:
+            raise ValueError("'prefetch' must be a positive integer.")
+
+        self.fetch = fetch
+        self.ranges = ranges
+        self._queue: queue.Queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._download, daemon=True)
+        self._thread.start()
+
+        self.chunk: Optional[BufferStore] = self._next_chunk()
+        self._metadata = self.chunk.metadata
+
+    @property
+    def metadata(self) -> Metadata:
+        """
+        Metadata of the chunk being replayed, or of the last chunk once all are replayed.
+        """
+        return self._metadata
+
+    def replay(self) -> Optional[RecordMsg]:
+        """
+        Decode the next record, moving on to the next chunk once one is exhausted.
+
+        Returns:
+            Optional[RecordMsg]: The next record, or None once every chunk is replayed.
+        """
+        while self.chunk is not None:
+            record = self.chunk.replay()
+
+            if record is not None:
+                return record
+
+            self.chunk = self._next_chunk()
+
+            if self.chunk is not None:
+                self._metadata = self.chunk.metadata
+
+        return None
+
+    def close(self) -> None:
+        """
+        Stop downloading and release the chunks.
+        """
+        self._stop.set()
+        self.chunk = None
+
+        # Unblock the thread if it is waiting for space
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _next_chunk(self) -> Optional[BufferStore]:
+        item = self._queue.get()
+
+        if item is _DONE or isinstance(item, BaseException):
+            # Left for later calls, the thread has stopped
+            self._queue.put(item)
+
+        if item is _DONE:
+            return None
+
+        if isinstance(item, BaseException):
+            raise item
+
+        return item
+
+    def _download(self) -> None:
+        for start, end in self.ranges:
+            try:
+                item = self.fetch(start, end)
+            except Exception as e:
+                item = e
+
+            if not self._put(item) or isinstance(item, BaseException):
+                return
+
+        self._put(_DONE)
+
+    def _put(self, item: object) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
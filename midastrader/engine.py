@@ -1,15 +1,24 @@
 import threading
 import signal
+from typing import Optional
 
 from midastrader.structs.symbol import SymbolMap
 from midastrader.config import Parameters, Config, Mode
 from midastrader.utils.logger import SystemLogger
-from midastrader.core.adapters import OrderBook
+from midastrader.core.adapters import OrderBook, PortfolioServer
 from midastrader.core.adapters.base_strategy import load_strategy_class
 from midastrader.data import DataEngine
 from midastrader.execution import ExecutionEngine
-from midastrader.message_bus import MessageBus
+from midastrader.message_bus import (
+    MARKET_DATA_TOPICS,
+    MessageBus,
+    EventType,
+    OverflowPolicy,
+)
 from midastrader.core import CoreEngine
+from midastrader.core.adapters.performance.export import OutputFormat
+from midastrader.core.adapters.performance.pipeline import ResultsPipeline
+from midastrader.kernel import BacktestKernel
 
 
 class EngineBuilder:
@@ -23,6 +32,8 @@ class EngineBuilder:
     Args:
         config_path (str): Path to the configuration file (TOML format).
         mode (Mode): The mode for the trading system, either `LIVE` or `BACKTEST`.
+        pipeline (Optional[ResultsPipeline]): Pipeline saving results in the background,
+            shared between engines. Created from the configuration if not given.
 
     Methods:
         create_logger(): Initializes the logging system.
@@ -35,24 +46,41 @@ class EngineBuilder:
         build(): Finalizes and returns the fully constructed trading system.
     """
 
-    def __init__(self, config_path: str, mode: Mode):
+    def __init__(
+        self,
+        config_path: str,
+        mode: Mode,
+        pipeline: Optional[ResultsPipeline] = None,
+    ):
         """
         Initialize the EngineBuilder with the configuration path and mode.
 
         Args:
             config_path (str): Path to the configuration file.
             mode (Mode): Mode of operation, either `Mode.LIVE` or `Mode.BACKTEST`.
+            pipeline (Optional[ResultsPipeline]): Pipeline saving results in the
+                background. Defaults to None.
         """
         self.mode = mode
         self.config = self.load_config(config_path)
 
         self.logger = self.create_logger()
-        self.bus = self.create_messagebus()
-        self.params = self.create_parameters()
-        self.symbols_map = self.create_symbols_map()
-        self.data_engine = self.create_data_engine()
-        self.execution_engine = self.create_execution_engine()
-        self.core_engine = self.create_core_engine()
+
+        # Components created here log through this engine's logger
+        with self.logger.activate():
+            self.bus = self.create_messagebus()
+            self.params = self.create_parameters()
+            self.symbols_map = self.create_symbols_map()
+            self.order_book = self.create_orderbook()
+            self.portfolio_server = self.create_portfolio_server()
+            self.pipeline = pipeline or self.create_results_pipeline()
+            # Only a pipeline created here is shut down with the engine
+            self.owns_pipeline = pipeline is None
+            # Core subscribers must exist before the brokers publish their
+            # initial account state, since topics without subscribers drop it
+            self.core_engine = self.create_core_engine()
+            self.data_engine = self.create_data_engine()
+            self.execution_engine = self.create_execution_engine()
 
     def load_config(self, config_path: str) -> Config:
         """
@@ -84,20 +112,71 @@ class EngineBuilder:
         )
 
     def create_messagebus(self) -> MessageBus:
-        return MessageBus()
+        """
+        Create the message bus with the channel capacities and overflow policies
+        from the `[general]` section of the configuration.
 
-    def create_orderbook(self) -> OrderBook:
+        The default `queue_capacity` and `queue_policy` apply to the market data
+        topics only. Overflow policies are meant for live market data: a backtest
+        publishes records as fast as it reads them, so a bounded channel would fill
+        at once and its policy would silently discard or stall historical data.
+        Backtests therefore keep the market data topics unbounded.
+
+        Returns:
+            MessageBus: The message bus shared by all engines.
+
+        Raises:
+            ValueError: If a configured topic or policy is invalid, a control topic is
+                bounded, or a market data topic is bounded or not BLOCK in a backtest.
         """
-        Create the system logger for logging output.
+        bus = MessageBus(
+            self.config.queue_capacity,
+            OverflowPolicy.from_string(self.config.queue_policy),
+        )
 
-        The logger outputs messages to the configured file or terminal
-        depending on the settings in the configuration.
+        for name, settings in self.config.queues.items():
+            try:
+                topic = EventType[name.upper()]
+            except KeyError:
+                raise ValueError(f"Invalid message bus topic: {name}.")
+
+            bus.configure(
+                topic,
+                settings.get("capacity"),
+                OverflowPolicy.from_string(settings.get("policy", "block")),
+            )
+
+        if self.mode == Mode.BACKTEST:
+            for topic in MARKET_DATA_TOPICS:
+                capacity, policy = bus.topic_settings(topic)
+
+                if capacity is not None or policy is not OverflowPolicy.BLOCK:
+                    raise ValueError(
+                        f"Topic '{topic.name}' has a bounded or {policy.value} "
+                        "channel, which would drop backtest records. Overflow "
+                        "policies apply to live market data only."
+                    )
+
+        return bus
+
+    def create_orderbook(self) -> OrderBook:
+        """
+        Create the order book shared by the components of this engine.
 
         Returns:
-            EngineBuilder: Returns the current instance for method chaining.
+            OrderBook: The engine's order book.
         """
         return OrderBook()
 
+    def create_portfolio_server(self) -> PortfolioServer:
+        """
+        Create the portfolio server shared by the components of this engine.
+
+        Returns:
+            PortfolioServer: The engine's portfolio server.
+        """
+        return PortfolioServer()
+
     def create_symbols_map(self) -> SymbolMap:
         """
         Create the symbol map for all trading instruments.
@@ -120,6 +199,18 @@ class EngineBuilder:
         """
         return Parameters.from_dict(self.config.strategy_parameters)
 
+    def create_results_pipeline(self) -> Optional[ResultsPipeline]:
+        """
+        Create the pipeline saving results in the background, if enabled.
+
+        Returns:
+            Optional[ResultsPipeline]: The pipeline, or None when `background_save` is off.
+        """
+        if not self.config.background_save:
+            return None
+
+        return ResultsPipeline(self.config.save_workers)
+
     def create_data_engine(self) -> DataEngine:
         data_engine = DataEngine(
             self.symbols_map,
@@ -137,6 +228,7 @@ class EngineBuilder:
             self.bus,
             self.mode,
             self.params,
+            self.order_book,
         )
         execution_engine.initialize_adaptors(self.config.executors)
 
@@ -149,6 +241,12 @@ class EngineBuilder:
             self.mode,
             self.params,
             self.config.output_path,
+            OutputFormat.from_string(self.config.output_format),
+            self.config.excel_summary,
+            self.pipeline,
+            self.order_book,
+            self.portfolio_server,
+            self.config.upload_results,
         )
         core_engine.initialize()
 
@@ -161,16 +259,18 @@ class EngineBuilder:
         Returns:
             Engine: The assembled trading engine instance ready for execution.
         """
-        return Engine(
-            mode=self.mode,
-            config=self.config,
-            bus=self.bus,
-            symbols_map=self.symbols_map,
-            params=self.params,
-            core_engine=self.core_engine,
-            data_engine=self.data_engine,
-            execution_engine=self.execution_engine,
-        )
+        with self.logger.activate():
+            return Engine(
+                mode=self.mode,
+                config=self.config,
+                bus=self.bus,
+                symbols_map=self.symbols_map,
+                params=self.params,
+                core_engine=self.core_engine,
+                data_engine=self.data_engine,
+                execution_engine=self.execution_engine,
+                pipeline=self.pipeline if self.owns_pipeline else None,
+            )
 
 
 class Engine:
@@ -219,6 +319,7 @@ class Engine:
         core_engine: CoreEngine,
         data_engine: DataEngine,
         execution_engine: ExecutionEngine,
+        pipeline: Optional[ResultsPipeline] = None,
     ):
         """
         Initialize the trading engine with all required components.
@@ -237,16 +338,20 @@ class Engine:
             live_data_client (Optional[LiveDataClient]): Client for live data feeds.
             hist_data_client (BacktestDataClient): Client for backtest historical data.
             broker_client (Union[LiveBrokerClient, BacktestBrokerClient]): Broker client for order routing.
+            pipeline (Optional[ResultsPipeline]): Results pipeline created for this engine alone,
+                shut down by `stop`. None if there is none or it is shared.
         """
         self.mode = mode
         self.config = config
         self.bus = bus
         self.symbols_map = symbols_map
-        self.logger = SystemLogger.get_logger()
+        self.system_logger = SystemLogger.current()
+        self.logger = self.system_logger.logger
         self.parameters = params
         self.core_engine = core_engine
         self.data_engine = data_engine
         self.execution_engine = execution_engine
+        self.pipeline = pipeline
         self.threads = {}
 
     def initialize(self):
@@ -269,7 +374,13 @@ class Engine:
             self.config.strategy_class,
         )
 
-        strategy = strategy_class(self.symbols_map, self.bus)
+        # Strategies built with the two-argument constructor pick up the engine's state
+        with (
+            self.system_logger.activate(),
+            self.core_engine.order_book.activate(),
+            self.core_engine.portfolio_server.activate(),
+        ):
+            strategy = strategy_class(self.symbols_map, self.bus)
         self.core_engine.set_strategy(strategy)
 
     def start(self):
@@ -278,6 +389,11 @@ class Engine:
         """
         self.logger.info(f"<< Starting in {self.mode.value} mode. >>\n")
 
+        if self.mode == Mode.BACKTEST and self.config.synchronous_backtest:
+            self._synchronous_backtest_loop()
+            self.logger.info(f"\n<< Ending {self.mode.value} >>")
+            return
+
         # Start engines
         core_thread = threading.Thread(target=self.core_engine.start)
         core_thread.start()
@@ -315,6 +431,78 @@ class Engine:
         self.execution_engine.stop()
         self.core_engine.save()
         self.core_engine.wait_until_complete()
+        self._log_overflow()
+
+        self.logger.info("Backtest completed ...")
+
+    def wait_for_results(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for results saved in the background to finish, then stop the engine,
+        see `stop`.
+
+        The timeout only bounds this call. The pipeline's worker threads are not daemon
+        threads, so a save still running keeps the interpreter from exiting until it
+        finishes.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, indefinitely if None.
+
+        Returns:
+            bool: True once the results are saved or if nothing is pending, False if the
+                timeout expired first.
+
+        Raises:
+            RuntimeError: If saving the results failed.
+        """
+        handle = self.core_engine.adapters["performance_manager"].save_handle
+
+        try:
+            if handle is not None and not handle.wait(timeout):
+                self.logger.warning(
+                    "Timed out waiting for results to be saved."
+                )
+                return False
+        finally:
+            # A save still running after the timeout keeps the logger open
+            if handle is None or handle.done():
+                self.stop()
+
+        return True
+
+    def stop(self):
+        """
+        Release the resources held by the engine once it has completed.
+
+        Shuts down the results pipeline created for the engine, waiting for its
+        pending saves, then flushes and closes the engine's logger and stops its
+        flusher thread, so engines built one after another in a process do not
+        leak them. A pipeline shared between engines is left running.
+        """
+        if self.pipeline is not None:
+            self.pipeline.shutdown(wait=True)
+
+        self.system_logger.stop()
+
+    def _synchronous_backtest_loop(self):
+        """
+        Runs the backtest on the calling thread through the `BacktestKernel`.
+        """
+        adapters = self.core_engine.adapters
+
+        with self.system_logger.activate():
+            kernel = BacktestKernel(
+                symbols_map=self.symbols_map,
+                bus=self.bus,
+                data_adaptor=self.data_engine.adapters["historical"],
+                order_book_manager=adapters["order_book"],
+                portfolio_manager=adapters["portfolio_server"],
+                order_manager=adapters["order_manager"],
+                performance_manager=adapters["performance_manager"],
+                strategy=adapters["strategy"],
+                execution_adaptor=self.execution_engine.adapters[0],
+            )
+        kernel.run()
+        self._log_overflow()
 
         self.logger.info("Backtest completed ...")
 
@@ -329,6 +517,8 @@ class Engine:
         # Perform cleanup here
         self.data_engine.stop()
 
+        self._log_overflow()
+
         # Finalize and save to database
         self.execution_engine.stop()
 
@@ -336,6 +526,18 @@ class Engine:
 
         self.logger.info("Live completed ...")
 
+    def _log_overflow(self):
+        """
+        Log the messages dropped, conflated or unrouted on each bus topic.
+        """
+        for topic, counts in self.bus.overflow_counts().items():
+            if any(counts.values()):
+                self.logger.info(
+                    f"{topic.name} messages dropped: {counts['dropped']}, "
+                    f"conflated: {counts['conflated']}, "
+                    f"unrouted: {counts['unrouted']}"
+                )
+
     def _signal_handler(self, signum, frame):
         """
         Handle system signals (e.g., SIGINT) to stop the event loop.
@@ -1,10 +1,12 @@
 import queue
 import threading
+from typing import Optional
 
 from midastrader.execution.adaptors.dummy.dummy_broker import DummyBroker
 from midastrader.message_bus import MessageBus, EventType
 from midastrader.structs.symbol import SymbolMap
 from midastrader.execution.adaptors.base import ExecutionAdapter
+from midastrader.core.adapters.order_book import OrderBook
 
 
 class DummyAdaptor(ExecutionAdapter):
@@ -20,17 +22,30 @@ class DummyAdaptor(ExecutionAdapter):
         logger (logging.Logger): Logger for tracking and reporting system operations.
     """
 
-    def __init__(self, symbols_map: SymbolMap, bus: MessageBus, capital: int):
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        capital: int,
+        order_book: Optional[OrderBook] = None,
+    ):
         """
         Initializes a BrokerClient with the necessary components to simulate broker functionalities.
 
         Args:
-            broker (DummyBroker): The simulated broker backend for order execution and account management.
             symbols_map (SymbolMap): Mapping of symbols to unique identifiers for instruments.
+            capital (int): Initial capital of the simulated account.
+            order_book (Optional[OrderBook]): Order book the broker fills against, the process
+                default if None.
         """
         super().__init__(symbols_map, bus)
         self.threads = []
-        self.broker = DummyBroker(self.symbols_map, self.bus, capital)
+        self.broker = DummyBroker(
+            self.symbols_map,
+            self.bus,
+            capital,
+            order_book,
+        )
 
         # Subscriptions
         self.order_queue = self.bus.subscribe(EventType.ORDER)
@@ -1,6 +1,6 @@
 import queue
 import threading
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from midastrader.structs.trade import Trade
 from midastrader.structs.symbol import Symbol, SymbolMap
@@ -39,17 +39,19 @@ class DummyBroker:
         symbols_map: SymbolMap,
         bus: MessageBus,
         capital: float,
+        order_book: Optional[OrderBook] = None,
     ):
         """
         Initializes the DummyBroker with necessary components and account details.
 
         Args:
             symbols_map (SymbolMap): A mapping of ticker symbols to instrument details.
-            order_book (OrderBook): The order book for managing orders and retrieving market data.
             capital (float): Initial capital available in the broker's account.
+            order_book (Optional[OrderBook]): The order book for retrieving market data, the
+                process default if None.
         """
         self.logger = SystemLogger.get_logger()
-        self.order_book = OrderBook.get_instance()
+        self.order_book = order_book or OrderBook.get_instance()
         self.symbols_map = symbols_map
         self.bus = bus
 
@@ -113,25 +115,19 @@ class DummyBroker:
 
     def process_book_update(self) -> None:
         while not self.shutdown_event.is_set():
-            try:
-                if self.bus.get_flag(EventType.UPDATE_EQUITY):
-                    self._update_account()
-                    self.return_equity_value()
-                    self.bus.publish(EventType.UPDATE_EQUITY, False)
-            except queue.Empty:
-                continue
+            if self.bus.wait_for_flag(EventType.UPDATE_EQUITY, True, 0.01):
+                self._update_account()
+                self.return_equity_value()
+                self.bus.publish(EventType.UPDATE_EQUITY, False)
 
     def process_eod(self) -> None:
         while not self.shutdown_event.is_set():
-            try:
-                if self.bus.get_flag(EventType.EOD):
-                    self._update_account()
-                    self.mark_to_market()
-                    self.check_margin_call()
-                    self.return_account()
-                    self.bus.publish(EventType.EOD, False)
-            except queue.Empty:
-                continue
+            if self.bus.wait_for_flag(EventType.EOD, True, 0.01):
+                self._update_account()
+                self.mark_to_market()
+                self.check_margin_call()
+                self.return_account()
+                self.bus.publish(EventType.EOD, False)
 
     def process_trades(self) -> None:
         while not self.shutdown_event.is_set():
@@ -162,16 +158,20 @@ class DummyBroker:
         self.is_shutdown.set()
 
     def await_ob_rolled(self) -> None:
-        while True:
-            if self.bus.get_flag(EventType.OB_ROLLED):
-                break
+        self.bus.wait_for_flag(EventType.OB_ROLLED, True)
 
-    def _handle_rollover(self, event: RolloverEvent) -> None:
+    def _handle_rollover(
+        self,
+        event: RolloverEvent,
+        on_exit: Optional[Callable[[], None]] = None,
+    ) -> None:
         """
         Processes and executes an order based on given details.
 
         Args:
             event (OrderEvent): The event containing order details for execution.
+            on_exit (Optional[Callable[[], None]]): Called between the exit and re-entry legs to roll
+                the order book. Defaults to the ROLLOVER_EXITED / OB_ROLLED handshake with the OrderBookManager.
         """
         symbol = event.symbol
         position = self.positions.get(symbol.instrument_id)
@@ -220,8 +220,11 @@ class DummyBroker:
             self.return_account()
             self.return_equity_value()
 
-            self.bus.publish(EventType.ROLLOVER_EXITED, True)
-            self.await_ob_rolled()
+            if on_exit:
+                on_exit()
+            else:
+                self.bus.publish(EventType.ROLLOVER_EXITED, True)
+                self.await_ob_rolled()
 
             # Entry
             entry_action = (
@@ -558,7 +561,6 @@ class DummyBroker:
             dict: Dictionary containing account details.
         """
         self.bus.publish(EventType.ACCOUNT_UPDATE, self.account)
-        self.bus.publish(EventType.ACCOUNT_UPDATE_LOG, self.account)
 
     def return_equity_value(self) -> None:
         """
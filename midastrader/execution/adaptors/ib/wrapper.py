@@ -217,7 +217,6 @@ class BrokerApp(EWrapper, EClient):
 
         # Updating portfolio server outside the lock to avoid deadlocks
         self.bus.publish(EventType.ACCOUNT_UPDATE, account_info_copy)
-        self.bus.publish(EventType.ACCOUNT_UPDATE_LOG, account_info_copy)
 
     #### wrapper function for reqAccountUpdates. Get position information
     def updatePortfolio(
@@ -298,7 +297,6 @@ class BrokerApp(EWrapper, EClient):
 
         self.process_account_updates()
         self.bus.publish(EventType.ACCOUNT_UPDATE, self.account_info)
-        self.bus.publish(EventType.ACCOUNT_UPDATE_LOG, self.account_info)
 
         self.logger.debug(f"AccountDownloadEnd. Account: {accountName}")
         self.account_download_event.set()
@@ -449,7 +447,6 @@ class BrokerApp(EWrapper, EClient):
         self.account_info.timestamp = int(time.time() * 1e9)
         self.logger.debug(f"Account Summary Request Complete: {reqId}")
         self.bus.publish(EventType.ACCOUNT_UPDATE, self.account_info)
-        self.bus.publish(EventType.ACCOUNT_UPDATE_LOG, self.account_info)
 
     ####   wrapper function for reqExecutions.   this function gives the executed orders
     def execDetails(
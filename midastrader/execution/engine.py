@@ -1,12 +1,13 @@
 import threading
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
 
 from midastrader.message_bus import MessageBus
 from midastrader.structs.symbol import SymbolMap
 from midastrader.utils.logger import SystemLogger
 from midastrader.config import Parameters, Mode
 from midastrader.execution.adaptors import IBAdaptor, DummyAdaptor
+from midastrader.core.adapters.order_book import OrderBook
 
 
 class Executors(Enum):
@@ -40,8 +41,10 @@ class ExecutionEngine:
         message_bus: MessageBus,
         mode: Mode,
         parameters: Parameters,
+        order_book: Optional[OrderBook] = None,
     ):
         self.logger = SystemLogger.get_logger()
+        self.order_book = order_book
         self.message_bus = message_bus
         self.parameters = parameters
         self.symbol_map = symbols_map
@@ -78,6 +81,7 @@ class ExecutionEngine:
                 self.symbol_map,
                 self.message_bus,
                 self.parameters.capital,
+                self.order_book,
             )
         )
         return True
@@ -0,0 +1,227 @@
+import queue
+from typing import Callable
+
+from midastrader.structs.symbol import SymbolMap
+from midastrader.utils.logger import SystemLogger
+from midastrader.message_bus import MessageBus, EventType, Channel
+from midastrader.structs.events import (
+    MarketEvent,
+    RolloverEvent,
+    TradeEvent,
+    TradeCommissionEvent,
+)
+from midastrader.core.adapters import (
+    BaseStrategy,
+    OrderBookManager,
+    OrderExecutionManager,
+    PortfolioServerManager,
+    PerformanceManager,
+)
+from midastrader.data.adaptors import HistoricalAdaptor
+from midastrader.execution.adaptors import DummyAdaptor
+
+
+class BacktestKernel:
+    """
+    Runs a backtest on a single thread by driving every component directly.
+
+    The threaded backtest serializes the adapters through message bus flags, so
+    the kernel replaces the handshakes with direct calls in the same order:
+    end-of-day, rollover, order book update, account update, strategy, order
+    manager and broker. Queue topics are drained synchronously after each step,
+    which keeps the portfolio and performance state identical to the threaded
+    run and makes results reproducible.
+
+    Attributes:
+        bus (MessageBus): Message bus shared by the components.
+        symbols_map (SymbolMap): Mapping of instrument ids to `Symbol` objects.
+        data_adaptor (HistoricalAdaptor): Source of historical records.
+        order_book_manager (OrderBookManager): Owner of the order book.
+        portfolio_manager (PortfolioServerManager): Writer of the portfolio server.
+        order_manager (OrderExecutionManager): Converts signals into orders.
+        performance_manager (PerformanceManager): Records and saves performance data.
+        strategy (BaseStrategy): The user strategy.
+        execution_adaptor (DummyAdaptor): Simulated execution adaptor holding the broker.
+    """
+
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        bus: MessageBus,
+        data_adaptor: HistoricalAdaptor,
+        order_book_manager: OrderBookManager,
+        portfolio_manager: PortfolioServerManager,
+        order_manager: OrderExecutionManager,
+        performance_manager: PerformanceManager,
+        strategy: BaseStrategy,
+        execution_adaptor: DummyAdaptor,
+    ):
+        self.logger = SystemLogger.get_logger()
+        self.bus = bus
+        self.symbols_map = symbols_map
+        self.data_adaptor = data_adaptor
+        self.order_book_manager = order_book_manager
+        self.portfolio_manager = portfolio_manager
+        self.order_manager = order_manager
+        self.performance_manager = performance_manager
+        self.strategy = strategy
+        self.execution_adaptor = execution_adaptor
+
+        self.book = order_book_manager.book
+        self.broker = execution_adaptor.broker
+        self.initial_data = False
+
+        # Topics drained after every step, in processing order
+        self.handlers = [
+            (
+                portfolio_manager.order_queue,
+                portfolio_manager.server.order_manager.update_orders,
+            ),
+            (portfolio_manager.position_queue, self._handle_position_update),
+            (
+                portfolio_manager.account_queue,
+                portfolio_manager.server.account_manager.update_account_details,
+            ),
+            (
+                performance_manager.account_queue,
+                performance_manager.account_manager.update_account_log,
+            ),
+            (
+                performance_manager.equity_queue,
+                performance_manager.equity_manager.update_equity,
+            ),
+            (
+                performance_manager.signal_queue,
+                performance_manager.signal_manager.update_signals,
+            ),
+            (performance_manager.trade_queue, self._handle_trade_update),
+            (order_manager.signal_queue, order_manager.handle_event),
+            (execution_adaptor.order_queue, self.broker._handle_trade),
+        ]
+
+    def run(self) -> None:
+        """
+        Replays all historical records through the system, then liquidates and saves results.
+        """
+        self.logger.info("BacktestKernel running ...")
+        self._dispatch()
+
+        while True:
+            record = self.data_adaptor.next_record()
+
+            if record is None:
+                break
+
+            if self.data_adaptor.eod_reached(record):
+                self._handle_eod()
+
+            self._handle_record(record)
+
+        self.broker.liquidate_positions()
+        self._dispatch()
+        self.performance_manager.save()
+        self.logger.info("BacktestKernel completed ...")
+
+    def _handle_eod(self) -> None:
+        """
+        Marks the broker account to market at the end of the trading day.
+        """
+        self.logger.debug(f"EOD {self.data_adaptor.current_date}")
+        self.broker._update_account()
+        self.broker.mark_to_market()
+        self.broker.check_margin_call()
+        self.broker.return_account()
+        self._dispatch()
+
+    def _handle_record(self, record) -> None:
+        """
+        Updates the order book and account, then passes the market event to the strategy.
+
+        Args:
+            record (RecordMsg): The market data record to process.
+        """
+        if record.rollover_flag == 1:
+            self._handle_rollover(record)
+
+        self.book._update(record)
+
+        if not self.book.tickers_loaded:
+            self.book._tickers_loaded = (
+                self.order_book_manager.check_tickers_loaded()
+            )
+
+        self.broker._update_account()
+        self.broker.return_equity_value()
+        self._dispatch()
+
+        self.strategy.handle_event(MarketEvent(record.ts_event, record))
+        self._dispatch()
+
+    def _handle_rollover(self, record) -> None:
+        """
+        Rolls any open position from the expiring contract into the new one.
+
+        Args:
+            record (RecordMsg): The first record of the new contract.
+        """
+        id = record.hd.instrument_id
+        symbol = self.symbols_map.get_symbol_by_id(id)
+
+        if not symbol:
+            raise RuntimeError(f"Symbol not found for instrument_id {id}.")
+
+        old_record = self.book.retrieve(id)
+        event = RolloverEvent(record.hd.ts_event, symbol, old_record, record)
+
+        self.broker._handle_rollover(
+            event,
+            on_exit=lambda: self.book._update(event.entry_record),
+        )
+        self._dispatch()
+
+    def _handle_position_update(self, item: tuple) -> None:
+        position_manager = self.portfolio_manager.server.position_manager
+        position_manager.update_positions(item[0], item[1])
+
+    def _handle_trade_update(self, item: object) -> None:
+        if isinstance(item, TradeEvent):
+            self.performance_manager.trade_manager.update_trades(item)
+
+        if isinstance(item, TradeCommissionEvent):
+            self.performance_manager.trade_manager.update_trade_commission(
+                item
+            )
+
+    def _dispatch(self) -> None:
+        """
+        Drains all subscribed topics until no component has pending messages.
+        """
+        processed = True
+
+        while processed:
+            processed = False
+            for topic_queue, handler in self.handlers:
+                processed |= self._drain(topic_queue, handler)
+
+        if not self.initial_data:
+            account_manager = self.portfolio_manager.server.account_manager
+            if account_manager.initial_data:
+                self.initial_data = True
+                self.bus.publish(EventType.INITIAL_DATA, True)
+                self.strategy.handle_initial_data()
+
+    @staticmethod
+    def _drain(
+        topic_queue: Channel,
+        handler: Callable[[object], None],
+    ) -> bool:
+        processed = False
+
+        while True:
+            try:
+                item = topic_queue.get_nowait()
+            except queue.Empty:
+                return processed
+
+            handler(item)
+            processed = True
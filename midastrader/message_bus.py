@@ -1,6 +1,9 @@
 import queue
 import threading
+import dataclasses
+from collections import OrderedDict, deque
 from enum import Enum, auto
+from typing import Callable, Deque, Dict, Hashable, Optional, Tuple
 
 
 class EventType(Enum):
@@ -23,11 +26,9 @@ class EventType(Enum):
     ROLLOVER = auto()
 
     # Update Events
-    SIGNAL_UPDATE = auto()
     POSITION_UPDATE = auto()
     ORDER_UPDATE = auto()
     ACCOUNT_UPDATE = auto()
-    ACCOUNT_UPDATE_LOG = auto()
     EQUITY_UPDATE = auto()
     TRADE_UPDATE = auto()
     TRADE_COMMISSION_UPDATE = auto()
@@ -49,23 +50,337 @@ class EventType(Enum):
     EOD = auto()
 
 
+# Topics carrying market data, the only ones whose channels may be bounded
+MARKET_DATA_TOPICS = (EventType.DATA, EventType.ORDER_BOOK)
+
+
+class OverflowPolicy(Enum):
+    """
+    Behaviour of a channel when messages arrive faster than they are consumed.
+
+    Members:
+        BLOCK: The publisher waits until the subscriber frees a slot.
+        DROP_OLDEST: The oldest buffered message is discarded.
+        CONFLATE: A buffered message for the same instrument is replaced by the
+            new one, falling back to DROP_OLDEST when there is none.
+        LATEST: Only the newest message per instrument is kept, whatever the
+            capacity, using a `ConflatingChannel`.
+    """
+
+    BLOCK = "BLOCK"
+    DROP_OLDEST = "DROP_OLDEST"
+    CONFLATE = "CONFLATE"
+    LATEST = "LATEST"
+
+    @classmethod
+    def from_string(cls, policy_str: str) -> "OverflowPolicy":
+        """Convert a string to an OverflowPolicy enum, ensuring case-insensitivity."""
+        try:
+            return cls[policy_str.upper().replace("-", "_")]
+        except KeyError:
+            raise ValueError(
+                f"Invalid overflow policy: {policy_str}. "
+                "Expected 'BLOCK', 'DROP_OLDEST', 'CONFLATE' or 'LATEST'."
+            )
+
+
+def instrument_key(message: object) -> Optional[Hashable]:
+    """
+    Default conflation key: the instrument id of a record or market event.
+
+    Args:
+        message (object): A `RecordMsg`, or an event wrapping one in `data`.
+
+    Returns:
+        Optional[Hashable]: The instrument id, or None if the message has none.
+    """
+    data = getattr(message, "data", message)
+    return getattr(data, "instrument_id", None)
+
+
+class Channel:
+    """
+    FIFO buffer holding one subscriber's messages for a topic.
+
+    Every subscriber to a queue-based topic owns a channel, so consumers never
+    compete for messages and a slow consumer only backs up its own buffer. When
+    a capacity is set the channel is a bounded ring buffer and the overflow
+    policy decides whether `put` blocks the publisher, drops the oldest message
+    or conflates with a pending message for the same key; dropped and
+    conflated messages are counted. Unbounded channels never overflow and
+    publish straight into a `queue.SimpleQueue`. The interface mirrors the
+    parts of `queue.Queue` used by the adapters, raising `queue.Empty` on
+    timeout.
+
+    Attributes:
+        capacity (Optional[int]): Maximum buffered messages, None for unbounded.
+        policy (OverflowPolicy): Behaviour when a bounded channel is full.
+        key (Callable[[object], Optional[Hashable]]): Conflation key of a message.
+        dropped (int): Messages discarded by DROP_OLDEST or CONFLATE.
+        conflated (int): Messages replaced by a newer one with the same key.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: Callable[[object], Optional[Hashable]] = instrument_key,
+    ):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Channel capacity must be a positive integer.")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.key = key
+        self.dropped = 0
+        self.conflated = 0
+
+        # Unbounded channels never overflow, so they delegate to a SimpleQueue
+        if capacity is None:
+            buffer = queue.SimpleQueue()
+            self.put = buffer.put
+            self.get = buffer.get
+            self.get_nowait = buffer.get_nowait
+            self.empty = buffer.empty
+            self.qsize = buffer.qsize
+            return
+
+        self.buffer: Deque[object] = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def put(self, message: object) -> None:
+        """
+        Append a message, applying the overflow policy if the channel is full.
+
+        Args:
+            message (object): The message to buffer.
+        """
+        with self.lock:
+            if len(self.buffer) >= self.capacity:
+                if self.policy is OverflowPolicy.BLOCK:
+                    self.not_full.wait_for(
+                        lambda: len(self.buffer) < self.capacity
+                    )
+                elif (
+                    self.policy is OverflowPolicy.CONFLATE
+                    and self._remove_pending(self.key(message))
+                ):
+                    self.conflated += 1
+                else:
+                    self.buffer.popleft()
+                    self.dropped += 1
+
+            self.buffer.append(message)
+            self.not_empty.notify()
+
+    def _remove_pending(self, key: Optional[Hashable]) -> bool:
+        """
+        Remove the buffered message sharing the given conflation key.
+
+        Args:
+            key (Optional[Hashable]): Key of the incoming message.
+
+        Returns:
+            bool: True if a pending message was removed.
+        """
+        if key is None:
+            return False
+
+        for i, pending in enumerate(self.buffer):
+            if self.key(pending) == key:
+                del self.buffer[i]
+                return True
+
+        return False
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """
+        Remove and return the oldest message.
+
+        Args:
+            block (bool): Wait for a message if the channel is empty.
+            timeout (Optional[float]): Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            object: The oldest buffered message.
+
+        Raises:
+            queue.Empty: If no message is available in time.
+        """
+        with self.lock:
+            if not self.buffer:
+                if not block:
+                    raise queue.Empty
+                if not self.not_empty.wait_for(lambda: self.buffer, timeout):
+                    raise queue.Empty
+
+            message = self.buffer.popleft()
+            self.not_full.notify()
+            return message
+
+    def get_nowait(self):
+        """
+        Remove and return the oldest message without blocking.
+
+        Raises:
+            queue.Empty: If the channel is empty.
+        """
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return not self.buffer
+
+    def qsize(self) -> int:
+        return len(self.buffer)
+
+
+class ConflatingChannel(Channel):
+    """
+    Latest-value channel holding at most one pending message per instrument.
+
+    A message published while an earlier one for the same key is still pending
+    replaces it in place, so a subscriber slower than the publisher receives
+    only the newest update for each instrument, in the order the instruments
+    first became pending. Dataclass messages with a `merged` field, such as
+    `MarketEvent`, are delivered as a copy recording how many updates they
+    superseded. Messages without a key are never merged.
+
+    Attributes:
+        key (Callable[[object], Optional[Hashable]]): Conflation key of a message.
+        conflated (int): Messages replaced by a newer one with the same key.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[object], Optional[Hashable]] = instrument_key,
+    ):
+        self.capacity = None
+        self.policy = OverflowPolicy.LATEST
+        self.key = key
+        self.dropped = 0
+        self.conflated = 0
+
+        self.pending: "OrderedDict[Hashable, list]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+
+    def put(self, message: object) -> None:
+        """
+        Store a message, replacing any pending message with the same key.
+
+        Args:
+            message (object): The message to buffer.
+        """
+        key = self.key(message)
+
+        with self.lock:
+            entry = self.pending.get(key) if key is not None else None
+
+            if entry is not None:
+                entry[0] = message
+                entry[1] += 1
+                self.conflated += 1
+                return
+
+            self.pending[key if key is not None else object()] = [message, 0]
+            self.not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """
+        Remove and return the latest message of the oldest pending instrument.
+
+        Args:
+            block (bool): Wait for a message if the channel is empty.
+            timeout (Optional[float]): Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            object: The newest message for the instrument.
+
+        Raises:
+            queue.Empty: If no message is available in time.
+        """
+        with self.lock:
+            if not self.pending:
+                if not block:
+                    raise queue.Empty
+                if not self.not_empty.wait_for(lambda: self.pending, timeout):
+                    raise queue.Empty
+
+            _, (message, merged) = self.pending.popitem(last=False)
+
+        if (
+            merged
+            and dataclasses.is_dataclass(message)
+            and hasattr(message, "merged")
+        ):
+            message = dataclasses.replace(message, merged=merged)
+
+        return message
+
+    def empty(self) -> bool:
+        return not self.pending
+
+    def qsize(self) -> int:
+        return len(self.pending)
+
+
 class MessageBus:
-    def __init__(self):
-        self.topics = {
-            EventType.DATA: queue.Queue(),
-            EventType.ORDER_BOOK: queue.Queue(),
-            EventType.SIGNAL: queue.Queue(),
-            EventType.ORDER: queue.Queue(),
-            EventType.TRADE: queue.Queue(),
-            EventType.ROLLOVER: queue.Queue(),
-            EventType.TRADE_COMMISSION_UPDATE: queue.Queue(),
-            EventType.SIGNAL_UPDATE: queue.Queue(),
-            EventType.POSITION_UPDATE: queue.Queue(),
-            EventType.ORDER_UPDATE: queue.Queue(),
-            EventType.ACCOUNT_UPDATE: queue.Queue(),
-            EventType.ACCOUNT_UPDATE_LOG: queue.Queue(),
-            EventType.EQUITY_UPDATE: queue.Queue(),
-            EventType.TRADE_UPDATE: queue.Queue(),
+    """
+    Routes messages between the engines and adapters of the trading system.
+
+    Queue-based topics carry event streams and fan out to their subscribers:
+    each call to `subscribe` returns a new `Channel` and a publish appends a
+    reference to the message to every subscriber's channel, so components can
+    consume the same stream without extra topics. The subscriber list is copied
+    on write under the bus lock, which lets `publish` read it without locking.
+    A channel only receives messages published after it was created, so
+    components must subscribe before the publishers start. Messages published
+    to a topic with no subscribers are dropped and counted, see
+    `overflow_counts`. Flag-based
+    topics hold a single shared value used for handshakes and are guarded by
+    the bus lock and its condition variable.
+
+    Channels are unbounded unless a capacity is given, either as the default
+    for the market data topics, see `MARKET_DATA_TOPICS`, or per topic through
+    `configure`. Control topics such as orders, fills and position updates stay
+    unbounded and blocking, since losing or delaying one of their messages would
+    corrupt the run.
+
+    Args:
+        capacity (Optional[int]): Default capacity of market data channels, None for unbounded.
+        policy (OverflowPolicy): Default overflow policy of market data channels.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
+        self.capacity = capacity
+        self.policy = policy
+        self.settings: Dict[
+            EventType, Tuple[Optional[int], OverflowPolicy]
+        ] = {}
+        self.subscribers: Dict[EventType, Tuple[Channel, ...]] = {
+            topic: ()
+            for topic in (
+                EventType.DATA,
+                EventType.ORDER_BOOK,
+                EventType.SIGNAL,
+                EventType.ORDER,
+                EventType.TRADE,
+                EventType.ROLLOVER,
+                EventType.TRADE_COMMISSION_UPDATE,
+                EventType.POSITION_UPDATE,
+                EventType.ORDER_UPDATE,
+                EventType.ACCOUNT_UPDATE,
+                EventType.EQUITY_UPDATE,
+                EventType.TRADE_UPDATE,
+            )
+        }
+        self.flags: Dict[EventType, object] = {
             EventType.INITIAL_DATA: False,
             EventType.ORDER_BOOK_UPDATED: False,
             EventType.OB_PROCESSED: False,
@@ -80,59 +395,214 @@ class MessageBus:
             EventType.OB_ROLLED: False,
         }
 
+        self.unrouted: Dict[EventType, int] = {
+            topic: 0 for topic in self.subscribers
+        }
+
         self.lock = threading.Lock()
+        self.flag_updated = threading.Condition(self.lock)
+
+    def configure(
+        self,
+        topic: EventType,
+        capacity: Optional[int],
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """
+        Set the capacity and overflow policy of channels later subscribed to a topic.
+
+        Args:
+            topic (EventType): The queue-based topic to configure.
+            capacity (Optional[int]): Channel capacity, None for unbounded.
+            policy (OverflowPolicy): Behaviour when a channel is full.
 
-    def subscribe(self, topic: EventType):
+        Raises:
+            ValueError: If the topic is not queue-based, or is a control topic given
+                a capacity or a policy other than BLOCK.
+        """
+        if topic not in self.subscribers:
+            raise ValueError(f"Topic '{topic}' is not a queue-based topic.")
+
+        if topic not in MARKET_DATA_TOPICS and (
+            capacity is not None or policy is not OverflowPolicy.BLOCK
+        ):
+            raise ValueError(
+                f"Topic '{topic}' is a control topic, only market data "
+                "topics can be bounded or drop messages."
+            )
+
+        self.settings[topic] = (capacity, policy)
+
+    def topic_settings(
+        self, topic: EventType
+    ) -> Tuple[Optional[int], OverflowPolicy]:
+        """
+        Capacity and overflow policy of channels subscribed to a topic.
+
+        Args:
+            topic (EventType): The queue-based topic.
+
+        Returns:
+            Tuple[Optional[int], OverflowPolicy]: The configured settings, else the
+                bus defaults for market data topics and unbounded BLOCK otherwise.
+        """
+        if topic in self.settings:
+            return self.settings[topic]
+
+        if topic in MARKET_DATA_TOPICS:
+            return self.capacity, self.policy
+
+        return None, OverflowPolicy.BLOCK
+
+    def subscribe(
+        self,
+        topic: EventType,
+        capacity: Optional[int] = None,
+        policy: Optional[OverflowPolicy] = None,
+    ):
         """
         Subscribe to a topic.
-        For queue-based topics: Returns the queue itself.
+        For queue-based topics: Returns a new channel receiving every message
+            published to the topic from now on.
         For flag-based topics: Returns the current flag value.
+
+        Args:
+            topic (EventType): The topic to subscribe to.
+            capacity (Optional[int]): Channel capacity, defaults to the topic setting.
+            policy (Optional[OverflowPolicy]): Overflow policy, defaults to the topic setting.
         """
+        if topic not in self.subscribers:
+            return self.get_flag(topic)
+
+        default_capacity, default_policy = self.topic_settings(topic)
+        policy = policy if policy is not None else default_policy
+
+        if policy is OverflowPolicy.LATEST:
+            channel = ConflatingChannel()
+        else:
+            channel = Channel(
+                capacity if capacity is not None else default_capacity,
+                policy,
+            )
+
         with self.lock:
-            if topic not in self.topics:
-                raise ValueError(f"Topic '{topic}' is not defined.")
+            self.subscribers[topic] = self.subscribers[topic] + (channel,)
 
-            if isinstance(self.topics[topic], queue.Queue):
-                return self.topics[topic]  # Return the queue
-            else:
-                return self.topics[topic]  # Return the current flag value
+        return channel
 
     def publish(self, topic: EventType, message: object) -> None:
         """
         Publish a message to a topic.
-        For queue-based topics: Adds the message to the queue.
+        For queue-based topics: Adds the message to every subscriber's channel,
+            counting it as unrouted if there are none.
         For flag-based topics: Updates the shared flag value.
         """
+        channels = self.subscribers.get(topic)
+
+        # Queue-based topic
+        if channels is not None:
+            if not channels:
+                with self.lock:
+                    self.unrouted[topic] += 1
+
+            for channel in channels:
+                channel.put(message)
+            return
+
+        # Flag-based topic
         with self.lock:
-            if topic not in self.topics:
+            if topic not in self.flags:
                 raise ValueError(f"Topic '{topic}' is not defined.")
 
-            if isinstance(self.topics[topic], queue.Queue):
-                # Queue-based topic
-                self.topics[topic].put(message)
-            else:
-                # Flag-based topic
-                self.topics[topic] = message
+            self.flags[topic] = message
+            self.flag_updated.notify_all()
 
     def get_flag(self, topic: EventType) -> object:
         """
         Get the current value of a flag-based topic.
         """
         with self.lock:
-            if topic not in self.topics or isinstance(
-                self.topics[topic], queue.Queue
-            ):
+            if topic not in self.flags:
                 raise ValueError(f"Topic '{topic}' is not a flag-based topic.")
-            return self.topics[topic]
+            return self.flags[topic]
+
+    def wait_for_flag(
+        self,
+        topic: EventType,
+        value: object,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Block until a flag-based topic equals the given value.
+
+        Waiting threads sleep on a condition variable and are woken whenever
+        a flag is published, rather than polling `get_flag`.
+
+        Args:
+            topic (EventType): The flag-based topic to wait on.
+            value (object): The value the flag must hold to stop waiting.
+            timeout (Optional[float]): Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            bool: True if the flag holds the value, False if the timeout expired.
+        """
+        return self.wait_for_any({topic: value}, timeout) is not None
+
+    def wait_for_any(
+        self,
+        flags: Dict[EventType, object],
+        timeout: Optional[float] = None,
+    ) -> Optional[EventType]:
+        """
+        Block until any of the given flag-based topics equals its expected value.
+
+        Args:
+            flags (Dict[EventType, object]): Mapping of flag topics to the values being waited for.
+            timeout (Optional[float]): Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            Optional[EventType]: The first topic (in mapping order) holding its value,
+                or None if the timeout expired.
+        """
+        for topic in flags:
+            if topic not in self.flags:
+                raise ValueError(f"Topic '{topic}' is not a flag-based topic.")
+
+        def matched() -> Optional[EventType]:
+            for topic, value in flags.items():
+                if self.flags[topic] == value:
+                    return topic
+            return None
+
+        with self.flag_updated:
+            self.flag_updated.wait_for(lambda: matched() is not None, timeout)
+            return matched()
 
     def is_queue_empty(self, topic: EventType) -> bool:
-        with self.lock:
-            if topic not in self.topics:
-                raise ValueError(f"Topic '{topic} is not defined.")
+        """
+        Check whether every subscriber has consumed a queue-based topic.
+        """
+        channels = self.subscribers.get(topic)
+
+        if channels is None:
+            raise ValueError(f"Topic '{topic}' is not a queue-based topic.")
 
-            if not isinstance(self.topics[topic], queue.Queue):
-                raise ValueError(
-                    f"Topic '{topic}' is not a queue-based topic."
-                )
+        return all(channel.empty() for channel in channels)
 
-            return self.topics[topic].empty()
+    def overflow_counts(self) -> Dict[EventType, Dict[str, int]]:
+        """
+        Messages lost or conflated on each queue-based topic.
+
+        Returns:
+            Dict[EventType, Dict[str, int]]: Totals keyed by topic, with "dropped"
+                and "conflated" counts summed across subscribers, and "unrouted"
+                messages published while the topic had no subscribers.
+        """
+        return {
+            topic: {
+                "dropped": sum(channel.dropped for channel in channels),
+                "conflated": sum(channel.conflated for channel in channels),
+                "unrouted": self.unrouted[topic],
+            }
+            for topic, channels in self.subscribers.items()
+        }
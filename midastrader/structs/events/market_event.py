@@ -17,11 +17,14 @@ class MarketEvent(SystemEvent):
         timestamp (int): The UNIX timestamp in nanoseconds indicating when the market data was received.
         data (Union[OhlcvMsg, BboMsg]): Market data message, which can be either OHLCV or BBO.
         type (str): Event type, automatically set to 'MARKET_DATA'.
+        merged (int): Number of earlier updates for the instrument superseded by this one
+            on a conflating channel before it was delivered.
     """
 
     timestamp: int
     data: RecordMsg
     type: str = field(init=False, default="MARKET_DATA")
+    merged: int = 0
 
     def __post_init__(self):
         """
@@ -35,6 +38,8 @@ class MarketEvent(SystemEvent):
             raise TypeError("'timestamp' must be of type int.")
         if not RecordMsg.is_record(self.data):
             raise TypeError("'data' must be of type RecordMsg.")
+        if not isinstance(self.merged, int):
+            raise TypeError("'merged' must be of type int.")
 
     def __str__(self) -> str:
         """
@@ -3,10 +3,10 @@ from typing import Optional, Dict, List
 from ibapi.contract import Contract
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import time, datetime
+from datetime import time
 
 from midastrader.structs.orders import Action
-from midastrader.utils.unix import unix_to_iso
+from midastrader.utils.session import session_calendar
 
 
 # -- Symbol Details --
@@ -436,14 +436,9 @@ class Symbol(ABC):
         Returns:
             bool: True if the timestamp is after the session close time.
         """
-        dt = datetime.fromisoformat(
-            unix_to_iso(timestamp_ns, tz_info="America/New_York")
+        return session_calendar.after_close(
+            timestamp_ns, self.trading_sessions.day_close
         )
-        time = dt.time()
-
-        if self.trading_sessions.day_close < time:
-            return True
-        return False
 
     def in_day_session(self, timestamp_ns: int) -> bool:
         """
@@ -455,14 +450,10 @@ class Symbol(ABC):
         Returns:
             bool: True if the timestamp falls within the session open and close times.
         """
-        dt = datetime.fromisoformat(
-            unix_to_iso(timestamp_ns, tz_info="America/New_York")
-        )
-
-        return (
-            self.trading_sessions.day_open
-            <= dt.time()
-            <= self.trading_sessions.day_close
+        return session_calendar.in_session(
+            timestamp_ns,
+            self.trading_sessions.day_open,
+            self.trading_sessions.day_close,
         )
 
     @abstractmethod
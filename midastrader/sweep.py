@@ -0,0 +1,242 @@
+import os
+import copy
+import toml
+import itertools
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from midastrader.config import Mode
+from midastrader.data.adaptors.historical.merge import expand_data_files
+from midastrader.core.adapters.performance.export import (
+    OutputFormat,
+    table_path,
+    write_excel,
+    write_table,
+)
+
+
+def flatten_grid(grid: dict, prefix: str = "") -> Dict[str, list]:
+    """
+    Flatten a nested parameter grid into dotted configuration keys.
+
+    The grid mirrors the layout of the configuration file, with a list of values at
+    each swept setting, e.g. `{"strategy": {"parameters": {"capital": [1, 2]}}}`.
+
+    Args:
+        grid (dict): Nested grid loaded from TOML.
+        prefix (str): Key prefix of the current level.
+
+    Returns:
+        Dict[str, list]: Values keyed by dotted key, e.g. 'strategy.parameters.capital'.
+
+    Raises:
+        ValueError: If a setting is not given a non-empty list of values.
+    """
+    axes = {}
+
+    for key, value in grid.items():
+        path = f"{prefix}{key}"
+
+        if isinstance(value, dict):
+            axes.update(flatten_grid(value, f"{path}."))
+        elif isinstance(value, list) and value:
+            axes[path] = value
+        else:
+            raise ValueError(f"Grid values for '{path}' must be a list.")
+
+    return axes
+
+
+def expand_grid(grid: dict) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into every combination of its values.
+
+    Args:
+        grid (dict): Nested grid loaded from TOML, see `flatten_grid`.
+
+    Returns:
+        List[Dict[str, Any]]: One mapping of dotted key to value per variant.
+    """
+    axes = flatten_grid(grid)
+    keys = list(axes)
+
+    return [
+        dict(zip(keys, values)) for values in itertools.product(*axes.values())
+    ]
+
+
+def apply_overrides(config_dict: dict, overrides: Dict[str, Any]) -> dict:
+    """
+    Apply dotted-key overrides to a copy of a configuration dictionary.
+
+    Args:
+        config_dict (dict): Configuration loaded from TOML.
+        overrides (Dict[str, Any]): Values keyed by dotted key.
+
+    Returns:
+        dict: The updated copy.
+    """
+    config_dict = copy.deepcopy(config_dict)
+
+    for key, value in overrides.items():
+        *tables, name = key.split(".")
+        section = config_dict
+
+        for table in tables:
+            section = section.setdefault(table, {})
+
+        section[name] = value
+
+    return config_dict
+
+
+def write_variants(
+    config_dict: dict,
+    variants: List[Dict[str, Any]],
+    output_path: str,
+) -> List[str]:
+    """
+    Write the configuration file of each variant into its own output directory.
+
+    Each variant writes its results and log under `<output_path>run_<n>/`, next to
+    the configuration it was run with. Variants do not upload their results to the
+    database, so a study neither depends on it nor fills it with one backtest per run.
+
+    Args:
+        config_dict (dict): Base configuration loaded from TOML.
+        variants (List[Dict[str, Any]]): Overrides of each variant.
+        output_path (str): Directory the run directories are created in.
+
+    Returns:
+        List[str]: Paths of the variant configuration files.
+    """
+    paths = []
+
+    for i, overrides in enumerate(variants):
+        run_path = os.path.join(output_path, f"run_{i}", "")
+        os.makedirs(run_path, exist_ok=True)
+
+        variant = apply_overrides(config_dict, overrides)
+        general = variant.setdefault("general", {})
+        general["output_path"] = run_path
+        general["upload_results"] = False
+
+        path = os.path.join(run_path, "config.toml")
+        with open(path, "w") as f:
+            toml.dump(variant, f)
+
+        paths.append(path)
+
+    return paths
+
+
+def shared_data_files(config_dict: dict) -> List[str]:
+    """
+    Data files the runs of a study can share, those of a memory-mapped historical vendor.
+
+    Args:
+        config_dict (dict): Base configuration loaded from TOML.
+
+    Returns:
+        List[str]: The data file paths, empty if none are shared.
+    """
+    historical = config_dict.get("vendor", {}).get("historical")
+
+    if not historical or not historical.get("memory_map"):
+        return []
+
+    return expand_data_files(historical.get("data_file", ""))
+
+
+def _init_worker(paths: List[str]) -> None:
+    from midastrader.data.adaptors.historical.data_client import (
+        share_data_files,
+    )
+
+    share_data_files(paths)
+
+
+def _run_backtest(config_path: str) -> Dict[str, Any]:
+    from midastrader.engine import EngineBuilder
+
+    engine = EngineBuilder(config_path, Mode.BACKTEST).build()
+    engine.initialize()
+    engine.start()
+    engine.wait_for_results()
+
+    performance_manager = engine.core_engine.adapters["performance_manager"]
+    return performance_manager.static_stats
+
+
+def run_sweep(
+    config_path: str,
+    grid_path: str,
+    workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Backtest every combination of a parameter grid applied to a base configuration.
+
+    Variants run in parallel on a process pool. Unless the base configuration says
+    otherwise, the historical data files are memory-mapped once per worker process
+    and every run in the worker replays its own view of the mapping, so the data is
+    loaded once per worker and read from the shared page cache. Each run still builds
+    its own engine and symbols map from its configuration. A variant that fails is
+    recorded with its error rather than stopping the sweep.
+
+    The results table, with one row per variant of its swept values and static
+    statistics, is written to `<output_path>sweep` in the base output format.
+
+    Args:
+        config_path (str): Path to the base configuration file.
+        grid_path (str): Path to the TOML parameter grid, see `flatten_grid`.
+        workers (Optional[int]): Number of worker processes, the CPU count if None.
+
+    Returns:
+        pd.DataFrame: The results table.
+    """
+    with open(config_path, "r") as f:
+        config_dict = toml.load(f)
+
+    with open(grid_path, "r") as f:
+        variants = expand_grid(toml.load(f))
+
+    general = config_dict.get("general", {})
+    output_path = general.get("output_path", "")
+    output_format = OutputFormat.from_string(
+        general.get("output_format", "xlsx")
+    )
+    historical = config_dict.get("vendor", {}).get("historical")
+
+    if historical is not None:
+        historical.setdefault("memory_map", True)
+
+    paths = write_variants(config_dict, variants, output_path)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(shared_data_files(config_dict),),
+    ) as executor:
+        futures = [executor.submit(_run_backtest, path) for path in paths]
+
+        rows = []
+        for i, (overrides, future) in enumerate(zip(variants, futures)):
+            row = {"run": i, **overrides}
+
+            try:
+                row.update(future.result())
+            except Exception as e:
+                row["error"] = repr(e)
+
+            rows.append(row)
+
+    results = pd.DataFrame(rows)
+
+    if output_format == OutputFormat.XLSX:
+        write_excel({"Sweep": results}, f"{output_path}sweep.xlsx")
+    else:
+        path = table_path(output_path, "Sweep", output_format)
+        write_table(results, path, output_format)
+
+    return results
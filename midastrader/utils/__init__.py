@@ -1,6 +1,14 @@
 # from .date_adjust import adjust_to_business_time
 from .logger import SystemLogger
-from .unix import iso_to_unix, unix_to_iso, unix_to_date, resample_timestamp
+from .unix import (
+    iso_to_unix,
+    unix_to_iso,
+    unix_to_date,
+    unix_to_datetime,
+    datetime_to_unix,
+    resample_timestamp,
+)
+from .session import SessionCalendar, session_calendar
 
 # Public API of the 'events' module
 __all__ = [
@@ -9,5 +17,9 @@ __all__ = [
     "iso_to_unix",
     "unix_to_date",
     "unix_to_iso",
+    "unix_to_datetime",
+    "datetime_to_unix",
     "resample_timestamp",
+    "SessionCalendar",
+    "session_calendar",
 ]
@@ -3,15 +3,21 @@ import logging
 import threading
 import time
 from queue import PriorityQueue
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
 
 class SystemLogger:
     """
-    A singleton logger class for logging messages to a file, terminal, or both.
+    A logger class for logging messages to a file, terminal, or both.
 
     This class initializes a logger instance that can output logs to a file, terminal, or both,
-    based on the specified configuration. It ensures that only one logger instance exists throughout
-    the application.
+    based on the specified configuration. Each engine creates its own instance, so engines
+    sharing a process log independently.
+
+    Components look up the logger with `get_logger`, which returns the instance activated on
+    the current thread with `activate`, or else the process default: the earliest instance
+    created that has not been stopped.
 
     Args:
         name (str, optional): Name of the logger. Defaults to "system".
@@ -20,13 +26,19 @@ class SystemLogger:
         level (int, optional): Logging level (e.g., logging.INFO). Defaults to logging.INFO.
 
     Methods:
-        get_logger(): Returns the singleton logger instance.
+        activate(): Makes the instance the current logger of the calling thread.
+        stop(): Flushes the buffer and releases the flusher thread and handlers.
+        current(): Returns the current logger instance.
+        get_logger(): Returns the current logger.
     """
 
-    _instance = None
+    _instance: Optional["SystemLogger"] = None  # Process default
+    _open: List["SystemLogger"] = []  # Instances not stopped, oldest first
+    _lock = threading.Lock()
+    _local = threading.local()
 
-    def __new__(
-        cls,
+    def __init__(
+        self,
         name="system",
         output_format="file",
         output_file_path="output/",
@@ -34,17 +46,20 @@ class SystemLogger:
         flush_interval=1.0,
         buffer_size=100,
     ):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize(
-                name,
-                output_format,
-                output_file_path,
-                level,
-                flush_interval,
-                buffer_size,
-            )
-        return cls._instance
+        self._initialize(
+            name,
+            output_format,
+            output_file_path,
+            level,
+            flush_interval,
+            buffer_size,
+        )
+
+        with SystemLogger._lock:
+            SystemLogger._open.append(self)
+
+            if SystemLogger._instance is None:
+                SystemLogger._instance = self
 
     def _initialize(
         self,
@@ -64,7 +79,9 @@ class SystemLogger:
             output_file_path (str): Path to store log files.
             level (int): Logging level.
         """
-        self.logger = logging.getLogger(f"{name}_logger")
+        # Not registered by name, so instances never share handlers
+        self.logger = logging.Logger(f"{name}_logger")
+        self.logger.parent = logging.getLogger()
         self.logger.setLevel(level)
         self.flush_interval = flush_interval
         self.buffer_size = buffer_size
@@ -130,8 +147,7 @@ class SystemLogger:
         """
         Background thread that periodically flushes the buffer.
         """
-        while not self.stop_event.is_set():
-            time.sleep(self.flush_interval)
+        while not self.stop_event.wait(self.flush_interval):
             self._flush()
 
     def _flush(self):
@@ -145,25 +161,85 @@ class SystemLogger:
 
     def stop(self):
         """
-        Stop the background flusher thread and flush any remaining logs.
+        Stop the background flusher thread, flush any remaining logs and close the handlers.
+
+        If this instance is the process default, the earliest instance still open takes
+        its place. Calling it again has no effect.
         """
+        if self.stop_event.is_set():
+            return
+
+        with SystemLogger._lock:
+            if self in SystemLogger._open:
+                SystemLogger._open.remove(self)
+
+            if SystemLogger._instance is self:
+                SystemLogger._instance = (
+                    SystemLogger._open[0] if SystemLogger._open else None
+                )
+
         self.stop_event.set()
         self.flusher_thread.join()
         self._flush()
 
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    @contextmanager
+    def activate(self) -> Iterator["SystemLogger"]:
+        """
+        Make this instance the current logger of the calling thread.
+
+        Components created inside the block log through this instance.
+
+        Yields:
+            SystemLogger: This instance.
+        """
+        stack = SystemLogger._stack()
+        stack.append(self)
+        try:
+            yield self
+        finally:
+            stack.pop()
+
     @classmethod
-    def get_logger(cls):
+    def _stack(cls) -> List["SystemLogger"]:
+        if not hasattr(cls._local, "stack"):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def current(cls) -> "SystemLogger":
         """
-        Retrieve the singleton logger instance.
+        Retrieve the logger instance activated on the calling thread, or the process default.
 
         Returns:
-            logging.Logger: The initialized logger instance.
+            SystemLogger: The current instance.
 
         Raises:
             RuntimeError: If the logger has not been initialized.
         """
+        stack = cls._stack()
+
+        if stack:
+            return stack[-1]
+
         if cls._instance is None:
             raise RuntimeError(
                 "SystemLogger is not initialized. Call the constructor first."
             )
-        return cls._instance.logger
+        return cls._instance
+
+    @classmethod
+    def get_logger(cls):
+        """
+        Retrieve the current logger, see `current`.
+
+        Returns:
+            logging.Logger: The initialized logger instance.
+
+        Raises:
+            RuntimeError: If the logger has not been initialized.
+        """
+        return cls.current().logger
@@ -0,0 +1,162 @@
+import pytz
+from typing import Dict, Tuple
+from datetime import date, datetime, time, timedelta
+
+
+class SessionCalendar:
+    """
+    Converts nanosecond timestamps to local trading dates and session boundaries.
+
+    Boundaries are computed once per date in the calendar's timezone, which makes
+    them DST-aware, and cached so that date lookups and session checks reduce to
+    integer comparisons instead of formatting and parsing ISO strings for every
+    record.
+
+    Attributes:
+        tz (pytz.BaseTzInfo): Timezone trading dates and session times are expressed in.
+        days (Dict[date, Tuple[int, int]]): Start (inclusive) and end (exclusive) of each
+            cached date in nanoseconds.
+        boundaries (Dict[Tuple[date, time], int]): Session open and close times in
+            nanoseconds keyed by local date and time.
+    """
+
+    def __init__(self, tz_info: str = "America/New_York"):
+        """
+        Initialize the calendar for a timezone.
+
+        Args:
+            tz_info (str): Timezone name (e.g., 'America/New_York').
+        """
+        self.tz = pytz.timezone(tz_info)
+        self.days: Dict[date, Tuple[int, int]] = {}
+        self.boundaries: Dict[Tuple[date, time], int] = {}
+        self._current: Tuple[int, int, date] = (0, 0, date.min)
+
+    def _to_unix(self, day: date, at: time) -> int:
+        """
+        Convert a local date and time to a UNIX timestamp in nanoseconds.
+        """
+        dt = self.tz.localize(datetime.combine(day, at))
+        return round(dt.timestamp() * 1e6) * 1000
+
+    def day_bounds(self, day: date) -> Tuple[int, int]:
+        """
+        Get the nanosecond range covered by a local date.
+
+        Args:
+            day (date): The local date.
+
+        Returns:
+            Tuple[int, int]: Start (inclusive) and end (exclusive) of the date.
+        """
+        bounds = self.days.get(day)
+
+        if bounds is None:
+            bounds = (
+                self._to_unix(day, time.min),
+                self._to_unix(day + timedelta(days=1), time.min),
+            )
+            self.days[day] = bounds
+
+        return bounds
+
+    def trading_date(self, timestamp_ns: int) -> date:
+        """
+        Get the local date of a timestamp.
+
+        Args:
+            timestamp_ns (int): UNIX timestamp in nanoseconds.
+
+        Returns:
+            date: The date of the timestamp in the calendar's timezone.
+        """
+        start, end, day = self._current
+
+        if start <= timestamp_ns < end:
+            return day
+
+        day = datetime.fromtimestamp(timestamp_ns / 1e9, tz=self.tz).date()
+        start, end = self.day_bounds(day)
+
+        # Float conversion can land on the wrong side of midnight
+        if timestamp_ns < start:
+            day -= timedelta(days=1)
+        elif timestamp_ns >= end:
+            day += timedelta(days=1)
+
+        start, end = self.day_bounds(day)
+        self._current = (start, end, day)
+        return day
+
+    def boundary(self, day: date, at: time) -> int:
+        """
+        Get the nanosecond timestamp of a local time on a local date.
+
+        Args:
+            day (date): The local date.
+            at (time): The local time, such as a session open or close.
+
+        Returns:
+            int: UNIX timestamp in nanoseconds.
+        """
+        key = (day, at)
+        boundary = self.boundaries.get(key)
+
+        if boundary is None:
+            boundary = self._to_unix(day, at)
+            self.boundaries[key] = boundary
+
+        return boundary
+
+    def session_bounds(
+        self,
+        day: date,
+        open: time,
+        close: time,
+    ) -> Tuple[int, int]:
+        """
+        Get the nanosecond open and close of a session on a local date.
+
+        Args:
+            day (date): The local date.
+            open (time): Session open time.
+            close (time): Session close time.
+
+        Returns:
+            Tuple[int, int]: Session open and close in nanoseconds.
+        """
+        return self.boundary(day, open), self.boundary(day, close)
+
+    def after_close(self, timestamp_ns: int, close: time) -> bool:
+        """
+        Check if a timestamp is after the session close of its local date.
+
+        Args:
+            timestamp_ns (int): UNIX timestamp in nanoseconds.
+            close (time): Session close time.
+
+        Returns:
+            bool: True if the timestamp is after the close.
+        """
+        day = self.trading_date(timestamp_ns)
+        return timestamp_ns > self.boundary(day, close)
+
+    def in_session(self, timestamp_ns: int, open: time, close: time) -> bool:
+        """
+        Check if a timestamp falls within the session of its local date.
+
+        Args:
+            timestamp_ns (int): UNIX timestamp in nanoseconds.
+            open (time): Session open time.
+            close (time): Session close time.
+
+        Returns:
+            bool: True if the timestamp is between the open and close, inclusive.
+        """
+        day = self.trading_date(timestamp_ns)
+        open_ns, close_ns = self.session_bounds(day, open, close)
+        return open_ns <= timestamp_ns <= close_ns
+
+
+# Shared calendar for sessions quoted in exchange (New York) time
+session_calendar = SessionCalendar()
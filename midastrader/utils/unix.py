@@ -1,4 +1,5 @@
 import pytz
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone, date
 
@@ -91,13 +92,55 @@ def unix_to_date(unix_timestamp: int, tz_info="UTC") -> date:
         return dt_utc.date()
 
 
+def unix_to_datetime(timestamps, tz_info: str = "UTC"):
+    """
+    Convert UNIX timestamps in nanoseconds to timezone-aware datetimes in one vectorized pass.
+
+    Args:
+        timestamps (Union[pd.Series, pd.Index, np.ndarray]): UNIX timestamps in nanoseconds.
+        tz_info (str, optional): Timezone name for the result. Defaults to 'UTC'.
+
+    Returns:
+        Union[pd.Series, pd.DatetimeIndex]: Datetimes in the given timezone, a Series if
+            a Series was given, otherwise a DatetimeIndex.
+    """
+    datetimes = pd.to_datetime(timestamps, unit="ns", utc=True)
+
+    if tz_info == "UTC":
+        return datetimes
+
+    if isinstance(datetimes, pd.Series):
+        return datetimes.dt.tz_convert(tz_info)
+    return datetimes.tz_convert(tz_info)
+
+
+def datetime_to_unix(datetimes) -> np.ndarray:
+    """
+    Convert datetimes to UNIX timestamps in nanoseconds in one vectorized pass.
+
+    Naive datetimes are assumed to be in UTC.
+
+    Args:
+        datetimes (Union[pd.Series, pd.Index, np.ndarray]): Datetimes to convert.
+
+    Returns:
+        np.ndarray: UNIX timestamps in nanoseconds as int64.
+    """
+    index = pd.DatetimeIndex(datetimes)
+
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+
+    return index.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
 def _convert_timestamp(
     df: pd.DataFrame,
     column: str = "timestamp",
     tz_info: str = "UTC",
 ) -> None:
     """
-    Convert a DataFrame column of UNIX timestamps to ISO 8601 formatted strings.
+    Convert a DataFrame column of UNIX timestamps to timezone-aware datetimes.
 
     Args:
         df (pd.DataFrame): The DataFrame containing the timestamp column.
@@ -107,9 +150,7 @@ def _convert_timestamp(
     Returns:
         None: Modifies the DataFrame in place.
     """
-    df[column] = pd.to_datetime(
-        df[column].map(lambda x: unix_to_iso(x, tz_info))
-    )
+    df[column] = unix_to_datetime(df[column], tz_info)
 
 
 def resample_timestamp(df: pd.DataFrame, interval: str = "D", tz_info="UTC"):
@@ -124,15 +165,8 @@ def resample_timestamp(df: pd.DataFrame, interval: str = "D", tz_info="UTC"):
     Returns:
         pd.DataFrame: A resampled DataFrame with the specified frequency.
     """
-    utc = True
-
-    if tz_info != "UTC":
-        utc = False
-
     # Convert index to readable datetime
-    df.index = pd.to_datetime(
-        df.index.map(lambda x: unix_to_iso(x, tz_info)), utc=utc
-    )
+    df.index = unix_to_datetime(df.index, tz_info)
 
     # Store original UNIX timestamps before resampling
     original_timestamps = df.index.to_series().resample(interval).last()
@@ -145,9 +179,8 @@ def resample_timestamp(df: pd.DataFrame, interval: str = "D", tz_info="UTC"):
     daily_df.dropna(inplace=True)
 
     # Restore original UNIX timestamps
-    daily_df.index = original_timestamps.map(
-        lambda x: iso_to_unix(x.isoformat())
+    daily_df.index = pd.Index(
+        datetime_to_unix(original_timestamps), name="timestamp"
     )
-    daily_df.index.name = "timestamp"
 
     return daily_df
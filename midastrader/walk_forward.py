@@ -0,0 +1,340 @@
+import toml
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from midastrader.config import Mode
+from midastrader.sweep import (
+    _init_worker,
+    expand_grid,
+    shared_data_files,
+    write_variants,
+)
+from midastrader.core.adapters.performance.export import (
+    OutputFormat,
+    table_path,
+    write_excel,
+    write_table,
+)
+
+
+def walk_forward_windows(
+    start: str,
+    end: str,
+    train_days: int,
+    test_days: int,
+    step_days: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """
+    Split a period into consecutive train and test windows.
+
+    Each test window directly follows its train window, and each window starts
+    `step_days` after the previous one. The last test window is cut at `end`.
+    Boundaries keep the format of `start`, dates stay dates and datetimes stay
+    datetimes.
+
+    Args:
+        start (str): Start of the period in ISO format.
+        end (str): End of the period in ISO format.
+        train_days (int): Length of each train window in days, 0 for none.
+        test_days (int): Length of each test window in days.
+        step_days (Optional[int]): Days between window starts, `test_days` if None.
+
+    Returns:
+        List[Dict[str, str]]: The `train_start`, `train_end`, `test_start` and `test_end` of each window.
+
+    Raises:
+        ValueError: If a length is out of range or no window fits in the period.
+    """
+    step_days = test_days if step_days is None else step_days
+
+    if train_days < 0:
+        raise ValueError("'train_days' must be a non-negative integer.")
+    if test_days < 1 or step_days < 1:
+        raise ValueError("'test_days' and 'step_days' must be positive.")
+
+    date_only = len(start) == 10
+    first = datetime.fromisoformat(start)
+    last = datetime.fromisoformat(end)
+
+    def iso(value: datetime) -> str:
+        return value.date().isoformat() if date_only else value.isoformat()
+
+    windows = []
+    train_start = first
+
+    while True:
+        test_start = train_start + timedelta(days=train_days)
+
+        if test_start >= last:
+            break
+
+        test_end = min(test_start + timedelta(days=test_days), last)
+        windows.append(
+            {
+                "train_start": iso(train_start),
+                "train_end": iso(test_start),
+                "test_start": iso(test_start),
+                "test_end": end if test_end == last else iso(test_end),
+            }
+        )
+        train_start += timedelta(days=step_days)
+
+    if not windows:
+        raise ValueError("No walk-forward window fits between start and end.")
+
+    return windows
+
+
+def stitch_equity(curves: List[pd.DataFrame], capital: float) -> pd.DataFrame:
+    """
+    Chain the equity curves of consecutive windows into one curve.
+
+    Each window restarts from its own capital, so its curve is rescaled to start
+    from the equity the previous window ended with, compounding the returns.
+
+    Args:
+        curves (List[pd.DataFrame]): Equity curves with an `equity_value` column and
+            `timestamp` index, as built by `EquityCurve.to_frame`, in window order.
+        capital (float): Equity the first window starts from.
+
+    Returns:
+        pd.DataFrame: The stitched curve, with an `equity_value` column and `timestamp` index.
+    """
+    pieces = []
+    equity = capital
+
+    for curve in curves:
+        if curve.empty:
+            continue
+
+        values = curve["equity_value"]
+        scaled = values / values.iloc[0] * equity
+        pieces.append(scaled.to_frame("equity_value"))
+        equity = scaled.iloc[-1]
+
+    if not pieces:
+        return pd.DataFrame(
+            {"equity_value": pd.Series(dtype=float)},
+            index=pd.Index([], name="timestamp", dtype="int64"),
+        )
+
+    return pd.concat(pieces)
+
+
+def _window_overrides(
+    start: str, end: str, overrides: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        **overrides,
+        "strategy.parameters.start": start,
+        "strategy.parameters.end": end,
+    }
+
+
+def _run_window(config_path: str) -> Dict[str, Any]:
+    from midastrader.engine import EngineBuilder
+
+    engine = EngineBuilder(config_path, Mode.BACKTEST).build()
+    engine.initialize()
+    engine.start()
+    engine.wait_for_results()
+
+    performance_manager = engine.core_engine.adapters["performance_manager"]
+    return {
+        "stats": performance_manager.static_stats,
+        "equity": performance_manager.equity_manager.equity_curve.to_frame(),
+    }
+
+
+def _collect(futures: list) -> List[Dict[str, Any]]:
+    results = []
+
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append({"error": repr(e)})
+
+    return results
+
+
+def _best_run(results: List[Dict[str, Any]], metric: str) -> Optional[int]:
+    best = None
+    best_score = None
+
+    for i, result in enumerate(results):
+        score = result.get("stats", {}).get(metric)
+
+        # Failed runs and NaN scores are never chosen
+        if score is None or score != score:
+            continue
+
+        if best_score is None or score > best_score:
+            best, best_score = i, score
+
+    return best
+
+
+def run_walk_forward(
+    config_path: str,
+    train_days: int,
+    test_days: int,
+    step_days: Optional[int] = None,
+    grid_path: Optional[str] = None,
+    metric: str = "sharpe_ratio",
+    workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Backtest a strategy over consecutive walk-forward windows of its period.
+
+    The period runs from the `start` to the `end` of the strategy parameters. With a
+    parameter grid, every variant is backtested on each train window and the one with
+    the highest `metric` is backtested on the following test window, otherwise the
+    base configuration is backtested on each test window.
+
+    Runs are independent, so the train runs of all windows, then their test runs,
+    execute in parallel on a process pool. Each worker memory-maps the historical data
+    once, and each run replays only its window of that mapping, seeking to its start,
+    so no run loads or maps the file again. Each run still builds its own engine and
+    symbols map. A run that fails is recorded with its error rather than stopping the
+    study.
+
+    Writes, under `output_path` and in the base output format, the `Walk Forward`
+    table with one row per window of its bounds, chosen values and test statistics,
+    the `Window Equity` curves of the test runs and their `Stitched Equity` curve.
+    Each run writes its own results under `<output_path>window_<n>/` and, like sweep
+    variants, does not upload them to the database.
+
+    Args:
+        config_path (str): Path to the base configuration file.
+        train_days (int): Length of each train window in days, 0 for none.
+        test_days (int): Length of each test window in days.
+        step_days (Optional[int]): Days between window starts, `test_days` if None.
+        grid_path (Optional[str]): Path to a TOML parameter grid optimized on the train windows.
+        metric (str): Static statistic maximized on the train windows.
+        workers (Optional[int]): Number of worker processes, the CPU count if None.
+
+    Returns:
+        pd.DataFrame: The `Walk Forward` table.
+
+    Raises:
+        ValueError: If a grid is given without train windows, or no window fits in the period.
+    """
+    with open(config_path, "r") as f:
+        config_dict = toml.load(f)
+
+    variants: List[Dict[str, Any]] = [{}]
+
+    if grid_path and not train_days:
+        raise ValueError("Optimizing a grid requires train windows.")
+
+    if grid_path:
+        with open(grid_path, "r") as f:
+            variants = expand_grid(toml.load(f))
+
+    general = config_dict.get("general", {})
+    output_path = general.get("output_path", "")
+    output_format = OutputFormat.from_string(
+        general.get("output_format", "xlsx")
+    )
+    parameters = config_dict["strategy"]["parameters"]
+    windows = walk_forward_windows(
+        parameters["start"],
+        parameters["end"],
+        train_days,
+        test_days,
+        step_days,
+    )
+    historical = config_dict.get("vendor", {}).get("historical")
+
+    if historical is not None:
+        historical.setdefault("memory_map", True)
+        historical["restrict_window"] = True
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(shared_data_files(config_dict),),
+    ) as executor:
+        chosen = [{} for _ in windows]
+
+        if grid_path:
+            train_paths = [
+                write_variants(
+                    config_dict,
+                    [
+                        _window_overrides(
+                            w["train_start"], w["train_end"], overrides
+                        )
+                        for overrides in variants
+                    ],
+                    f"{output_path}window_{i}/train/",
+                )
+                for i, w in enumerate(windows)
+            ]
+            train_futures = [
+                [executor.submit(_run_window, path) for path in paths]
+                for paths in train_paths
+            ]
+
+            for i, futures in enumerate(train_futures):
+                best = _best_run(_collect(futures), metric)
+
+                if best is not None:
+                    chosen[i] = variants[best]
+
+        test_paths = [
+            write_variants(
+                config_dict,
+                [_window_overrides(w["test_start"], w["test_end"], chosen[i])],
+                f"{output_path}window_{i}/test/",
+            )[0]
+            for i, w in enumerate(windows)
+        ]
+        test_results = _collect(
+            [executor.submit(_run_window, path) for path in test_paths]
+        )
+
+    rows = []
+    curves = []
+    window_curves = []
+
+    for i, (window, overrides, result) in enumerate(
+        zip(windows, chosen, test_results)
+    ):
+        row = {"window": i, **window, **overrides}
+        row.update(result.get("stats", {}))
+
+        if "error" in result:
+            row["error"] = result["error"]
+
+        rows.append(row)
+
+        if "equity" in result:
+            curves.append(result["equity"])
+            curve = result["equity"].reset_index()
+            curve.insert(0, "window", i)
+            window_curves.append(curve)
+
+    tables = {
+        "Walk Forward": pd.DataFrame(rows),
+        "Window Equity": (
+            pd.concat(window_curves, ignore_index=True)
+            if window_curves
+            else pd.DataFrame(columns=["window", "timestamp", "equity_value"])
+        ),
+        "Stitched Equity": stitch_equity(
+            curves, parameters["capital"]
+        ).reset_index(),
+    }
+
+    if output_format == OutputFormat.XLSX:
+        write_excel(tables, f"{output_path}walk_forward.xlsx")
+    else:
+        for name, df in tables.items():
+            path = table_path(output_path, name, output_format)
+            write_table(df, path, output_format)
+
+    return tables["Walk Forward"]
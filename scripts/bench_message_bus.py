@@ -0,0 +1,107 @@
+"""
+Microbenchmark for MessageBus publish throughput with concurrent publishers.
+
+Each publisher thread publishes to its own queue-based topic, mirroring the data
+and broker threads publishing DATA, EQUITY_UPDATE, ACCOUNT_UPDATE and
+POSITION_UPDATE during a backtest. Every topic has `--subscribers` channels, so
+each publish fans out to that many buffers.
+
+Usage:
+    python scripts/bench_message_bus.py --messages 200000 --publishers 1 2 4 8
+"""
+
+import time
+import argparse
+import threading
+from itertools import cycle
+from typing import List
+
+from midastrader.message_bus import MessageBus, EventType
+
+TOPICS = [
+    EventType.DATA,
+    EventType.EQUITY_UPDATE,
+    EventType.ACCOUNT_UPDATE,
+    EventType.POSITION_UPDATE,
+    EventType.ORDER_BOOK,
+    EventType.SIGNAL,
+    EventType.TRADE_UPDATE,
+    EventType.ORDER_UPDATE,
+]
+
+
+def run(publishers: int, messages: int, subscribers: int = 1) -> float:
+    """
+    Publish `messages` messages from each of `publishers` threads.
+
+    Args:
+        publishers (int): Number of concurrent publisher threads.
+        messages (int): Messages published by each thread.
+        subscribers (int): Channels subscribed to every topic.
+
+    Returns:
+        float: Aggregate publish throughput in messages per second.
+    """
+    bus = MessageBus()
+    for topic in TOPICS:
+        for _ in range(subscribers):
+            bus.subscribe(topic)
+
+    start = threading.Barrier(publishers + 1)
+    topics = cycle(TOPICS)
+
+    def publish(topic: EventType) -> None:
+        start.wait()
+        for i in range(messages):
+            bus.publish(topic, i)
+
+    threads = [
+        threading.Thread(target=publish, args=(next(topics),))
+        for _ in range(publishers)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    start.wait()
+    t0 = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - t0
+    return (publishers * messages) / elapsed
+
+
+def main(publishers: List[int], messages: int, subscribers: int) -> None:
+    print(f"{'publishers':>10} {'msgs/sec':>14}")
+    for n in publishers:
+        print(f"{n:>10} {run(n, messages, subscribers):>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark MessageBus publish throughput"
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=200_000,
+        help="Messages published per thread",
+    )
+    parser.add_argument(
+        "--publishers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Publisher thread counts to benchmark",
+    )
+    parser.add_argument(
+        "--subscribers",
+        type=int,
+        default=1,
+        help="Subscribers per topic",
+    )
+    args = parser.parse_args()
+
+    main(args.publishers, args.messages, args.subscribers)
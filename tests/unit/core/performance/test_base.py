@@ -13,7 +13,11 @@ from midastrader.structs.symbol import SymbolMap
 from midastrader.utils.logger import SystemLogger
 from midastrader.structs.account import Account, EquityDetails
 from midastrader.message_bus import MessageBus, EventType
-from midastrader.core.adapters.performance.base import PerformanceManager
+from midastrader.core.adapters.performance.base import (
+    PerformanceManager,
+    ResultsSnapshot,
+)
+from midastrader.core.adapters.performance.pipeline import ResultsPipeline
 from midastrader.config import Parameters, Mode, LiveDataType
 from midastrader.structs.trade import Trade
 from midastrader.structs.events import (
@@ -167,7 +171,7 @@ class TestPerformanceManager(unittest.TestCase):
         sleep(1)
 
         # Validate
-        data = self.manager.equity_manager.equity_value
+        data = self.manager.equity_manager.equity_curve
         self.assertEqual(data[-1], equity_data)
 
     def test_handle_event_account(self):
@@ -183,7 +187,7 @@ class TestPerformanceManager(unittest.TestCase):
         )
 
         # Test
-        self.message_bus.publish(EventType.ACCOUNT_UPDATE_LOG, account_data)
+        self.message_bus.publish(EventType.ACCOUNT_UPDATE, account_data)
         sleep(1)
 
         # Validate
@@ -275,7 +279,7 @@ class TestPerformanceManager(unittest.TestCase):
         signal = SignalEvent(self.timestamp, self.trade_instructions)
 
         # Test
-        self.message_bus.publish(EventType.SIGNAL_UPDATE, signal)
+        self.message_bus.publish(EventType.SIGNAL, signal)
         sleep(1)
 
         # Validate
@@ -284,7 +288,7 @@ class TestPerformanceManager(unittest.TestCase):
 
     def test_save_backtest(self):
         # Trades
-        self.manager.trade_manager.trades = {
+        trades = {
             "25432": Trade(
                 timestamp=1640995200000000000,
                 trade_id=1,
@@ -342,9 +346,11 @@ class TestPerformanceManager(unittest.TestCase):
                 is_rollover=False,
             ),
         }
+        for trade_id, trade in trades.items():
+            self.manager.trade_manager.trades.append(trade_id, trade)
 
         # Equity Curve
-        self.manager.equity_manager.equity_value = [
+        equity_curve = [
             EquityDetails(timestamp=1641047400000000000, equity_value=1000.0),
             EquityDetails(timestamp=1641070800000000000, equity_value=1000.0),
             EquityDetails(timestamp=1641133800000000000, equity_value=1030.0),
@@ -354,6 +360,8 @@ class TestPerformanceManager(unittest.TestCase):
             EquityDetails(timestamp=1641225600000000000, equity_value=1044.0),
             EquityDetails(timestamp=1641243600000000000, equity_value=1044.0),
         ]
+        for equity in equity_curve:
+            self.manager.equity_manager.update_equity(equity)
 
         # Signals
         self.trade1 = SignalInstruction(
@@ -450,6 +458,42 @@ class TestPerformanceManager(unittest.TestCase):
             "Timeseries stats keys do not match expected keys.",
         )
 
+    def test_save_backtest_pipeline(self):
+        tables = {"Static Stats": pd.DataFrame()}
+        self.manager._prepare_backtest = Mock(return_value=tables)
+        self.manager._write_results = Mock()
+        self.manager._upload_backtest = Mock()
+        self.manager.pipeline = ResultsPipeline(max_workers=2)
+
+        # Test
+        self.manager.save()
+
+        # Validate
+        self.assertTrue(self.manager.save_handle.wait(timeout=5))
+        self.manager._prepare_backtest.assert_called_once()
+        self.assertIsInstance(
+            self.manager._prepare_backtest.call_args[0][0], ResultsSnapshot
+        )
+        self.manager._write_results.assert_called_once_with(tables, "")
+        self.manager._upload_backtest.assert_called_once()
+        self.manager.pipeline.shutdown()
+
+    def test_snapshot(self):
+        self.manager.equity_manager.update_equity(
+            EquityDetails(timestamp=1641047400000000000, equity_value=1000.0)
+        )
+
+        # Test
+        snapshot = self.manager.snapshot()
+        self.manager.equity_manager.update_equity(
+            EquityDetails(timestamp=1641070800000000000, equity_value=1010.0)
+        )
+
+        # Validate
+        self.assertEqual(snapshot.params, self.params)
+        self.assertEqual(len(snapshot.equity_manager.equity_curve), 1)
+        self.assertEqual(len(self.manager.equity_manager.equity_curve), 2)
+
     def test_save_live(self):
         # Portfolio server instance
         self.message_bus = MessageBus()
@@ -549,7 +593,8 @@ class TestPerformanceManager(unittest.TestCase):
             ),
         }
 
-        self.manager.trade_manager.trades = trades
+        for trade_id, trade in trades.items():
+            self.manager.trade_manager.trades.append(trade_id, trade)
 
         # Account
         self.manager.account_manager.account_log = [
@@ -581,10 +626,23 @@ class TestPerformanceManager(unittest.TestCase):
             ),
         ]
 
+        # Equity
+        for timestamp, value in [
+            (165000000000, 1000.0),
+            (166000000000, 1010.0),
+        ]:
+            self.manager.equity_manager.update_equity(
+                {"timestamp": timestamp, "equity_value": value}
+            )
+
         # Test
         self.manager.save()
         live_summary = self.manager.live_summary
 
+        # Validate running statistics
+        self.assertEqual(self.manager.static_stats["ending_equity"], 1010.0)
+        self.assertAlmostEqual(self.manager.static_stats["total_return"], 0.01)
+
         # Validate account
         expected_account = mbinary.AccountSummary(
             start_timestamp=165000000000,
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import pyarrow.feather as feather
+
+from midastrader.core.adapters.performance.export import (
+    OutputFormat,
+    table_path,
+    write_results,
+)
+
+
+class TestOutputFormat(unittest.TestCase):
+    def test_from_string(self):
+        self.assertEqual(OutputFormat.from_string("xlsx"), OutputFormat.XLSX)
+        self.assertEqual(
+            OutputFormat.from_string("Parquet"),
+            OutputFormat.PARQUET,
+        )
+        self.assertEqual(
+            OutputFormat.from_string("csv.gz"),
+            OutputFormat.CSV_GZ,
+        )
+
+    def test_from_string_invalid(self):
+        with self.assertRaises(ValueError):
+            OutputFormat.from_string("json")
+
+
+class TestWriteResults(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output_path = self.dir.name + "/"
+        self.tables = {
+            "Parameters": pd.DataFrame(
+                [{"strategy_name": "test", "capital": 100000}]
+            ),
+            "Static Stats": pd.DataFrame(
+                [{"net_profit": 10.0, "total_trades": 2}]
+            ),
+            "Trades": pd.DataFrame(
+                {
+                    "timestamp": pd.to_datetime(
+                        ["2024-01-02 09:30", "2024-01-02 10:30"]
+                    ),
+                    "trade_value": [-100.0, 110.0],
+                    "action": ["LONG", "SELL"],
+                }
+            ),
+            "Signals": pd.DataFrame(
+                {
+                    "limit_price": [101.5, ""],
+                    "stop_price": pd.Series([None, 99.0], dtype=object),
+                    "aux_price": [float("nan"), "100.25"],
+                }
+            ),
+            "Strategy": pd.DataFrame(),
+        }
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_parquet(self):
+        # Test
+        write_results(self.tables, self.output_path, OutputFormat.PARQUET)
+
+        # Validate
+        path = table_path(self.output_path, "Trades", OutputFormat.PARQUET)
+        self.assertTrue(path.endswith("trades.parquet"))
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(path),
+            self.tables["Trades"],
+            check_dtype=False,
+        )
+        signals = pd.read_parquet(
+            table_path(self.output_path, "Signals", OutputFormat.PARQUET)
+        )
+        self.assertEqual(signals["limit_price"].tolist(), ["101.5", ""])
+        self.assertEqual(signals["stop_price"].tolist(), [None, "99.0"])
+        self.assertEqual(signals["aux_price"].tolist(), [None, "100.25"])
+        self.assertFalse(
+            os.path.exists(
+                table_path(self.output_path, "Strategy", OutputFormat.PARQUET)
+            )
+        )
+        self.assertFalse(os.path.exists(self.output_path + "summary.xlsx"))
+
+    def test_arrow(self):
+        # Test
+        write_results(self.tables, self.output_path, OutputFormat.ARROW)
+
+        # Validate
+        path = table_path(self.output_path, "Static Stats", OutputFormat.ARROW)
+        df = feather.read_feather(path)
+        self.assertEqual(df["net_profit"].tolist(), [10.0])
+        signals = feather.read_feather(
+            table_path(self.output_path, "Signals", OutputFormat.ARROW)
+        )
+        self.assertEqual(signals["stop_price"].isna().tolist(), [True, False])
+
+    def test_csv_gz(self):
+        # Test
+        write_results(self.tables, self.output_path, OutputFormat.CSV_GZ)
+
+        # Validate
+        path = table_path(self.output_path, "Trades", OutputFormat.CSV_GZ)
+        df = pd.read_csv(path)
+        self.assertEqual(df["action"].tolist(), ["LONG", "SELL"])
+
+    def test_xlsx(self):
+        # Test
+        write_results(self.tables, self.output_path, OutputFormat.XLSX)
+
+        # Validate
+        self.assertTrue(os.path.exists(self.output_path + "output.xlsx"))
+
+    def test_excel_summary(self):
+        # Test
+        write_results(
+            self.tables,
+            self.output_path,
+            OutputFormat.PARQUET,
+            excel_summary=True,
+        )
+
+        # Validate
+        self.assertTrue(os.path.exists(self.output_path + "summary.xlsx"))
+        self.assertFalse(os.path.exists(self.output_path + "output.xlsx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
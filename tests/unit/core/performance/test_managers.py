@@ -19,7 +19,7 @@ from midastrader.core.adapters.performance.managers import (
 class TestTradeManager(unittest.TestCase):
     def setUp(self):
         self.manager = TradeManager()
-        self.manager.trades = {
+        trades = {
             "1234": Trade(
                 timestamp=1712066400000000000,
                 signal_id=13,
@@ -189,6 +189,8 @@ class TestTradeManager(unittest.TestCase):
                 is_rollover=False,
             ),
         }
+        for trade_id, trade in trades.items():
+            self.manager.trades.append(trade_id, trade)
 
         self.pnl = np.array(
             [
@@ -242,6 +244,48 @@ class TestTradeManager(unittest.TestCase):
         # Validate
         pd.testing.assert_frame_equal(aggregated_df, expected_df)
 
+    def test_aggregate_trades_rollover(self):
+        manager = TradeManager()
+        trades = [
+            ("LONG", 100.0, False),
+            ("SELL", 110.0, True),
+            ("LONG", 110.0, True),
+            ("SELL", 120.0, False),
+        ]
+        for i, (action, price, is_rollover) in enumerate(trades):
+            sign = -1 if action == "LONG" else 1
+            manager.trades.append(
+                str(i),
+                Trade(
+                    timestamp=1712066400000000000 + i,
+                    trade_id=i,
+                    signal_id=1,
+                    instrument=43,
+                    security_type=SecurityType.FUTURE,
+                    quantity=1.0,
+                    avg_price=price,
+                    trade_value=sign * price * 50,
+                    trade_cost=1000.0,
+                    action=action,
+                    fees=-1.0,
+                    is_rollover=is_rollover,
+                ),
+            )
+
+        # Test
+        aggregated_df = manager._aggregate_trades()
+
+        # Validate
+        row = aggregated_df.iloc[0]
+        self.assertEqual(row["start_date"], 1712066400000000000)
+        self.assertEqual(row["end_date"], 1712066400000000003)
+        self.assertEqual(row["entry_value"], -10500.0)
+        self.assertEqual(row["exit_value"], 11500.0)
+        self.assertEqual(row["entry_cost"], 1000.0)
+        self.assertEqual(row["exit_cost"], 3000.0)
+        self.assertEqual(row["fees"], -4.0)
+        self.assertEqual(row["pnl"], -1004.0)
+
     def test_calculate_statistics(self):
         # Test
         result = self.manager.calculate_trade_statistics()
@@ -362,7 +406,7 @@ class TestTradeManager(unittest.TestCase):
 class TestEquityManager(unittest.TestCase):
     def setUp(self):
         self.manager = EquityManager()
-        self.manager.equity_value = [
+        self.equity_value = [
             {"timestamp": 1713888000000000000, "equity_value": 1189792.75},
             {"timestamp": 1713891600000000000, "equity_value": 1193107.75},
             {"timestamp": 1713895200000000000, "equity_value": 1192942.75},
@@ -378,7 +422,10 @@ class TestEquityManager(unittest.TestCase):
             {"timestamp": 1714057200000000000, "equity_value": 1242607.3},
             {"timestamp": 1714060800000000000, "equity_value": 1242607.3},
         ]
-        self.raw_equity_df = pd.DataFrame(self.manager.equity_value)
+        for equity in self.equity_value:
+            self.manager.update_equity(equity)
+
+        self.raw_equity_df = pd.DataFrame(self.equity_value)
         self.raw_equity_df.set_index("timestamp", inplace=True)
 
     def test_calculate_return_and_drawdown(self):
@@ -498,6 +545,106 @@ class TestEquityManager(unittest.TestCase):
         for key in keys:
             self.assertIsNotNone(result[key])
 
+    def test_update_equity(self):
+        # Validate
+        self.assertEqual(len(self.manager.equity_curve), 13)
+        self.assertEqual(
+            self.manager.equity_curve[9],
+            {"timestamp": 1714050000000000000, "equity_value": 1242607.3},
+        )
+
+    def test_update_equity_duplicate(self):
+        manager = EquityManager()
+        equity = {"timestamp": 1713888000000000000, "equity_value": 100.0}
+
+        # Test
+        manager.update_equity(equity)
+        manager.update_equity(equity)
+
+        # Validate
+        self.assertEqual(len(manager.equity_curve), 1)
+        self.assertEqual(manager.statistics.period.snapshot().count, 1)
+
+    def test_update_equity_statistics(self):
+        # Test
+        result = self.manager.running_statistics(0.04)
+
+        # Expected
+        expected = self.manager.calculate_equity_statistics(0.04)
+
+        # Validate
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            np.testing.assert_allclose(
+                result[key], value, atol=1e-5, err_msg=key
+            )
+
+    def test_running_statistics_random_walk(self):
+        rng = np.random.default_rng(7)
+        timestamps = 1704067200000000000 + np.cumsum(
+            rng.integers(1, 4, 2000) * 3600000000000
+        )
+        values = 100000 * np.cumprod(1 + rng.normal(0, 0.004, 2000))
+
+        manager = EquityManager()
+        for timestamp, value in zip(timestamps, values):
+            manager.update_equity(
+                {"timestamp": int(timestamp), "equity_value": float(value)}
+            )
+
+        # Test
+        result = manager.running_statistics(0.04)
+
+        # Expected
+        expected = manager.calculate_equity_statistics(0.04)
+
+        # Validate
+        for key, value in expected.items():
+            np.testing.assert_allclose(
+                result[key], value, atol=1e-4, err_msg=key
+            )
+
+    def test_running_statistics_first_timestamp_replaced(self):
+        manager = EquityManager()
+        for timestamp, value in [(1, 100.0), (1, 120.0), (2, 132.0)]:
+            manager.update_equity(
+                {"timestamp": timestamp, "equity_value": value}
+            )
+
+        # Test
+        result = manager.running_statistics(0.04)
+
+        # Expected
+        expected = manager.calculate_equity_statistics(0.04)
+
+        # Validate
+        self.assertEqual(result["beginning_equity"], 120.0)
+        self.assertEqual(
+            result["beginning_equity"], expected["beginning_equity"]
+        )
+        self.assertAlmostEqual(
+            result["total_return"], expected["total_return"]
+        )
+
+    def test_update_equity_out_of_order(self):
+        size = len(self.manager.equity_curve)
+
+        # Test
+        self.manager.update_equity(
+            {"timestamp": 1713888000000000000, "equity_value": 1.0}
+        )
+
+        # Validate
+        self.assertEqual(len(self.manager.equity_curve), size)
+        self.assertEqual(
+            self.manager.statistics.ending_equity,
+            self.equity_value[-1]["equity_value"],
+        )
+
+    def test_running_statistics_empty(self):
+        with self.assertRaises(ValueError):
+            EquityManager().running_statistics()
+
 
 class TestAccountManager(unittest.TestCase):
     def setUp(self):
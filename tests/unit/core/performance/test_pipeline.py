@@ -0,0 +1,131 @@
+import threading
+import unittest
+
+from midastrader.core.adapters.performance.pipeline import (
+    ResultsPipeline,
+    SaveHandle,
+)
+
+
+class TestSaveHandle(unittest.TestCase):
+    def test_wait(self):
+        handle = SaveHandle()
+        handle._expect(2)
+
+        # Test
+        handle._complete()
+        self.assertFalse(handle.done())
+        self.assertFalse(handle.wait(timeout=0.01))
+        handle._complete()
+
+        # Validate
+        self.assertTrue(handle.done())
+        self.assertTrue(handle.wait(timeout=0.01))
+
+    def test_wait_error(self):
+        handle = SaveHandle()
+        handle._expect(1)
+        error = ValueError("upload failed")
+
+        # Test
+        handle._complete(error)
+
+        # Validate
+        with self.assertRaises(RuntimeError) as context:
+            handle.wait()
+        self.assertIs(context.exception.__cause__, error)
+
+
+class TestResultsPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pipeline = ResultsPipeline(max_workers=3)
+
+    def tearDown(self) -> None:
+        self.pipeline.shutdown()
+
+    def test_submit(self):
+        results = []
+
+        # Test
+        handle = self.pipeline.submit(
+            lambda: 2,
+            [
+                lambda value: results.append(value * 10),
+                lambda value: results.append(value * 100),
+            ],
+        )
+
+        # Validate
+        self.assertTrue(handle.wait(timeout=5))
+        self.assertEqual(sorted(results), [20, 200])
+
+    def test_submit_consumers_concurrent(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        # Test
+        handle = self.pipeline.submit(
+            lambda: None,
+            [lambda _: barrier.wait(), lambda _: barrier.wait()],
+        )
+
+        # Validate
+        self.assertTrue(handle.wait(timeout=5))
+
+    def test_submit_returns_before_completion(self):
+        release = threading.Event()
+
+        # Test
+        handle = self.pipeline.submit(release.wait, [lambda _: None])
+
+        # Validate
+        self.assertFalse(handle.done())
+        self.assertFalse(handle.wait(timeout=0.05))
+        release.set()
+        self.assertTrue(handle.wait(timeout=5))
+
+    def test_submit_compute_error(self):
+        consumer_calls = []
+
+        def compute():
+            raise ValueError("stats failed")
+
+        # Test
+        handle = self.pipeline.submit(compute, [consumer_calls.append])
+
+        # Validate
+        with self.assertRaises(RuntimeError):
+            handle.wait(timeout=5)
+        self.assertEqual(consumer_calls, [])
+
+    def test_submit_consumer_error(self):
+        results = []
+
+        def upload(_):
+            raise ConnectionError("database unavailable")
+
+        # Test
+        handle = self.pipeline.submit(lambda: 1, [upload, results.append])
+
+        # Validate
+        with self.assertRaises(RuntimeError):
+            handle.wait(timeout=5)
+        self.assertEqual(results, [1])
+        self.assertIsInstance(handle.errors[0], ConnectionError)
+
+    def test_submit_shutdown_before_consumers(self):
+        release = threading.Event()
+        results = []
+
+        # Test
+        handle = self.pipeline.submit(release.wait, [results.append])
+        self.pipeline.shutdown(wait=False)
+        release.set()
+
+        # Validate
+        with self.assertRaises(RuntimeError):
+            handle.wait(timeout=5)
+        self.assertEqual(results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
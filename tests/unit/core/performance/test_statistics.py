@@ -0,0 +1,95 @@
+import math
+import unittest
+import numpy as np
+
+from midastrader.core.adapters.performance.statistics import (
+    ReturnStatistics,
+    ReturnSeries,
+    EquityStatistics,
+)
+
+
+class TestReturnStatistics(unittest.TestCase):
+    def setUp(self):
+        self.returns = np.array([0.0, 0.01, -0.02, 0.015, -0.005, 0.003])
+        self.stats = ReturnStatistics()
+        for value in self.returns:
+            self.stats.push(value)
+
+    def test_mean_std(self):
+        self.assertAlmostEqual(self.stats.mean, self.returns.mean())
+        self.assertAlmostEqual(self.stats.std, self.returns.std(ddof=1))
+
+    def test_downside_std(self):
+        downside = self.returns[self.returns < 0]
+        self.assertEqual(self.stats.downside_count, 2)
+        self.assertAlmostEqual(self.stats.downside_std, downside.std(ddof=1))
+
+    def test_max_drawdown(self):
+        growth = np.cumprod(1 + self.returns)
+        peak = np.maximum.accumulate(growth)
+        expected = np.min((growth - peak) / peak)
+        self.assertAlmostEqual(self.stats.max_drawdown, expected, places=6)
+
+    def test_std_single_return(self):
+        stats = ReturnStatistics()
+        stats.push(0.01)
+        self.assertTrue(math.isnan(stats.std))
+
+    def test_sortino_no_downside(self):
+        stats = ReturnStatistics()
+        stats.push(0.01)
+        stats.push(0.02)
+        self.assertEqual(stats.sortino_ratio(0.04), 0.0)
+
+
+class TestReturnSeries(unittest.TestCase):
+    def test_pending_bucket_replaced(self):
+        series = ReturnSeries()
+        series.update(1, 100.0)
+        series.update(2, 90.0)
+        series.update(2, 110.0)
+
+        # Validate
+        self.assertEqual(series.stats.count, 1)
+        stats = series.snapshot()
+        self.assertEqual(stats.count, 2)
+        self.assertAlmostEqual(stats.mean, 0.05)
+        self.assertEqual(series.stats.count, 1)
+
+
+class TestEquityStatistics(unittest.TestCase):
+    def test_daily_buckets(self):
+        statistics = EquityStatistics()
+        day = 86_400_000_000_000
+        statistics.update(day, 100.0)
+        statistics.update(day + 3600, 95.0)
+        statistics.update(2 * day, 105.0)
+
+        # Validate
+        self.assertEqual(statistics.period.snapshot().count, 3)
+        self.assertEqual(statistics.daily.snapshot().count, 2)
+        self.assertEqual(statistics.ending_equity, 105.0)
+        self.assertAlmostEqual(statistics.current_drawdown(), 0.0)
+
+    def test_first_timestamp_replaced(self):
+        statistics = EquityStatistics()
+        statistics.update(1, 100.0)
+        statistics.update(1, 120.0)
+        statistics.update(2, 132.0)
+        statistics.update(2, 126.0)
+
+        # Test
+        result = statistics.statistics()
+
+        # Validate
+        self.assertEqual(result["beginning_equity"], 120.0)
+        self.assertAlmostEqual(result["total_return"], 0.05)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            EquityStatistics().statistics()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+import unittest
+import numpy as np
+
+from midastrader.structs.trade import Trade
+from midastrader.structs.orders import Action, OrderType
+from midastrader.structs.signal import SignalInstruction
+from midastrader.structs.symbol import SecurityType
+from midastrader.structs.events import SignalEvent
+from midastrader.core.adapters.performance.store import (
+    EquityCurve,
+    TradeBlotter,
+    SignalLog,
+)
+
+
+class TestEquityCurve(unittest.TestCase):
+    def setUp(self):
+        self.curve = EquityCurve(capacity=2)
+
+    def test_append(self):
+        # Test
+        self.curve.append(1, 100.0)
+        self.curve.append(2, 101.0)
+
+        # Validate
+        self.assertEqual(len(self.curve), 2)
+        np.testing.assert_array_equal(self.curve.timestamps, [1, 2])
+        np.testing.assert_array_equal(self.curve.values, [100.0, 101.0])
+        self.assertEqual(self.curve.timestamps.dtype, np.int64)
+
+    def test_append_same_timestamp(self):
+        # Test
+        self.curve.append(1, 100.0)
+        changed = self.curve.append(1, 99.0)
+        unchanged = self.curve.append(1, 99.0)
+
+        # Validate
+        self.assertTrue(changed)
+        self.assertFalse(unchanged)
+        self.assertEqual(len(self.curve), 1)
+        self.assertEqual(
+            self.curve[-1], {"timestamp": 1, "equity_value": 99.0}
+        )
+
+    def test_append_out_of_order(self):
+        self.curve.append(1, 100.0)
+        self.curve.append(3, 101.0)
+
+        # Validate
+        with self.assertRaises(ValueError):
+            self.curve.append(2, 102.0)
+        self.assertEqual(len(self.curve), 2)
+        np.testing.assert_array_equal(self.curve.timestamps, [1, 3])
+        np.testing.assert_array_equal(self.curve.values, [100.0, 101.0])
+
+    def test_grow(self):
+        # Test
+        for i in range(5):
+            self.curve.append(i, float(i))
+
+        # Validate
+        self.assertEqual(self.curve.capacity, 8)
+        np.testing.assert_array_equal(self.curve.timestamps, range(5))
+        np.testing.assert_array_equal(self.curve.values, range(5))
+
+    def test_views_read_only(self):
+        self.curve.append(1, 100.0)
+
+        # Validate
+        with self.assertRaises(ValueError):
+            self.curve.values[0] = 0.0
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.curve[0]
+
+    def test_to_frame(self):
+        self.curve.append(1, 100.0)
+        self.curve.append(2, 101.0)
+
+        # Test
+        df = self.curve.to_frame()
+
+        # Validate
+        self.assertEqual(df.index.name, "timestamp")
+        self.assertEqual(df["equity_value"].tolist(), [100.0, 101.0])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            EquityCurve(capacity=0)
+
+
+class TestTradeBlotter(unittest.TestCase):
+    def setUp(self):
+        self.blotter = TradeBlotter(capacity=1)
+        self.trade = Trade(
+            timestamp=1712066400000000000,
+            trade_id=1,
+            signal_id=13,
+            instrument=43,
+            security_type=SecurityType.FUTURE,
+            quantity=-63.0,
+            avg_price=104.425,
+            trade_value=-2631510.0,
+            trade_cost=354511.71,
+            action="SHORT",
+            fees=-53.55,
+            is_rollover=False,
+        )
+
+    def test_append(self):
+        # Test
+        self.blotter.append("1234", self.trade)
+
+        # Validate
+        self.assertEqual(len(self.blotter), 1)
+        self.assertIn("1234", self.blotter)
+        self.assertEqual(self.blotter["1234"], self.trade)
+        self.assertEqual(self.blotter.records["security_type"][0], "FUT")
+
+    def test_append_existing(self):
+        self.blotter.append("1234", self.trade)
+        self.trade.quantity = -10.0
+
+        # Test
+        self.blotter.append("1234", self.trade)
+
+        # Validate
+        self.assertEqual(len(self.blotter), 1)
+        self.assertEqual(self.blotter["1234"].quantity, -10.0)
+
+    def test_grow(self):
+        # Test
+        for i in range(3):
+            self.blotter.append(str(i), self.trade)
+
+        # Validate
+        self.assertEqual(self.blotter.capacity, 4)
+        self.assertEqual(list(self.blotter.values()), [self.trade] * 3)
+
+    def test_set_fees(self):
+        self.blotter.append("1234", self.trade)
+
+        # Test
+        found = self.blotter.set_fees("1234", -10.0)
+        missing = self.blotter.set_fees("999", -10.0)
+
+        # Validate
+        self.assertTrue(found)
+        self.assertFalse(missing)
+        self.assertEqual(self.blotter["1234"].fees, -10.0)
+
+    def test_to_frame(self):
+        self.blotter.append("1234", self.trade)
+
+        # Test
+        df = self.blotter.to_frame()
+
+        # Validate
+        self.assertEqual(df["trade_value"].tolist(), [-2631510.0])
+        self.assertEqual(df["action"].tolist(), ["SHORT"])
+
+    def test_enum_fields_not_truncated(self):
+        self.trade.security_type = SecurityType.CRYPTO
+
+        # Test
+        self.blotter.append("1234", self.trade)
+
+        # Validate
+        self.assertEqual(self.blotter["1234"], self.trade)
+        for action in Action:
+            self.assertGreaterEqual(
+                self.blotter.records.dtype["action"].itemsize,
+                len(action.value) * 4,
+            )
+
+
+class TestSignalLog(unittest.TestCase):
+    def setUp(self):
+        self.log = SignalLog(capacity=1)
+        self.market = SignalInstruction(
+            instrument=1,
+            order_type=OrderType.MARKET,
+            action=Action.LONG,
+            signal_id=2,
+            weight=0.5,
+            quantity=10.0,
+        )
+        self.limit = SignalInstruction(
+            instrument=2,
+            order_type=OrderType.LIMIT,
+            action=Action.SHORT,
+            signal_id=2,
+            weight=-0.5,
+            quantity=-5.0,
+            limit_price=101.5,
+        )
+
+    def test_append(self):
+        first = SignalEvent(1651500000, [self.market, self.limit])
+        second = SignalEvent(1651500060, [self.market])
+
+        # Test
+        self.log.append(first)
+        self.log.append(second)
+
+        # Validate
+        self.assertEqual(len(self.log), 2)
+        self.assertEqual(self.log.size, 3)
+        np.testing.assert_array_equal(self.log.starts, [0, 2])
+        np.testing.assert_array_equal(
+            self.log.records["timestamp"],
+            [1651500000, 1651500000, 1651500060],
+        )
+        self.assertEqual(self.log.records["order_type"][1], "LMT")
+        self.assertEqual(self.log.records["limit_price"][1], 101.5)
+
+    def test_getitem(self):
+        first = SignalEvent(1651500000, [self.market, self.limit])
+        second = SignalEvent(1651500060, [self.market])
+        self.log.append(first)
+        self.log.append(second)
+
+        # Validate
+        self.assertEqual(self.log[0], first)
+        self.assertEqual(self.log[-1], second)
+        self.assertEqual(list(self.log), [first, second])
+
+    def test_enum_fields_not_truncated(self):
+        instruction = SignalInstruction(
+            instrument=1,
+            order_type=OrderType.DEFAULT,
+            action=Action.DEFAULT,
+            signal_id=2,
+            weight=0.5,
+            quantity=10.0,
+        )
+        signal = SignalEvent(1651500000, [instruction])
+
+        # Test
+        self.log.append(signal)
+
+        # Validate
+        self.assertEqual(self.log.records["action"][0], "DEFAULT")
+        self.assertEqual(self.log.records["order_type"][0], "DEFAULT")
+        self.assertEqual(self.log[0].instructions[0].action, Action.DEFAULT)
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.log[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
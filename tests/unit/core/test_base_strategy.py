@@ -111,25 +111,13 @@ class TestTestStrategy(unittest.TestCase):
         self.test_strategy.set_signal(self.trade_instructions, self.timestamp)
 
         # Validate
-        self.assertEqual(self.bus.publish.call_count, 2)
+        self.assertEqual(self.bus.publish.call_count, 1)
 
-        # Access all calls made to publish
-        calls = self.bus.publish.call_args_list
-
-        # Validate the first call
-        first_call_args = calls[0][0]
-        self.assertEqual(first_call_args[0], EventType.SIGNAL)
-        self.assertEqual(
-            first_call_args[1],
-            SignalEvent(self.timestamp, self.trade_instructions),
-        )
-
-        # Validate the second call
-        second_call_args = calls[1][0]
-        # Replace with your expected arguments for the second call
-        self.assertEqual(second_call_args[0], EventType.SIGNAL_UPDATE)
+        # Validate the call
+        call_args = self.bus.publish.call_args[0]
+        self.assertEqual(call_args[0], EventType.SIGNAL)
         self.assertEqual(
-            second_call_args[1],
+            call_args[1],
             SignalEvent(self.timestamp, self.trade_instructions),
         )
 
@@ -140,7 +128,7 @@ class TestTestStrategy(unittest.TestCase):
         self.test_strategy.set_signal([], self.timestamp)
 
         # Validate
-        self.assertEqual(self.bus.topics[EventType.UPDATE_SYSTEM], False)
+        self.assertEqual(self.bus.get_flag(EventType.UPDATE_SYSTEM), False)
 
 
 class TestLoadStrategyClass(unittest.TestCase):
@@ -120,6 +120,17 @@ class TestOrderBook(unittest.TestCase):
         # Validate
         self.assertEqual(result, book)
 
+    def test_activate(self):
+        book = OrderBook()
+
+        # Test
+        with book.activate():
+            current = OrderBook.get_instance()
+
+        # Validate
+        self.assertIs(current, book)
+        self.assertIs(OrderBook.get_instance(), self.book)
+
 
 class TestOrderBookManager(unittest.TestCase):
     def setUp(self) -> None:
@@ -241,6 +252,87 @@ class TestOrderBookManager(unittest.TestCase):
         args = self.manager.handle_record.call_args[0]
         self.assertEqual(self.bar, args[0])
 
+    def test_process_batch(self):
+        self.manager.handle_slice = MagicMock()
+        later = OhlcvMsg(
+            instrument_id=1,
+            rollover_flag=0,
+            ts_event=self.timestamp + 1,
+            open=int(80.90 * 1e9),
+            close=int(9000.90 * 1e9),
+            high=int(75.90 * 1e9),
+            low=int(8800.09 * 1e9),
+            volume=880000,
+        )
+
+        # Test
+        self.bus.publish(EventType.DATA, [self.bar, self.tick, later])
+        sleep(1)
+
+        # Validate
+        calls = self.manager.handle_slice.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0][0][0], [self.bar, self.tick])
+        self.assertEqual(calls[1][0][0], [later])
+
+    def test_handle_batch_matches_records(self):
+        self.bus.publish = MagicMock()
+        records = [
+            OhlcvMsg(
+                instrument_id=1 + i % 2,
+                rollover_flag=0,
+                ts_event=self.timestamp + i,
+                open=int(80.90 * 1e9),
+                close=int((9000.90 + i) * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for i in range(4)
+        ]
+
+        # Test
+        for record in records:
+            self.manager.handle_record(record)
+        single = list(self.bus.publish.call_args_list)
+        single_book = dict(self.book.retrieve_all())
+
+        self.bus.publish.reset_mock()
+        self.book._book = {}
+        self.manager.handle_batch(records)
+
+        # Validate
+        self.assertEqual(self.bus.publish.call_args_list, single)
+        self.assertEqual(self.book.retrieve_all(), single_book)
+
+    def test_handle_slice(self):
+        self.bus.publish = MagicMock()
+
+        # Test
+        self.manager.handle_slice([self.bar, self.tick])
+
+        # Validate
+        self.assertEqual(self.book.retrieve(1), self.bar)
+        self.assertEqual(self.book.retrieve(2), self.tick)
+
+        calls = [c[0] for c in self.bus.publish.call_args_list]
+        self.assertEqual(
+            calls,
+            [
+                (EventType.UPDATE_EQUITY, True),
+                (EventType.UPDATE_SYSTEM, True),
+                (
+                    EventType.ORDER_BOOK,
+                    MarketEvent(self.timestamp, self.bar),
+                ),
+                (EventType.UPDATE_SYSTEM, True),
+                (
+                    EventType.ORDER_BOOK,
+                    MarketEvent(self.timestamp, self.tick),
+                ),
+            ],
+        )
+
     def test_handle_event_bar(self):
         market_event = MarketEvent(self.timestamp, self.bar)
         self.bus.publish = MagicMock()
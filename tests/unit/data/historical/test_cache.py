@@ -0,0 +1,182 @@
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+from mbinary import BufferStore, Dataset, Schema, Stype
+
+from midastrader.config import LiveDataType, Parameters
+from midastrader.utils.unix import iso_to_unix
+from midastrader.data.adaptors.historical.cache import HistoricalCache
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "he_zc_ohlcv-1h.bin",
+)
+
+
+def replay_all(data) -> list:
+    records = []
+
+    while (record := data.replay()) is not None:
+        records.append(record)
+
+    return records
+
+
+def make_parameters(start: str, end: str, tickers: list) -> Parameters:
+    params = Parameters(
+        strategy_name="Testing",
+        capital=10000000,
+        schema=Schema.OHLCV1_D,
+        dataset=Dataset.FUTURES,
+        stype=Stype.CONTINUOUS,
+        data_type=LiveDataType.BAR,
+        start=start,
+        end=end,
+    )
+    params.tickers = tickers
+    return params
+
+
+class TestHistoricalCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = HistoricalCache(self.tmp.name)
+        self.tickers = ["HE.c.0", "ZC.c.0"]
+        self.full = make_parameters("2024-09-01", "2025-01-01", self.tickers)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    # Basic Validation
+    def test_get_miss(self):
+        # Validate
+        self.assertIsNone(self.cache.get(self.full))
+
+    def test_put_get_exact(self):
+        expected = replay_all(BufferStore.from_file(DATA_FILE))
+
+        # Test
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+        data = self.cache.get(self.full)
+
+        # Validate
+        self.assertEqual(len(replay_all(data)), len(expected))
+
+    def test_get_subset(self):
+        start, end = "2024-09-10", "2024-09-20"
+        expected = [
+            r
+            for r in replay_all(BufferStore.from_file(DATA_FILE))
+            if iso_to_unix(start) <= r.ts_event < iso_to_unix(end)
+        ]
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+
+        # Test
+        data = self.cache.get(make_parameters(start, end, self.tickers))
+        records = replay_all(data)
+
+        # Validate
+        self.assertEqual(len(records), len(expected))
+        self.assertEqual(
+            [r.ts_event for r in records],
+            [r.ts_event for r in expected],
+        )
+
+    def test_get_other_request(self):
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+
+        # Validate
+        wider = make_parameters("2024-08-01", "2025-01-01", self.tickers)
+        other = make_parameters("2024-09-01", "2025-01-01", ["HE.c.0"])
+        self.assertIsNone(self.cache.get(wider))
+        self.assertIsNone(self.cache.get(other))
+
+    def test_ticker_order(self):
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+        params = make_parameters(
+            "2024-09-01", "2025-01-01", list(reversed(self.tickers))
+        )
+
+        # Validate
+        self.assertIsNotNone(self.cache.get(params))
+
+    def test_put_supersedes_covered(self):
+        sub = make_parameters("2024-09-10", "2024-09-20", self.tickers)
+        self.cache.put(sub, BufferStore.from_file(DATA_FILE))
+
+        # Test
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+
+        # Validate
+        files = [f for f in os.listdir(self.tmp.name) if f.endswith(".bin")]
+        self.assertEqual(len(files), 1)
+
+    def test_evict_least_recently_used(self):
+        size = os.path.getsize(DATA_FILE)
+        cache = HistoricalCache(self.tmp.name, max_size=size * 5 // 2)
+        first = make_parameters("2024-09-01", "2025-01-01", ["HE.c.0"])
+        second = make_parameters("2024-09-01", "2025-01-01", ["ZC.c.0"])
+        cache.put(first, BufferStore.from_file(DATA_FILE))
+        cache.put(second, BufferStore.from_file(DATA_FILE))
+        cache.get(first)
+
+        # Test
+        cache.put(self.full, BufferStore.from_file(DATA_FILE))
+
+        # Validate
+        self.assertIsNotNone(cache.get(first))
+        self.assertIsNone(cache.get(second))
+        self.assertIsNotNone(cache.get(self.full))
+
+    @patch("midastrader.data.adaptors.historical.cache.SystemLogger")
+    def test_evict_file_in_use(self, logger):
+        size = os.path.getsize(DATA_FILE)
+        cache = HistoricalCache(self.tmp.name, max_size=size * 3 // 2)
+        first = make_parameters("2024-09-01", "2025-01-01", ["HE.c.0"])
+        cache.put(first, BufferStore.from_file(DATA_FILE))
+
+        # Test
+        with patch(
+            "midastrader.data.adaptors.historical.cache.os.remove",
+            side_effect=PermissionError("mapped by another process"),
+        ):
+            cache.put(self.full, BufferStore.from_file(DATA_FILE))
+
+        # Validate
+        self.assertTrue(logger.get_logger.return_value.warning.called)
+        self.assertIsNotNone(cache.get(first))
+        self.assertIsNotNone(cache.get(self.full))
+
+        # A later eviction removes it
+        second = make_parameters("2024-09-01", "2025-01-01", ["ZC.c.0"])
+        cache.put(second, BufferStore.from_file(DATA_FILE))
+        self.assertIsNone(cache.get(first))
+
+    def test_get_evicted_after_lookup(self):
+        self.cache.put(self.full, BufferStore.from_file(DATA_FILE))
+        index = self.cache._index
+
+        @contextmanager
+        def evicting_index():
+            with index() as entries:
+                yield entries
+
+            # Another process evicts the file once the index is unlocked
+            for entry in entries:
+                os.remove(os.path.join(self.tmp.name, entry["file"]))
+
+        self.cache._index = evicting_index
+
+        # Validate
+        self.assertIsNone(self.cache.get(self.full))
+
+    # Type Check
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            HistoricalCache(self.tmp.name, max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
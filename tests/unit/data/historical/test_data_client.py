@@ -1,9 +1,10 @@
+import tempfile
 import unittest
 import threading
 from time import sleep
 from datetime import datetime, time
 from unittest.mock import Mock, MagicMock
-from mbinary import Dataset, OhlcvMsg, Schema, Stype
+from mbinary import BufferStore, Dataset, OhlcvMsg, Schema, Stype
 
 from midastrader.config import LiveDataType, Parameters, Mode
 from midastrader.structs.events import EODEvent
@@ -12,6 +13,12 @@ from midastrader.utils.logger import SystemLogger
 from midastrader.structs.symbol import SymbolMap
 from midastrader.utils.unix import unix_to_iso
 from midastrader.data.adaptors.historical import HistoricalAdaptor
+from midastrader.data.adaptors.historical.data_client import (
+    _shared_files,
+    load_data_file,
+    share_data_files,
+)
+from midastrader.data.adaptors.historical.stream import ChunkedRecords
 from midastrader.structs.symbol import (
     Equity,
     Currency,
@@ -32,7 +39,7 @@ class TestHistoricalAdaptor(unittest.TestCase):
             instrument_id=1,
             broker_ticker="HEJ4",
             data_ticker="HE",
-            midas_ticker="HE.n.0",
+            midas_ticker="HE.c.0",
             security_type=SecurityType.FUTURE,
             fees=0.85,
             currency=Currency.USD,
@@ -80,11 +87,42 @@ class TestHistoricalAdaptor(unittest.TestCase):
                 day_open=time(9, 0), day_close=time(14, 0)
             ),
         )
-        self.symbols = [hogs, aapl]
+        corn = Future(
+            instrument_id=3,
+            broker_ticker="ZCJ4",
+            data_ticker="ZC",
+            midas_ticker="ZC.c.0",
+            security_type=SecurityType.FUTURE,
+            fees=0.85,
+            currency=Currency.USD,
+            exchange=Venue.CBOT,
+            initial_margin=2075.36,
+            maintenance_margin=2000.0,
+            quantity_multiplier=5000,
+            price_multiplier=0.01,
+            product_code="ZC",
+            product_name="Corn",
+            industry=Industry.AGRICULTURE,
+            contract_size=5000,
+            contract_units=ContractUnits.BUSHELS,
+            tick_size=0.0025,
+            min_price_fluctuation=12.50,
+            continuous=False,
+            slippage_factor=10,
+            lastTradeDateOrContractMonth="202404",
+            trading_sessions=TradingSession(
+                day_open=time(9, 30), day_close=time(14, 20)
+            ),
+            expr_months=[FuturesMonth.H, FuturesMonth.K, FuturesMonth.Z],
+            term_day_rule="nth_bday_before_nth_day_1_15",
+            market_calendar="CMEGlobex_Grains",
+        )
+        self.symbols = [hogs, aapl, corn]
 
         self.symbols_map = SymbolMap()
         self.symbols_map.add_symbol(hogs)
         self.symbols_map.add_symbol(aapl)
+        self.symbols_map.add_symbol(corn)
 
         # Mock Logger
         logger = SystemLogger()
@@ -143,6 +181,8 @@ class TestHistoricalAdaptor(unittest.TestCase):
         kwargs = {"data_file": ""}
         adaptor = HistoricalAdaptor(self.symbols_map, self.bus, **kwargs)
         adaptor.database_client.historical.get_records = Mock()
+        records = adaptor.database_client.historical.get_records.return_value
+        records.metadata.mappings.map = {}
 
         # Test
         _ = adaptor.get_data(params)
@@ -150,6 +190,98 @@ class TestHistoricalAdaptor(unittest.TestCase):
         # Validate
         self.assertTrue(adaptor.database_client.historical.get_records.called)
 
+    def test_get_data_cached(self):
+        # Parameters
+        params = Parameters(
+            strategy_name="Testing",
+            capital=10000000,
+            schema=Schema.OHLCV1_D,
+            dataset=Dataset.FUTURES,
+            stype=Stype.CONTINUOUS,
+            data_type=LiveDataType.BAR,
+            start="2024-09-01",
+            end="2025-01-01",
+            risk_free_rate=0.9,
+            symbols=self.symbols,
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            kwargs = {"data_file": "", "cache_dir": cache_dir}
+            adaptor = HistoricalAdaptor(self.symbols_map, self.bus, **kwargs)
+            adaptor.fetch_records = Mock(
+                side_effect=lambda _: BufferStore.from_file(
+                    "tests/unit/he_zc_ohlcv-1h.bin"
+                )
+            )
+            adaptor.build_id_map = Mock(return_value={})
+
+            # Test
+            adaptor.get_data(params)
+            adaptor.get_data(params)
+
+        # Validate
+        self.assertEqual(adaptor.fetch_records.call_count, 1)
+
+    def test_get_data_chunked(self):
+        # Parameters
+        params = Parameters(
+            strategy_name="Testing",
+            capital=10000000,
+            schema=Schema.OHLCV1_D,
+            dataset=Dataset.FUTURES,
+            stype=Stype.CONTINUOUS,
+            data_type=LiveDataType.BAR,
+            start="2024-10-01",
+            end="2024-10-15",
+            risk_free_rate=0.9,
+            symbols=self.symbols,
+        )
+
+        kwargs = {"data_file": "", "chunk_days": 7}
+        adaptor = HistoricalAdaptor(self.symbols_map, self.bus, **kwargs)
+        chunk = Mock()
+        chunk.replay.return_value = None
+        adaptor.fetch_records = Mock(return_value=chunk)
+        adaptor.build_id_map = Mock(return_value={})
+
+        # Test
+        adaptor.get_data(params)
+        self.assertIsNone(adaptor.data.replay())
+
+        # Validate
+        ranges = [
+            (call[0][0].start, call[0][0].end)
+            for call in adaptor.fetch_records.call_args_list
+        ]
+        self.assertEqual(
+            ranges,
+            [("2024-10-01", "2024-10-08"), ("2024-10-08", "2024-10-15")],
+        )
+
+    def test_next_record_chunk_mappings(self):
+        record = OhlcvMsg(
+            instrument_id=21,
+            ts_event=1707221160000000000,
+            rollover_flag=0,
+            open=int(80.90 * 1e9),
+            close=int(9000.90 * 1e9),
+            high=int(75.90 * 1e9),
+            low=int(8800.09 * 1e9),
+            volume=880000,
+        )
+        chunk = Mock()
+        chunk.replay.return_value = record
+        chunk.metadata.mappings.map = {21: "AAPL"}
+        self.adaptor.data = ChunkedRecords(lambda *_: chunk, [("a", "b")])
+        self.adaptor.id_map = {20: 1}
+
+        # Test
+        result = self.adaptor.next_record()
+
+        # Validate
+        self.assertEqual(result.instrument_id, 2)
+        self.assertEqual(self.adaptor.id_map, {20: 1, 21: 2})
+
     def test_process_exit(self):
         self.adaptor.data_stream = MagicMock()
         self.adaptor.cleanup = Mock()
@@ -225,7 +357,7 @@ class TestHistoricalAdaptor(unittest.TestCase):
             volume=880000,
         )
         self.adaptor.data.replay.return_value = record
-        self.adaptor.data.metadata.mappings.get_ticker.return_value = "HE.n.0"
+        self.adaptor.id_map = {1: 1}
         self.adaptor.mode = Mode.BACKTEST
 
         # Test
@@ -240,6 +372,227 @@ class TestHistoricalAdaptor(unittest.TestCase):
         self.assertEqual(args[0], EventType.DATA)
         self.assertEqual(args[1], record)
 
+    def test_next_batch(self):
+        self.adaptor.data = Mock()
+        records = [
+            OhlcvMsg(
+                instrument_id=1,
+                ts_event=1707221160000000000 + i,
+                rollover_flag=0,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for i in range(3)
+        ]
+        self.adaptor.data.replay.side_effect = records + [None]
+        self.adaptor.id_map = {1: 1}
+
+        # Test
+        batch = self.adaptor.next_batch(5)
+
+        # Validate
+        self.assertEqual(batch, records)
+        self.assertEqual(self.adaptor.next_batch(5), [])
+        self.assertEqual(self.adaptor.data.replay.call_count, 4)
+
+    def test_batch_stream_eod(self):
+        records = [Mock(), Mock(), Mock()]
+        self.adaptor.next_batch = Mock(return_value=records)
+        self.adaptor.eod_reached = Mock(side_effect=[False, True, False])
+        self.adaptor._await_eod_processed = Mock()
+        self.adaptor.current_date = datetime(2024, 10, 2).date()
+        self.adaptor.mode = Mode.BACKTEST
+        self.adaptor.batch_size = 3
+
+        # Test
+        self.bus.publish = MagicMock()
+        result = self.adaptor.data_stream()
+
+        # Validate
+        self.assertTrue(result)
+        calls = self.bus.publish.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[0][0], (EventType.DATA, records[:1]))
+        self.assertEqual(
+            calls[1][0],
+            (EventType.DATA, EODEvent(timestamp=self.adaptor.current_date)),
+        )
+        self.assertEqual(calls[2][0], (EventType.DATA, records[1:]))
+        self.assertTrue(self.adaptor._await_eod_processed.called)
+
+    def test_build_id_map(self):
+        # Test
+        id_map = self.adaptor.build_id_map({20: "HE.c.0", 21: "AAPL"})
+
+        # Validate
+        self.assertEqual(id_map, {20: 1, 21: 2})
+
+    def test_build_id_map_missing(self):
+        # Validate
+        with self.assertRaises(RuntimeError):
+            self.adaptor.build_id_map({20: "HE.c.0", 22: "LE.n.0"})
+
+    def test_next_record_unmapped(self):
+        self.adaptor.data = Mock()
+        self.adaptor.data.replay.return_value = OhlcvMsg(
+            instrument_id=99,
+            ts_event=1707221160000000000,
+            rollover_flag=0,
+            open=int(80.90 * 1e9),
+            close=int(9000.90 * 1e9),
+            high=int(75.90 * 1e9),
+            low=int(8800.09 * 1e9),
+            volume=880000,
+        )
+        self.adaptor.id_map = {1: 1}
+
+        # Validate
+        with self.assertRaises(RuntimeError):
+            self.adaptor.next_record()
+
+    def test_build_id_map_skip_missing(self):
+        # Test
+        id_map = self.adaptor.build_id_map(
+            {20: "HE.c.0", 22: "LE.n.0"}, skip_missing=True
+        )
+
+        # Validate
+        self.assertEqual(id_map, {20: 1})
+
+    def test_next_record_window(self):
+        records = [
+            OhlcvMsg(
+                instrument_id=1,
+                ts_event=ts,
+                rollover_flag=0,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for ts in [10, 20, 30]
+        ]
+        self.adaptor.data = Mock()
+        self.adaptor.data.replay.side_effect = records + [None]
+        self.adaptor.id_map = {1: 1}
+        self.adaptor.window = (15, 30)
+
+        # Validate
+        self.assertEqual(self.adaptor.next_record().ts_event, 20)
+        self.assertIsNone(self.adaptor.next_record())
+
+    def test_next_record_restrict_symbols(self):
+        records = [
+            OhlcvMsg(
+                instrument_id=id,
+                ts_event=1707221160000000000,
+                rollover_flag=0,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for id in [99, 1]
+        ]
+        self.adaptor.data = Mock()
+        self.adaptor.data.replay.side_effect = records + [None]
+        self.adaptor.id_map = {1: 1}
+        self.adaptor.restrict_symbols = True
+
+        # Test
+        record = self.adaptor.next_record()
+
+        # Validate
+        self.assertEqual(record.instrument_id, 1)
+        self.assertIsNone(self.adaptor.next_record())
+
+    def test_get_data_restrict(self):
+        # Symbols without corn, so only hogs records are replayed
+        symbols_map = SymbolMap()
+        symbols_map.add_symbol(self.symbols[0])
+        symbols_map.add_symbol(self.symbols[1])
+
+        # Parameters
+        params = Parameters(
+            strategy_name="Testing",
+            capital=10000000,
+            schema=Schema.OHLCV1_D,
+            dataset=Dataset.FUTURES,
+            stype=Stype.CONTINUOUS,
+            data_type=LiveDataType.BAR,
+            start="2024-10-01",
+            end="2024-10-05",
+            risk_free_rate=0.9,
+            symbols=self.symbols[:2],
+        )
+
+        kwargs = {
+            "data_file": "tests/unit/he_zc_ohlcv-1h.bin",
+            "memory_map": True,
+            "restrict_window": True,
+            "restrict_symbols": True,
+        }
+        adaptor = HistoricalAdaptor(symbols_map, self.bus, **kwargs)
+        data = BufferStore.from_file("tests/unit/he_zc_ohlcv-1h.bin")
+        hogs_id = next(
+            i for i, t in data.metadata.mappings.map.items() if t == "HE.c.0"
+        )
+
+        # Test
+        adaptor.get_data(params)
+        start, end = adaptor.window
+        expected = []
+
+        while (record := data.replay()) is not None:
+            if (
+                record.instrument_id == hogs_id
+                and start <= record.ts_event < end
+            ):
+                expected.append(record.ts_event)
+
+        records = []
+
+        while (record := adaptor.next_record()) is not None:
+            records.append(record)
+
+        # Validate
+        self.assertEqual(adaptor.id_map, {hogs_id: 1})
+        self.assertTrue(expected)
+        self.assertEqual([r.ts_event for r in records], expected)
+        self.assertTrue(all(r.instrument_id == 1 for r in records))
+
+    def test_load_data_file_shared(self):
+        path = "tests/unit/he_zc_ohlcv-1h.bin"
+        share_data_files([path])
+        self.addCleanup(lambda: _shared_files.pop(path).close())
+
+        # Test
+        first = load_data_file(path)
+        first.replay()
+        second = load_data_file(path)
+        first.close()
+
+        # Validate
+        self.assertIsNot(first, second)
+        self.assertIs(first._map, second._map)
+        self.assertEqual(second.offset, second.header_size)
+        self.assertIsNotNone(second.replay())
+
+    def test_invalid_batch_size(self):
+        # Validate
+        with self.assertRaises(ValueError):
+            HistoricalAdaptor(
+                self.symbols_map,
+                self.bus,
+                data_file="tests/unit/he_zc_ohlcv-1h.bin",
+                batch_size=0,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from mbinary import BufferStore
+
+from midastrader.data.adaptors.historical.reader import (
+    TS_EVENT_OFFSET,
+    MappedDataFile,
+)
+from midastrader.data.adaptors.historical.index import (
+    NANOS_PER_DAY,
+    TimeIndex,
+    index_data_file,
+    sidecar_path,
+)
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "he_zc_ohlcv-1h.bin",
+)
+
+
+def replay_all(data) -> list:
+    records = []
+
+    while (record := data.replay()) is not None:
+        records.append(record)
+
+    return records
+
+
+class TestTimeIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "data.bin")
+        shutil.copy(DATA_FILE, self.path)
+        self.expected = replay_all(BufferStore.from_file(DATA_FILE))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    # Basic Validation
+    def test_build(self):
+        data = MappedDataFile(self.path)
+
+        # Test
+        index = TimeIndex.build(data, every=100)
+
+        # Validate
+        self.assertEqual(len(index.offsets), (len(self.expected) + 99) // 100)
+        self.assertEqual(index.offsets[0], data.header_size)
+        self.assertEqual(index.timestamps[1], self.expected[100].ts_event)
+        self.assertEqual(index.file_size, data.size)
+        data.close()
+
+    def test_save_load(self):
+        # Test
+        index = index_data_file(self.path, every=100)
+        loaded = TimeIndex.for_file(self.path)
+
+        # Validate
+        self.assertTrue(os.path.exists(sidecar_path(self.path)))
+        self.assertEqual(loaded.every, 100)
+        self.assertEqual(loaded.file_size, index.file_size)
+        self.assertEqual(loaded.file_mtime, index.file_mtime)
+        self.assertEqual(loaded.fingerprint, index.fingerprint)
+        self.assertEqual(list(loaded.offsets), list(index.offsets))
+        self.assertEqual(list(loaded.days), list(index.days))
+
+    def test_for_file_missing(self):
+        # Validate
+        self.assertIsNone(TimeIndex.for_file(self.path))
+
+    def test_for_file_stale(self):
+        index_data_file(self.path)
+
+        with open(self.path, "ab") as f:
+            f.write(b"\x00" * 64)
+
+        # Validate
+        self.assertIsNone(TimeIndex.for_file(self.path))
+
+    def test_for_file_same_size_rewrite(self):
+        index = index_data_file(self.path)
+        stat = os.stat(self.path)
+
+        with open(self.path, "r+b") as f:
+            f.seek(index.last_offset + TS_EVENT_OFFSET)
+            f.write((self.expected[-1].ts_event + 1).to_bytes(8, "little"))
+
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # Validate
+        self.assertEqual(os.path.getsize(self.path), index.file_size)
+        self.assertIsNone(TimeIndex.for_file(self.path))
+
+    def test_for_file_touched(self):
+        index_data_file(self.path)
+        stat = os.stat(self.path)
+
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # Validate
+        self.assertIsNone(TimeIndex.for_file(self.path))
+
+    def test_day_offset(self):
+        index = index_data_file(self.path)
+        data = MappedDataFile(self.path)
+        first = self.expected[0].ts_event
+        day = datetime.fromtimestamp(first / 1e9, tz=timezone.utc).date()
+
+        # Test
+        offset = index.day_offset(day)
+
+        # Validate
+        self.assertEqual(offset, data.header_size)
+        self.assertIsNone(index.day_offset(date(2000, 1, 1)))
+        data.close()
+
+    def test_find_offset_with_index(self):
+        index = index_data_file(self.path, every=100)
+        indexed = MappedDataFile(self.path, index=index)
+        plain = MappedDataFile(self.path)
+        plain.record_size = None
+
+        # Validate
+        for record in self.expected[::37] + [self.expected[-1]]:
+            for ts in (record.ts_event, record.ts_event + 1):
+                self.assertEqual(
+                    indexed.find_offset(ts), plain.find_offset(ts)
+                )
+        indexed.close()
+        plain.close()
+
+    def test_find_offset_day_start(self):
+        index = index_data_file(self.path, every=100)
+        indexed = MappedDataFile(self.path, index=index)
+        plain = MappedDataFile(self.path)
+        plain.record_size = None
+        first = self.expected[0].ts_event // NANOS_PER_DAY
+        last = self.expected[-1].ts_event // NANOS_PER_DAY
+
+        # Validate
+        for day in range(first - 1, last + 2):
+            ts = day * NANOS_PER_DAY
+            self.assertEqual(index.offset_at(ts), plain.find_offset(ts))
+            self.assertEqual(indexed.find_offset(ts), plain.find_offset(ts))
+        self.assertIsNone(index.offset_at(first * NANOS_PER_DAY + 1))
+        indexed.close()
+        plain.close()
+
+    # Type Check
+    def test_invalid_every(self):
+        data = MappedDataFile(self.path)
+
+        with self.assertRaises(ValueError):
+            TimeIndex.build(data, every=0)
+        data.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
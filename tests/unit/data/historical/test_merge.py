@@ -0,0 +1,179 @@
+import os
+import tempfile
+import unittest
+from itertools import groupby
+from unittest.mock import Mock
+from mbinary import BufferStore
+
+from midastrader.data.adaptors.historical.merge import (
+    MergedRecords,
+    expand_data_files,
+)
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "he_zc_ohlcv-1h.bin",
+)
+
+
+def make_source(timestamps: list, mappings: dict, start=0, end=100) -> Mock:
+    source = Mock()
+    source.replay.side_effect = [Mock(ts_event=ts) for ts in timestamps] + [
+        None
+    ]
+    source.metadata.schema = "ohlcv-1h"
+    source.metadata.start = start
+    source.metadata.end = end
+    source.metadata.mappings.map = mappings
+    return source
+
+
+def record_key(record) -> tuple:
+    return (record.ts_event, record.instrument_id, record.rollover_flag)
+
+
+def replay_all(data) -> list:
+    records = []
+
+    while (record := data.replay()) is not None:
+        records.append(record)
+
+    return records
+
+
+class TestExpandDataFiles(unittest.TestCase):
+    # Basic Validation
+    def test_path(self):
+        # Validate
+        self.assertEqual(expand_data_files("a.bin"), ["a.bin"])
+        self.assertEqual(expand_data_files(""), [])
+
+    def test_glob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ["b.bin", "a.bin", "c.txt"]:
+                open(os.path.join(tmp, name), "w").close()
+
+            # Test
+            paths = expand_data_files([os.path.join(tmp, "*.bin"), "d.bin"])
+
+        # Validate
+        self.assertEqual(
+            paths,
+            [os.path.join(tmp, "a.bin"), os.path.join(tmp, "b.bin"), "d.bin"],
+        )
+
+    def test_glob_no_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # Validate
+            with self.assertRaises(FileNotFoundError):
+                expand_data_files(os.path.join(tmp, "*.bin"))
+
+
+class TestMergedRecords(unittest.TestCase):
+    # Basic Validation
+    def test_replay_ordered(self):
+        sources = [
+            make_source([1, 4, 6], {1: "HE.c.0"}),
+            make_source([2, 3, 7], {2: "ZC.c.0"}),
+            make_source([], {}),
+        ]
+
+        # Test
+        data = MergedRecords(sources)
+        records = replay_all(data)
+
+        # Validate
+        self.assertEqual([r.ts_event for r in records], [1, 2, 3, 4, 6, 7])
+        self.assertIsNone(data.replay())
+
+    def test_ties_follow_source_order(self):
+        first = make_source([5], {})
+        second = make_source([5], {})
+        first.replay.side_effect = [Mock(ts_event=5, source=1), None]
+        second.replay.side_effect = [Mock(ts_event=5, source=2), None]
+
+        # Test
+        records = replay_all(MergedRecords([second, first]))
+
+        # Validate
+        self.assertEqual([r.source for r in records], [2, 1])
+
+    def test_metadata(self):
+        sources = [
+            make_source([], {1: "HE.c.0"}, start=10, end=50),
+            make_source([], {2: "ZC.c.0"}, start=40, end=90),
+        ]
+
+        # Test
+        metadata = MergedRecords(sources).metadata
+
+        # Validate
+        self.assertEqual(metadata.schema, "ohlcv-1h")
+        self.assertEqual(metadata.start, 10)
+        self.assertEqual(metadata.end, 90)
+        self.assertEqual(metadata.mappings.map, {1: "HE.c.0", 2: "ZC.c.0"})
+
+    def test_files(self):
+        expected = replay_all(BufferStore.from_file(DATA_FILE))
+
+        # Test
+        data = MergedRecords(
+            [
+                BufferStore.from_file(DATA_FILE),
+                BufferStore.from_file(DATA_FILE),
+            ]
+        )
+        records = replay_all(data)
+
+        # Validate
+        # Records sharing a timestamp come from the first file, then the second
+        order = []
+        for _, group in groupby(expected, key=lambda r: r.ts_event):
+            group = [record_key(r) for r in group]
+            order.extend(group + group)
+
+        self.assertEqual([record_key(r) for r in records], order)
+        self.assertIn(1, [r.rollover_flag for r in records])
+
+    def test_restrict(self):
+        # Restarts at 5 once restricted
+        restricted = make_source([1, 5], {})
+        fixed = Mock(spec=["metadata", "replay"])
+        fixed.metadata = make_source([], {}).metadata
+        fixed.replay.side_effect = [Mock(ts_event=t) for t in [2, 6]] + [None]
+        data = MergedRecords([restricted, fixed])
+
+        # Test
+        data.restrict(4, 8, [1])
+        records = replay_all(data)
+
+        # Validate
+        restricted.restrict.assert_called_once_with(4, 8, {1})
+        self.assertEqual([r.ts_event for r in records], [2, 5, 6])
+
+    # Type Check
+    def test_no_sources(self):
+        with self.assertRaises(ValueError):
+            MergedRecords([])
+
+    def test_conflicting_mappings(self):
+        sources = [
+            make_source([], {1: "HE.c.0"}),
+            make_source([], {1: "ZC.c.0"}),
+        ]
+
+        # Validate
+        with self.assertRaises(ValueError):
+            MergedRecords(sources)
+
+    def test_schema_mismatch(self):
+        sources = [make_source([], {}), make_source([], {})]
+        sources[1].metadata.schema = "ohlcv-1d"
+
+        # Validate
+        with self.assertRaises(ValueError):
+            MergedRecords(sources)
+
+
+if __name__ == "__main__":
+    unittest.main()
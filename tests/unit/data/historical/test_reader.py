@@ -0,0 +1,210 @@
+import os
+import struct
+import tempfile
+import unittest
+from mbinary import BufferStore
+
+from midastrader.data.adaptors.historical.reader import MappedDataFile
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "he_zc_ohlcv-1h.bin",
+)
+
+
+def replay_all(data) -> list:
+    records = []
+
+    while (record := data.replay()) is not None:
+        records.append(record)
+
+    return records
+
+
+def record_key(record) -> tuple:
+    return (record.hd.instrument_id, record.hd.ts_event, record.pretty_price)
+
+
+def write_mixed_file(path: str, count: int) -> list:
+    # Records alternating between one and two times the fixture's record length
+    with open(DATA_FILE, "rb") as f:
+        content = f.read()
+
+    (length,) = struct.unpack_from("<H", content, 0)
+    header_size = 2 + length
+    size = content[header_size] * 4
+    rtype = content[header_size + 1]
+    offsets = []
+    body = b""
+
+    for i in range(count):
+        record_size = size * (1 + i % 2)
+        offsets.append(header_size + len(body))
+        body += struct.pack(
+            "<BBHIQ", record_size // 4, rtype, 0, 1, 1000 + i
+        ).ljust(record_size, b"\xff")
+
+    with open(path, "wb") as f:
+        f.write(content[:header_size] + body)
+
+    return offsets
+
+
+class TestMappedDataFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.expected = BufferStore.from_file(DATA_FILE)
+
+    # Basic Validation
+    def test_metadata(self):
+        # Test
+        data = MappedDataFile(DATA_FILE)
+
+        # Validate
+        self.assertEqual(data.metadata.schema, self.expected.metadata.schema)
+        self.assertEqual(data.metadata.start, self.expected.metadata.start)
+        self.assertEqual(data.metadata.end, self.expected.metadata.end)
+        self.assertEqual(
+            data.metadata.mappings.map,
+            self.expected.metadata.mappings.map,
+        )
+        self.assertEqual(data.offset, data.header_size)
+        data.close()
+
+    def test_replay(self):
+        expected = replay_all(self.expected)
+
+        # Test
+        data = MappedDataFile(DATA_FILE, chunk_size=1000)
+        records = replay_all(data)
+
+        # Validate
+        self.assertEqual(len(records), len(expected))
+        self.assertEqual(
+            [record_key(r) for r in records],
+            [record_key(r) for r in expected],
+        )
+        self.assertIsNone(data.replay())
+        self.assertEqual(data.offset, data.size)
+        data.close()
+
+    def test_ts_event(self):
+        expected = replay_all(self.expected)
+        data = MappedDataFile(DATA_FILE)
+
+        # Test
+        first = data.header_size
+        second = data.record_end(first)
+
+        # Validate
+        self.assertEqual(data.ts_event(first), expected[0].ts_event)
+        self.assertEqual(data.ts_event(second), expected[1].ts_event)
+        data.close()
+
+    def test_seek(self):
+        expected = replay_all(self.expected)
+        data = MappedDataFile(DATA_FILE, chunk_size=1000)
+        replay_all(data)
+
+        # Test
+        data.seek(data.record_end(data.header_size))
+
+        # Validate
+        self.assertEqual(record_key(data.replay()), record_key(expected[1]))
+        data.close()
+
+    def test_find_offset(self):
+        expected = replay_all(self.expected)
+        data = MappedDataFile(DATA_FILE)
+        ts = expected[100].ts_event
+
+        # Test
+        offset = data.find_offset(ts)
+
+        # Validate
+        self.assertIsNotNone(data.record_size)
+        self.assertEqual(data.ts_event(offset), ts)
+        self.assertLess(data.ts_event(offset - data.record_size), ts)
+        self.assertEqual(
+            data.find_offset(expected[-1].ts_event + 1), data.size
+        )
+        data.close()
+
+    def test_find_offset_mixed_lengths(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mixed.bin")
+            offsets = write_mixed_file(path, 10)
+            data = MappedDataFile(path)
+
+            # Test
+            found = [data.find_offset(1000 + i) for i in range(10)]
+            data.close()
+
+        # Validate
+        self.assertIsNone(data.record_size)
+        self.assertEqual(found, offsets)
+
+    def test_find_offset_wrong_record_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mixed.bin")
+            offsets = write_mixed_file(path, 10)
+            data = MappedDataFile(path)
+            data.record_size = offsets[1] - offsets[0]
+
+            # Test
+            offset = data.find_offset(1008)
+            data.close()
+
+        # Validate
+        self.assertIsNone(data.record_size)
+        self.assertEqual(offset, offsets[8])
+
+    def test_restrict(self):
+        expected = replay_all(self.expected)
+        start = expected[100].ts_event
+        end = expected[500].ts_event
+        instrument_id = expected[0].hd.instrument_id
+        expected = [
+            r
+            for r in expected
+            if start <= r.ts_event < end
+            and r.hd.instrument_id == instrument_id
+        ]
+        data = MappedDataFile(DATA_FILE, chunk_size=1000)
+
+        # Test
+        data.restrict(start, end, [instrument_id])
+        records = replay_all(data)
+
+        # Validate
+        self.assertEqual(
+            [record_key(r) for r in records],
+            [record_key(r) for r in expected],
+        )
+        data.close()
+
+    def test_view(self):
+        expected = replay_all(self.expected)
+        data = MappedDataFile(DATA_FILE, chunk_size=1000)
+        data.restrict(expected[100].ts_event)
+
+        # Test
+        view = data.view()
+        records = replay_all(view)
+        view.close()
+
+        # Validate
+        self.assertEqual(
+            [record_key(r) for r in records],
+            [record_key(r) for r in expected],
+        )
+        self.assertEqual(record_key(data.replay()), record_key(expected[100]))
+        data.close()
+
+    # Type Check
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            MappedDataFile(DATA_FILE, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+from midastrader.data.adaptors.historical.stream import (
+    ChunkedRecords,
+    chunk_ranges,
+)
+
+
+def make_chunk(records: list) -> Mock:
+    chunk = Mock()
+    chunk.replay.side_effect = records + [None]
+    return chunk
+
+
+class TestChunkRanges(unittest.TestCase):
+    # Basic Validation
+    def test_dates(self):
+        # Test
+        ranges = chunk_ranges("2024-01-01", "2024-01-20", 7)
+
+        # Validate
+        self.assertEqual(
+            ranges,
+            [
+                ("2024-01-01", "2024-01-08"),
+                ("2024-01-08", "2024-01-15"),
+                ("2024-01-15", "2024-01-20"),
+            ],
+        )
+
+    def test_datetimes(self):
+        # Test
+        ranges = chunk_ranges("2024-01-01T12:00:00", "2024-01-02T18:00:00", 1)
+
+        # Validate
+        self.assertEqual(
+            ranges,
+            [
+                ("2024-01-01T12:00:00", "2024-01-02T12:00:00"),
+                ("2024-01-02T12:00:00", "2024-01-02T18:00:00"),
+            ],
+        )
+
+    def test_single(self):
+        # Validate
+        self.assertEqual(
+            chunk_ranges("2024-01-01", "2024-01-05", 30),
+            [("2024-01-01", "2024-01-05")],
+        )
+
+    # Type Check
+    def test_invalid_days(self):
+        with self.assertRaises(ValueError):
+            chunk_ranges("2024-01-01", "2024-01-05", 0)
+
+
+class TestChunkedRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ranges = [("a", "b"), ("b", "c"), ("c", "d")]
+
+    # Basic Validation
+    def test_replay(self):
+        chunks = {
+            "a": make_chunk([1, 2]),
+            "b": make_chunk([]),
+            "c": make_chunk([3]),
+        }
+
+        # Test
+        data = ChunkedRecords(lambda start, _: chunks[start], self.ranges)
+        records = [data.replay() for _ in range(4)]
+
+        # Validate
+        self.assertEqual(records, [1, 2, 3, None])
+        self.assertIsNone(data.replay())
+        self.assertIs(data.metadata, chunks["c"].metadata)
+
+    def test_metadata_follows_chunk(self):
+        chunks = {
+            "a": make_chunk([1]),
+            "b": make_chunk([2]),
+            "c": make_chunk([]),
+        }
+        data = ChunkedRecords(lambda start, _: chunks[start], self.ranges)
+
+        # Test
+        first = data.metadata
+        data.replay()
+        data.replay()
+
+        # Validate
+        self.assertIs(first, chunks["a"].metadata)
+        self.assertIs(data.metadata, chunks["b"].metadata)
+
+    def test_prefetch_bounded(self):
+        fetch = Mock(side_effect=lambda *_: make_chunk([1]))
+        ranges = [(str(i), str(i + 1)) for i in range(10)]
+
+        # Test
+        data = ChunkedRecords(fetch, ranges, prefetch=1)
+        time.sleep(0.5)
+
+        # Validate
+        # The replayed chunk, one queued and one waiting for space
+        self.assertEqual(fetch.call_count, 3)
+        data.close()
+
+    def test_fetch_error(self):
+        def fetch(start, _):
+            if start == "b":
+                raise ConnectionError("lost")
+            return make_chunk([1])
+
+        data = ChunkedRecords(fetch, self.ranges)
+
+        # Validate
+        self.assertEqual(data.replay(), 1)
+        with self.assertRaises(ConnectionError):
+            data.replay()
+
+    # Type Check
+    def test_invalid_ranges(self):
+        with self.assertRaises(ValueError):
+            ChunkedRecords(Mock(), [])
+
+    def test_invalid_prefetch(self):
+        with self.assertRaises(ValueError):
+            ChunkedRecords(Mock(), self.ranges, prefetch=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
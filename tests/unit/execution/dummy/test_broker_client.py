@@ -103,13 +103,15 @@ class TestDummyAdaptor(unittest.TestCase):
 
         event = OrderEvent(timestamp, order)
 
+        trade_queue = self.bus.subscribe(EventType.TRADE)
+
         # Test
         threading.Thread(target=self.adaptor.process, daemon=True).start()
         self.bus.publish(EventType.ORDER, event)
         sleep(1)
 
         # Validate
-        self.assertEqual(self.bus.topics[EventType.TRADE].get(), event)
+        self.assertEqual(trade_queue.get(), event)
 
     # def test_handle_event_order(self):
     #     # Test
@@ -374,11 +374,11 @@ class TestDummyClient(unittest.TestCase):
         self.broker.account.full_maint_margin_req = 2000
 
         # Test
-        self.logger.logger.info = Mock()
+        self.broker.logger.info = Mock()
         self.broker.check_margin_call()
 
         # Validate
-        self.logger.logger.info.assert_called_with("Margin call triggered.")
+        self.broker.logger.info.assert_called_with("Margin call triggered.")
 
     def test_check_margin_call_no_call(self):
         # No Margin Call
@@ -386,11 +386,11 @@ class TestDummyClient(unittest.TestCase):
         self.broker.account.full_maint_margin_req = 200
 
         # Test
-        self.logger.logger.info = Mock()
+        self.broker.logger.info = Mock()
         self.broker.check_margin_call()
 
         # Validate
-        self.logger.logger.info.assert_not_called()
+        self.broker.logger.info.assert_not_called()
 
     def test_liquidate_positions(self):
         self.bus.publish = Mock()
@@ -247,15 +247,11 @@ class TestBrokerApp(unittest.TestCase):
         # Validate
         calls = self.bus.publish.call_args_list
 
-        # Validate the first call
+        # Validate the call
+        self.assertEqual(len(calls), 1)
         first_call_args = calls[0][0]
         self.assertEqual(first_call_args[0], EventType.ACCOUNT_UPDATE)
         self.assertEqual(first_call_args[1], self.broker_app.account_info)
-
-        # Validate the second call
-        second_call_args = calls[1][0]
-        self.assertEqual(second_call_args[0], EventType.ACCOUNT_UPDATE_LOG)
-        self.assertEqual(second_call_args[1], self.broker_app.account_info)
         self.assertTrue(self.broker_app.account_info.timestamp > 0)
         self.assertIsNone(self.broker_app.account_update_timer)
 
@@ -567,21 +563,16 @@ class TestBrokerApp(unittest.TestCase):
         self.broker_app.accountSummaryEnd(reqId)
 
         # Validate
-        self.assertEqual(self.bus.publish.call_count, 2)
+        self.assertEqual(self.bus.publish.call_count, 1)
 
         # Access all calls made to publish
         calls = self.bus.publish.call_args_list
 
-        # Validate the first call
+        # Validate the call
         first_call_args = calls[0][0]
         self.assertEqual(first_call_args[0], EventType.ACCOUNT_UPDATE)
         self.assertEqual(first_call_args[1], self.broker_app.account_info)
 
-        # Validate the second call
-        second_call_args = calls[1][0]
-        self.assertEqual(second_call_args[0], EventType.ACCOUNT_UPDATE_LOG)
-        self.assertEqual(second_call_args[1], self.broker_app.account_info)
-
     def test_execDetails(self):
         # Execution details
         reqId = 1
@@ -88,6 +88,14 @@ class TestMarketEvent(unittest.TestCase):
                 data={1: 1, 2: 1, 3: 1},  # pyright: ignore
                 timestamp=self.timestamp,
             )
+        with self.assertRaisesRegex(
+            TypeError, "'merged' must be of type int."
+        ):
+            MarketEvent(
+                data=self.bar,
+                timestamp=self.timestamp,
+                merged="2",  # pyright: ignore
+            )
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from midastrader.config import Mode
+from midastrader.message_bus import EventType, OverflowPolicy
 from midastrader.engine import EngineBuilder, Engine
+from midastrader.core.adapters.performance.pipeline import ResultsPipeline
+from tests.unit.random_logic import RandomSignalStrategy
 
 
 class TestEngineBuilder(unittest.TestCase):
@@ -13,6 +16,127 @@ class TestEngineBuilder(unittest.TestCase):
         # Validate
         self.assertIsInstance(engine, Engine)
 
+    def test_construction_isolated(self):
+        # Test
+        first = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+        second = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+
+        # Validate
+        self.assertIsNot(first.order_book, second.order_book)
+        self.assertIsNot(first.portfolio_server, second.portfolio_server)
+        self.assertIsNot(first.logger, second.logger)
+
+        adapters = first.core_engine.adapters
+        self.assertIs(adapters["order_book"].book, first.order_book)
+        self.assertIs(adapters["order_manager"].order_book, first.order_book)
+        self.assertIs(
+            adapters["portfolio_server"].server,
+            first.portfolio_server,
+        )
+        self.assertIs(
+            first.execution_engine.adapters[0].broker.order_book,
+            first.order_book,
+        )
+        self.assertIs(adapters["order_book"].logger, first.logger.logger)
+        self.assertIs(first.build().logger, first.logger.logger)
+
+    def test_wait_for_results_stops_logger(self):
+        first = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST).build()
+        handlers = list(first.system_logger.logger.handlers)
+
+        # Test
+        first.wait_for_results()
+        second = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST).build()
+
+        # Validate
+        self.assertTrue(handlers)
+        for handler in handlers:
+            self.assertIsNone(handler.stream)
+        self.assertEqual(first.system_logger.logger.handlers, [])
+        self.assertFalse(first.system_logger.flusher_thread.is_alive())
+        self.assertTrue(second.system_logger.flusher_thread.is_alive())
+        self.assertIsNotNone(second.system_logger.logger.handlers[0].stream)
+        second.stop()
+
+    def test_stop_shuts_down_own_pipeline(self):
+        shared = ResultsPipeline(1)
+        self.addCleanup(shared.shutdown)
+
+        with patch.object(
+            EngineBuilder,
+            "create_results_pipeline",
+            return_value=ResultsPipeline(1),
+        ):
+            engine = EngineBuilder(
+                "tests/unit/config.toml", Mode.BACKTEST
+            ).build()
+        other = EngineBuilder(
+            "tests/unit/config.toml", Mode.BACKTEST, shared
+        ).build()
+
+        # Test
+        engine.stop()
+        other.stop()
+
+        # Validate
+        self.assertIsNone(other.pipeline)
+        with self.assertRaises(RuntimeError):
+            engine.pipeline.executor.submit(print)
+        shared.executor.submit(print).result()
+
+    def test_create_messagebus(self):
+        builder = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+        builder.mode = Mode.LIVE
+        builder.config.queue_capacity = 100
+        builder.config.queues = {
+            "data": {"capacity": 10, "policy": "conflate"}
+        }
+
+        # Test
+        bus = builder.create_messagebus()
+
+        # Validate
+        data_queue = bus.subscribe(EventType.DATA)
+        self.assertEqual(data_queue.capacity, 10)
+        self.assertEqual(data_queue.policy, OverflowPolicy.CONFLATE)
+        self.assertEqual(bus.subscribe(EventType.ORDER_BOOK).capacity, 100)
+        self.assertIsNone(bus.subscribe(EventType.ORDER).capacity)
+
+    def test_create_messagebus_control_topic(self):
+        builder = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+        builder.mode = Mode.LIVE
+        builder.config.queues = {"order": {"capacity": 10}}
+
+        # Validate
+        with self.assertRaises(ValueError):
+            builder.create_messagebus()
+
+    def test_create_messagebus_backtest(self):
+        builder = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+
+        # Validate
+        builder.config.queue_capacity = 1
+        with self.assertRaises(ValueError):
+            builder.create_messagebus()
+
+        builder.config.queue_capacity = None
+        builder.config.queues = {"order_book": {"policy": "latest"}}
+        with self.assertRaises(ValueError):
+            builder.create_messagebus()
+
+        builder.config.queues = {}
+        self.assertIsNone(
+            builder.create_messagebus().subscribe(EventType.DATA).capacity
+        )
+
+    def test_create_messagebus_invalid_topic(self):
+        builder = EngineBuilder("tests/unit/config.toml", Mode.BACKTEST)
+        builder.config.queues = {"quotes": {"capacity": 10}}
+
+        # Validate
+        with self.assertRaises(ValueError):
+            builder.create_messagebus()
+
 
 class TestEngineBacktest(unittest.TestCase):
     def setUp(self) -> None:
@@ -32,6 +156,55 @@ class TestEngineBacktest(unittest.TestCase):
         self.assertTrue(self.engine.core_engine.set_strategy.call_count, 1)
         self.assertTrue(self.engine.core_engine.set_risk_model, 1)
 
+    def test_initialize_strategy_state(self):
+        # Test
+        self.engine.initialize()
+
+        # Validate
+        strategy = self.engine.core_engine.adapters["strategy"]
+        self.assertIs(strategy.order_book, self.engine.core_engine.order_book)
+        self.assertIs(
+            strategy.portfolio_server,
+            self.engine.core_engine.portfolio_server,
+        )
+
+    def test_initialize_two_argument_strategy(self):
+        class TwoArgumentStrategy(RandomSignalStrategy):
+            def __init__(self, symbols_map, bus):
+                super().__init__(symbols_map, bus)
+
+        # Test
+        with patch(
+            "midastrader.engine.load_strategy_class",
+            return_value=TwoArgumentStrategy,
+        ):
+            self.engine.initialize()
+
+        # Validate
+        strategy = self.engine.core_engine.adapters["strategy"]
+        self.assertIsInstance(strategy, TwoArgumentStrategy)
+        self.assertIs(strategy.order_book, self.engine.core_engine.order_book)
+        self.assertIs(
+            strategy.portfolio_server,
+            self.engine.core_engine.portfolio_server,
+        )
+        self.assertIs(strategy.logger, self.engine.logger)
+
+    def test_set_strategy_other_state(self):
+        strategy = RandomSignalStrategy(
+            self.engine.symbols_map, self.engine.bus
+        )
+
+        # Test
+        self.engine.core_engine.set_strategy(strategy)
+
+        # Validate
+        self.assertIs(strategy.order_book, self.engine.core_engine.order_book)
+        self.assertIs(
+            strategy.portfolio_server,
+            self.engine.core_engine.portfolio_server,
+        )
+
     def test_start_backtest(self):
         self.engine._backtest_loop = MagicMock()
         self.engine.logger.info = MagicMock()
@@ -49,6 +222,23 @@ class TestEngineBacktest(unittest.TestCase):
         # Validate
         self.assertTrue(self.engine._backtest_loop.call_count == 1)
 
+    def test_start_backtest_synchronous(self):
+        self.engine._synchronous_backtest_loop = MagicMock()
+        self.engine.logger.info = MagicMock()
+        self.engine.core_engine.start = MagicMock()
+        self.engine.data_engine.start = MagicMock()
+        self.engine.execution_engine.start = MagicMock()
+        self.engine.config.synchronous_backtest = True
+
+        # Test
+        self.engine.mode = Mode.BACKTEST
+        self.engine.start()
+
+        # Validate
+        self.assertTrue(self.engine._synchronous_backtest_loop.call_count == 1)
+        self.assertFalse(self.engine.core_engine.start.called)
+        self.assertFalse(self.engine.data_engine.start.called)
+
 
 class TestEngineLive(unittest.TestCase):
     def setUp(self) -> None:
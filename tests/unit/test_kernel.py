@@ -0,0 +1,136 @@
+import unittest
+from mbinary import OhlcvMsg
+from unittest.mock import Mock, MagicMock
+
+from midastrader.kernel import BacktestKernel
+from midastrader.structs.symbol import SymbolMap
+from midastrader.structs.events import MarketEvent, SignalEvent
+from midastrader.message_bus import MessageBus, EventType
+from midastrader.utils.logger import SystemLogger
+
+
+class TestBacktestKernel(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.bus = MessageBus()
+        self.record = OhlcvMsg(
+            instrument_id=1,
+            ts_event=1707221160000000000,
+            rollover_flag=0,
+            open=int(80.90 * 1e9),
+            close=int(9000.90 * 1e9),
+            high=int(75.90 * 1e9),
+            low=int(8800.09 * 1e9),
+            volume=880000,
+        )
+
+        # Components
+        self.data_adaptor = Mock()
+        self.data_adaptor.next_record.side_effect = [self.record, None]
+        self.data_adaptor.eod_reached.return_value = False
+
+        self.order_book_manager = Mock()
+        self.order_book_manager.book.tickers_loaded = True
+
+        self.portfolio_manager = Mock()
+        self.portfolio_manager.order_queue = self.bus.subscribe(
+            EventType.ORDER_UPDATE
+        )
+        self.portfolio_manager.position_queue = self.bus.subscribe(
+            EventType.POSITION_UPDATE
+        )
+        self.portfolio_manager.account_queue = self.bus.subscribe(
+            EventType.ACCOUNT_UPDATE
+        )
+        self.portfolio_manager.server.account_manager.initial_data = True
+
+        self.performance_manager = Mock()
+        self.performance_manager.account_queue = self.bus.subscribe(
+            EventType.ACCOUNT_UPDATE
+        )
+        self.performance_manager.equity_queue = self.bus.subscribe(
+            EventType.EQUITY_UPDATE
+        )
+        self.performance_manager.signal_queue = self.bus.subscribe(
+            EventType.SIGNAL
+        )
+        self.performance_manager.trade_queue = self.bus.subscribe(
+            EventType.TRADE_UPDATE
+        )
+
+        self.order_manager = Mock()
+        self.order_manager.signal_queue = self.bus.subscribe(EventType.SIGNAL)
+
+        self.strategy = Mock()
+
+        self.execution_adaptor = Mock()
+        self.execution_adaptor.order_queue = self.bus.subscribe(
+            EventType.ORDER
+        )
+
+        self.kernel = BacktestKernel(
+            symbols_map=SymbolMap(),
+            bus=self.bus,
+            data_adaptor=self.data_adaptor,
+            order_book_manager=self.order_book_manager,
+            portfolio_manager=self.portfolio_manager,
+            order_manager=self.order_manager,
+            performance_manager=self.performance_manager,
+            strategy=self.strategy,
+            execution_adaptor=self.execution_adaptor,
+        )
+
+    # Basic Validation
+    def test_run(self):
+        # Test
+        self.kernel.run()
+
+        # Validate
+        self.order_book_manager.book._update.assert_called_with(self.record)
+        self.assertTrue(self.execution_adaptor.broker._update_account.called)
+        self.strategy.handle_event.assert_called_once_with(
+            MarketEvent(self.record.ts_event, self.record)
+        )
+        self.assertTrue(self.strategy.handle_initial_data.called)
+        self.assertTrue(self.bus.get_flag(EventType.INITIAL_DATA))
+        self.assertTrue(
+            self.execution_adaptor.broker.liquidate_positions.called
+        )
+        self.assertTrue(self.performance_manager.save.called)
+
+    def test_run_eod(self):
+        self.data_adaptor.eod_reached.return_value = True
+
+        # Test
+        self.kernel.run()
+
+        # Validate
+        self.assertTrue(self.execution_adaptor.broker.mark_to_market.called)
+        self.assertTrue(self.execution_adaptor.broker.return_account.called)
+
+    def test_dispatch_signal(self):
+        signal = Mock(spec=SignalEvent)
+        order = Mock()
+        self.order_manager.handle_event.side_effect = (
+            lambda _: self.bus.publish(EventType.ORDER, order)
+        )
+
+        # Test
+        self.bus.publish(EventType.SIGNAL, signal)
+        self.kernel._dispatch()
+
+        # Validate
+        self.order_manager.handle_event.assert_called_once_with(signal)
+        self.execution_adaptor.broker._handle_trade.assert_called_once_with(
+            order
+        )
+        self.performance_manager.signal_manager.update_signals.assert_called_once_with(
+            signal
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,329 @@
+import queue
+import unittest
+from types import SimpleNamespace
+from dataclasses import dataclass
+import threading
+from time import sleep
+
+from midastrader.message_bus import (
+    MessageBus,
+    EventType,
+    Channel,
+    ConflatingChannel,
+    OverflowPolicy,
+)
+
+
+@dataclass
+class Update:
+    instrument_id: int
+    price: float
+    merged: int = 0
+
+
+class TestMessageBus(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bus = MessageBus()
+
+    # Basic Validation
+    def test_publish_queue(self):
+        data_queue = self.bus.subscribe(EventType.DATA)
+
+        # Test
+        self.bus.publish(EventType.DATA, 1)
+
+        # Validate
+        self.assertEqual(data_queue.get(), 1)
+
+    def test_publish_fan_out(self):
+        first = self.bus.subscribe(EventType.ACCOUNT_UPDATE)
+        second = self.bus.subscribe(EventType.ACCOUNT_UPDATE)
+        message = object()
+
+        # Test
+        self.bus.publish(EventType.ACCOUNT_UPDATE, message)
+
+        # Validate
+        self.assertIs(first.get_nowait(), message)
+        self.assertIs(second.get_nowait(), message)
+        self.assertTrue(self.bus.is_queue_empty(EventType.ACCOUNT_UPDATE))
+
+    def test_publish_no_subscribers(self):
+        # Test
+        self.bus.publish(EventType.DATA, 1)
+        data_queue = self.bus.subscribe(EventType.DATA)
+
+        # Validate
+        self.assertTrue(data_queue.empty())
+        self.assertEqual(
+            self.bus.overflow_counts()[EventType.DATA]["unrouted"], 1
+        )
+
+    def test_publish_flag(self):
+        # Test
+        self.bus.publish(EventType.EOD, True)
+
+        # Validate
+        self.assertTrue(self.bus.get_flag(EventType.EOD))
+
+    def test_wait_for_flag_already_set(self):
+        self.bus.publish(EventType.EOD, True)
+
+        # Test
+        result = self.bus.wait_for_flag(EventType.EOD, True, timeout=0.1)
+
+        # Validate
+        self.assertTrue(result)
+
+    def test_wait_for_flag_notified(self):
+        def set_flag():
+            sleep(0.1)
+            self.bus.publish(EventType.UPDATE_EQUITY, True)
+
+        threading.Thread(target=set_flag, daemon=True).start()
+
+        # Test
+        result = self.bus.wait_for_flag(EventType.UPDATE_EQUITY, True, 5)
+
+        # Validate
+        self.assertTrue(result)
+
+    def test_wait_for_flag_timeout(self):
+        # Test
+        result = self.bus.wait_for_flag(EventType.EOD, True, timeout=0.05)
+
+        # Validate
+        self.assertFalse(result)
+
+    def test_wait_for_any(self):
+        def set_flag():
+            sleep(0.1)
+            self.bus.publish(EventType.ROLLOVER_EXITED, True)
+
+        threading.Thread(target=set_flag, daemon=True).start()
+
+        # Test
+        result = self.bus.wait_for_any(
+            {EventType.ROLLED_OVER: True, EventType.ROLLOVER_EXITED: True},
+            timeout=5,
+        )
+
+        # Validate
+        self.assertEqual(result, EventType.ROLLOVER_EXITED)
+
+    def test_configure(self):
+        self.bus.configure(EventType.DATA, 2, OverflowPolicy.DROP_OLDEST)
+
+        # Test
+        data_queue = self.bus.subscribe(EventType.DATA)
+        order_queue = self.bus.subscribe(EventType.ORDER)
+
+        # Validate
+        self.assertEqual(data_queue.capacity, 2)
+        self.assertEqual(data_queue.policy, OverflowPolicy.DROP_OLDEST)
+        self.assertIsNone(order_queue.capacity)
+
+    def test_default_capacity_market_data_only(self):
+        bus = MessageBus(2, OverflowPolicy.DROP_OLDEST)
+
+        # Test
+        data_queue = bus.subscribe(EventType.DATA)
+        order_queue = bus.subscribe(EventType.ORDER)
+
+        # Validate
+        self.assertEqual(data_queue.capacity, 2)
+        self.assertEqual(data_queue.policy, OverflowPolicy.DROP_OLDEST)
+        self.assertIsNone(order_queue.capacity)
+        self.assertEqual(order_queue.policy, OverflowPolicy.BLOCK)
+
+    def test_configure_control_topic(self):
+        # Validate
+        self.bus.configure(EventType.ORDER, None)
+        with self.assertRaises(ValueError):
+            self.bus.configure(EventType.ORDER, 2)
+        with self.assertRaises(ValueError):
+            self.bus.configure(
+                EventType.TRADE_UPDATE, None, OverflowPolicy.DROP_OLDEST
+            )
+
+    def test_publish_no_subscribers_threads(self):
+        def publish():
+            for _ in range(1000):
+                self.bus.publish(EventType.DATA, 1)
+
+        threads = [threading.Thread(target=publish) for _ in range(4)]
+
+        # Test
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Validate
+        self.assertEqual(
+            self.bus.overflow_counts()[EventType.DATA]["unrouted"], 4000
+        )
+
+    def test_subscribe_latest(self):
+        # Test
+        channel = self.bus.subscribe(
+            EventType.ORDER_BOOK, policy=OverflowPolicy.LATEST
+        )
+
+        # Validate
+        self.assertIsInstance(channel, ConflatingChannel)
+
+    def test_configure_flag_topic(self):
+        # Validate
+        with self.assertRaises(ValueError):
+            self.bus.configure(EventType.EOD, 2)
+
+    def test_overflow_counts(self):
+        self.bus.subscribe(EventType.DATA, 1, OverflowPolicy.DROP_OLDEST)
+
+        # Test
+        for i in range(3):
+            self.bus.publish(EventType.DATA, i)
+
+        # Validate
+        counts = self.bus.overflow_counts()
+        self.assertEqual(
+            counts[EventType.DATA],
+            {"dropped": 2, "conflated": 0, "unrouted": 0},
+        )
+
+    def test_wait_for_flag_queue_topic(self):
+        # Validate
+        with self.assertRaises(ValueError):
+            self.bus.wait_for_flag(EventType.DATA, True, timeout=0.01)
+
+
+class TestChannel(unittest.TestCase):
+    def test_get_timeout(self):
+        channel = Channel()
+
+        # Validate
+        with self.assertRaises(queue.Empty):
+            channel.get(timeout=0.01)
+
+        with self.assertRaises(queue.Empty):
+            channel.get_nowait()
+
+    def test_capacity_blocks_publisher(self):
+        channel = Channel(capacity=1)
+        channel.put(1)
+        thread = threading.Thread(target=channel.put, args=(2,), daemon=True)
+
+        # Test
+        thread.start()
+        sleep(0.05)
+
+        # Validate
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(channel.get(), 1)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(channel.get(), 2)
+
+    def test_drop_oldest(self):
+        channel = Channel(capacity=2, policy=OverflowPolicy.DROP_OLDEST)
+
+        # Test
+        for i in range(4):
+            channel.put(i)
+
+        # Validate
+        self.assertEqual(channel.dropped, 2)
+        self.assertEqual(channel.get_nowait(), 2)
+        self.assertEqual(channel.get_nowait(), 3)
+
+    def test_conflate(self):
+        channel = Channel(capacity=2, policy=OverflowPolicy.CONFLATE)
+        first = SimpleNamespace(instrument_id=1)
+        second = SimpleNamespace(instrument_id=2)
+        latest = SimpleNamespace(instrument_id=1)
+        other = SimpleNamespace(instrument_id=3)
+
+        # Test
+        channel.put(first)
+        channel.put(second)
+        channel.put(latest)
+
+        # Validate
+        self.assertEqual(channel.conflated, 1)
+        self.assertEqual(channel.qsize(), 2)
+
+        # Test
+        channel.put(other)
+
+        # Validate
+        self.assertEqual(channel.dropped, 1)
+        self.assertIs(channel.get_nowait(), latest)
+        self.assertIs(channel.get_nowait(), other)
+
+    def test_policy_from_string(self):
+        # Validate
+        self.assertEqual(
+            OverflowPolicy.from_string("drop-oldest"),
+            OverflowPolicy.DROP_OLDEST,
+        )
+        self.assertEqual(
+            OverflowPolicy.from_string("conflate"), OverflowPolicy.CONFLATE
+        )
+
+        with self.assertRaises(ValueError):
+            OverflowPolicy.from_string("newest")
+
+    def test_invalid_capacity(self):
+        # Validate
+        with self.assertRaises(ValueError):
+            Channel(capacity=0)
+
+
+class TestConflatingChannel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.channel = ConflatingChannel()
+
+    def test_latest_per_instrument(self):
+        # Test
+        self.channel.put(Update(1, 100.0))
+        self.channel.put(Update(2, 50.0))
+        self.channel.put(Update(1, 101.0))
+        self.channel.put(Update(1, 102.0))
+
+        # Validate
+        self.assertEqual(self.channel.qsize(), 2)
+        self.assertEqual(self.channel.conflated, 2)
+        self.assertEqual(self.channel.get_nowait(), Update(1, 102.0, 2))
+        self.assertEqual(self.channel.get_nowait(), Update(2, 50.0, 0))
+        self.assertTrue(self.channel.empty())
+
+    def test_original_message_unchanged(self):
+        first = Update(1, 100.0)
+        latest = Update(1, 101.0)
+
+        # Test
+        self.channel.put(first)
+        self.channel.put(latest)
+        result = self.channel.get_nowait()
+
+        # Validate
+        self.assertEqual(result.merged, 1)
+        self.assertEqual(latest.merged, 0)
+
+    def test_unkeyed_messages_not_merged(self):
+        # Test
+        self.channel.put("eod")
+        self.channel.put("eod")
+
+        # Validate
+        self.assertEqual(self.channel.qsize(), 2)
+
+    def test_get_timeout(self):
+        # Validate
+        with self.assertRaises(queue.Empty):
+            self.channel.get(timeout=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
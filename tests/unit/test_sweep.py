@@ -0,0 +1,134 @@
+import os
+import toml
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from midastrader.sweep import (
+    _run_backtest,
+    apply_overrides,
+    expand_grid,
+    flatten_grid,
+    shared_data_files,
+    write_variants,
+)
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = {
+            "general": {"output_path": "output/"},
+            "strategy": {"parameters": {"capital": 1000, "start": "2024"}},
+        }
+        self.grid = {
+            "strategy": {"parameters": {"capital": [1000, 2000]}},
+            "general": {"batch_size": [1, 10, 100]},
+        }
+
+    def test_flatten_grid(self):
+        # Test
+        axes = flatten_grid(self.grid)
+
+        # Validate
+        self.assertEqual(
+            axes,
+            {
+                "strategy.parameters.capital": [1000, 2000],
+                "general.batch_size": [1, 10, 100],
+            },
+        )
+
+    def test_flatten_grid_invalid(self):
+        with self.assertRaises(ValueError):
+            flatten_grid({"strategy": {"parameters": {"capital": 1000}}})
+
+        with self.assertRaises(ValueError):
+            flatten_grid({"strategy": {"parameters": {"capital": []}}})
+
+    def test_expand_grid(self):
+        # Test
+        variants = expand_grid(self.grid)
+
+        # Validate
+        self.assertEqual(len(variants), 6)
+        self.assertEqual(
+            variants[0],
+            {"strategy.parameters.capital": 1000, "general.batch_size": 1},
+        )
+        self.assertEqual(
+            variants[-1],
+            {"strategy.parameters.capital": 2000, "general.batch_size": 100},
+        )
+
+    def test_apply_overrides(self):
+        # Test
+        config = apply_overrides(
+            self.config,
+            {"strategy.parameters.capital": 5000, "risk.class": "Risk"},
+        )
+
+        # Validate
+        self.assertEqual(config["strategy"]["parameters"]["capital"], 5000)
+        self.assertEqual(config["strategy"]["parameters"]["start"], "2024")
+        self.assertEqual(config["risk"]["class"], "Risk")
+        self.assertEqual(
+            self.config["strategy"]["parameters"]["capital"], 1000
+        )
+
+    def test_write_variants(self):
+        variants = expand_grid(self.grid)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # Test
+            paths = write_variants(self.config, variants, tmp)
+
+            # Validate
+            self.assertEqual(len(paths), 6)
+            config = toml.load(paths[3])
+            self.assertEqual(config["strategy"]["parameters"]["capital"], 2000)
+            self.assertEqual(config["general"]["batch_size"], 1)
+            self.assertEqual(
+                config["general"]["output_path"],
+                os.path.join(tmp, "run_3", ""),
+            )
+            self.assertFalse(config["general"]["upload_results"])
+
+    def test_shared_data_files(self):
+        self.config["vendor"] = {
+            "historical": {
+                "data_file": "tests/unit/he_zc_ohlcv-1h.bin",
+                "memory_map": True,
+            }
+        }
+
+        # Test
+        paths = shared_data_files(self.config)
+
+        # Validate
+        self.assertEqual(paths, ["tests/unit/he_zc_ohlcv-1h.bin"])
+
+        self.config["vendor"]["historical"]["memory_map"] = False
+        self.assertEqual(shared_data_files(self.config), [])
+        self.assertEqual(shared_data_files({}), [])
+
+    @patch("midastrader.core.adapters.performance.base.DatabaseClient")
+    def test_run_backtest_database_unavailable(self, database):
+        create_backtest = database.return_value.trading.create_backtest
+        create_backtest.side_effect = ConnectionError("database unavailable")
+
+        with open("tests/unit/config.toml", "r") as f:
+            config = toml.load(f)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_variants(config, [{}], tmp)[0]
+
+            # Test
+            stats = _run_backtest(path)
+
+        # Validate
+        self.assertFalse(create_backtest.called)
+        self.assertIn("total_return", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+import os
+import toml
+import tempfile
+import unittest
+import pandas as pd
+from unittest.mock import Mock, patch
+
+from midastrader.sweep import _init_worker
+from midastrader.walk_forward import (
+    _best_run,
+    run_walk_forward,
+    stitch_equity,
+    walk_forward_windows,
+)
+
+
+def make_curve(timestamps: list, values: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"equity_value": values},
+        index=pd.Index(timestamps, name="timestamp"),
+    )
+
+
+def write_config(tmp: str) -> str:
+    with open("tests/unit/config.toml", "r") as f:
+        config = toml.load(f)
+
+    config["general"]["output_path"] = os.path.join(tmp, "")
+    config["general"]["output_format"] = "csv.gz"
+    path = os.path.join(tmp, "config.toml")
+
+    with open(path, "w") as f:
+        toml.dump(config, f)
+
+    return path
+
+
+class TestWalkForward(unittest.TestCase):
+    def test_walk_forward_windows(self):
+        # Test
+        windows = walk_forward_windows("2024-01-01", "2024-03-01", 30, 10)
+
+        # Validate
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(
+            windows[0],
+            {
+                "train_start": "2024-01-01",
+                "train_end": "2024-01-31",
+                "test_start": "2024-01-31",
+                "test_end": "2024-02-10",
+            },
+        )
+        self.assertEqual(windows[1]["train_start"], "2024-01-11")
+        self.assertEqual(windows[2]["test_start"], "2024-02-20")
+        self.assertEqual(windows[2]["test_end"], "2024-03-01")
+
+    def test_walk_forward_windows_step(self):
+        # Test
+        windows = walk_forward_windows(
+            "2024-01-01T00:00:00", "2024-01-10T00:00:00", 0, 4, step_days=2
+        )
+
+        # Validate
+        self.assertEqual(
+            [(w["test_start"], w["test_end"]) for w in windows],
+            [
+                ("2024-01-01T00:00:00", "2024-01-05T00:00:00"),
+                ("2024-01-03T00:00:00", "2024-01-07T00:00:00"),
+                ("2024-01-05T00:00:00", "2024-01-09T00:00:00"),
+                ("2024-01-07T00:00:00", "2024-01-10T00:00:00"),
+                ("2024-01-09T00:00:00", "2024-01-10T00:00:00"),
+            ],
+        )
+
+    def test_walk_forward_windows_invalid(self):
+        with self.assertRaises(ValueError):
+            walk_forward_windows("2024-01-01", "2024-02-01", 10, 0)
+
+        with self.assertRaises(ValueError):
+            walk_forward_windows("2024-01-01", "2024-02-01", -1, 10)
+
+        with self.assertRaises(ValueError):
+            walk_forward_windows("2024-01-01", "2024-02-01", 40, 10)
+
+    def test_stitch_equity(self):
+        curves = [
+            make_curve([1, 2], [100.0, 110.0]),
+            make_curve([], []),
+            make_curve([3, 4], [100.0, 50.0]),
+        ]
+
+        # Test
+        stitched = stitch_equity(curves, 1000.0)
+
+        # Validate
+        self.assertEqual(list(stitched.index), [1, 2, 3, 4])
+        self.assertEqual(
+            list(stitched["equity_value"]), [1000.0, 1100.0, 1100.0, 550.0]
+        )
+
+    def test_stitch_equity_empty(self):
+        # Test
+        stitched = stitch_equity([], 1000.0)
+
+        # Validate
+        self.assertTrue(stitched.empty)
+        self.assertEqual(list(stitched.columns), ["equity_value"])
+
+    def test_best_run(self):
+        results = [
+            {"stats": {"sharpe_ratio": 0.5}},
+            {"error": "ValueError()"},
+            {"stats": {"sharpe_ratio": float("nan")}},
+            {"stats": {"sharpe_ratio": 1.5}},
+        ]
+
+        # Validate
+        self.assertEqual(_best_run(results, "sharpe_ratio"), 3)
+        self.assertIsNone(_best_run(results[1:3], "sharpe_ratio"))
+
+    @patch("midastrader.walk_forward.ProcessPoolExecutor")
+    def test_run_walk_forward_shares_data(self, pool):
+        executor = pool.return_value.__enter__.return_value
+        executor.submit.return_value.result.side_effect = RuntimeError()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # Test
+            table = run_walk_forward(write_config(tmp), 0, 10)
+
+        # Validate
+        kwargs = pool.call_args.kwargs
+        self.assertIs(kwargs["initializer"], _init_worker)
+        self.assertEqual(
+            kwargs["initargs"], (["tests/unit/he_zc_ohlcv-1h.bin"],)
+        )
+        self.assertEqual(len(table), 3)
+        self.assertTrue(table["error"].notna().all())
+
+    @patch("midastrader.walk_forward.ProcessPoolExecutor")
+    def test_run_walk_forward(self, pool):
+        # Train sharpe of each variant in each window, by run directory
+        sharpe = {
+            ("window_0", "run_0"): 0.5,
+            ("window_0", "run_1"): 1.5,
+            ("window_1", "run_0"): 2.0,
+            ("window_1", "run_1"): 1.0,
+        }
+        curves = {
+            "window_0": make_curve([1, 2], [100.0, 110.0]),
+            "window_1": make_curve([3, 4], [100.0, 50.0]),
+        }
+        configs = []
+
+        def submit(fn, path):
+            config = toml.load(path)
+            configs.append(config)
+            *_, window, stage, run, _ = path.split(os.sep)
+            future = Mock()
+
+            if stage == "train":
+                future.result.return_value = {
+                    "stats": {"sharpe_ratio": sharpe[(window, run)]},
+                    "equity": make_curve([], []),
+                }
+            else:
+                future.result.return_value = {
+                    "stats": {"total_return": float(window[-1])},
+                    "equity": curves[window],
+                }
+            return future
+
+        pool.return_value.__enter__.return_value.submit.side_effect = submit
+
+        with tempfile.TemporaryDirectory() as tmp:
+            grid_path = os.path.join(tmp, "grid.toml")
+
+            with open(grid_path, "w") as f:
+                toml.dump(
+                    {"strategy": {"parameters": {"risk_free_rate": [1, 2]}}},
+                    f,
+                )
+
+            # Test
+            table = run_walk_forward(
+                write_config(tmp), 10, 10, grid_path=grid_path
+            )
+            stitched = pd.read_csv(os.path.join(tmp, "stitched_equity.csv.gz"))
+            written = pd.read_csv(os.path.join(tmp, "walk_forward.csv.gz"))
+
+        # Validate
+        self.assertEqual(len(configs), 6)
+        for config in configs:
+            self.assertFalse(config["general"]["upload_results"])
+
+        self.assertEqual(
+            list(table["strategy.parameters.risk_free_rate"]), [2, 1]
+        )
+        self.assertEqual(
+            list(table["test_start"]), ["2024-01-11", "2024-01-21"]
+        )
+        self.assertEqual(list(table["total_return"]), [0.0, 1.0])
+        self.assertNotIn("error", table.columns)
+        self.assertEqual(
+            list(written["strategy.parameters.risk_free_rate"]), [2, 1]
+        )
+        self.assertEqual(list(stitched["timestamp"]), [1, 2, 3, 4])
+        self.assertEqual(
+            list(stitched["equity_value"]),
+            [1000000.0, 1100000.0, 1100000.0, 550000.0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
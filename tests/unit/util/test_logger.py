@@ -0,0 +1,85 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from midastrader.utils.logger import SystemLogger
+
+
+class TestSystemLogger(unittest.TestCase):
+    def setUp(self) -> None:
+        self.default = SystemLogger()
+
+    def test_instances_independent(self):
+        # Test
+        first = SystemLogger("first", "terminal")
+        second = SystemLogger("second", "terminal")
+
+        # Validate
+        self.assertIsNot(first.logger, second.logger)
+        self.assertEqual(len(first.logger.handlers), 1)
+        self.assertEqual(len(second.logger.handlers), 1)
+
+    def test_activate(self):
+        engine_logger = SystemLogger("engine", "terminal")
+
+        # Test
+        with engine_logger.activate():
+            current = SystemLogger.current()
+            logger = SystemLogger.get_logger()
+
+        # Validate
+        self.assertIs(current, engine_logger)
+        self.assertIs(logger, engine_logger.logger)
+        self.assertIsNot(SystemLogger.current(), engine_logger)
+
+    def test_activate_per_thread(self):
+        engine_logger = SystemLogger("engine", "terminal")
+        result = []
+
+        # Test
+        with engine_logger.activate():
+            thread = threading.Thread(
+                target=lambda: result.append(SystemLogger.current())
+            )
+            thread.start()
+            thread.join()
+
+        # Validate
+        self.assertIsNot(result[0], engine_logger)
+
+    def test_stop(self):
+        logger = SystemLogger("engine", "terminal")
+        handler = logger.logger.handlers[0]
+        handler.close = MagicMock()
+
+        # Test
+        logger.info("done")
+        logger.stop()
+        logger.stop()
+
+        # Validate
+        self.assertFalse(logger.flusher_thread.is_alive())
+        self.assertEqual(logger.logger.handlers, [])
+        self.assertTrue(logger.buffer.empty())
+        handler.close.assert_called_once()
+
+    def test_stop_default(self):
+        self.addCleanup(setattr, SystemLogger, "_open", SystemLogger._open)
+        self.addCleanup(
+            setattr, SystemLogger, "_instance", SystemLogger._instance
+        )
+        SystemLogger._instance, SystemLogger._open = None, []
+        first = SystemLogger("first", "terminal")
+        second = SystemLogger("second", "terminal")
+
+        # Test
+        first.stop()
+
+        # Validate
+        self.assertIs(SystemLogger.current(), second)
+        self.assertIs(SystemLogger.get_logger(), second.logger)
+        second.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from datetime import date, time
+
+from midastrader.utils.session import SessionCalendar
+
+
+class TestSessionCalendar(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calendar = SessionCalendar("America/New_York")
+
+    def test_trading_date(self):
+        timestamp1 = 1727734758000000000  # 2024-09-30 18:19:18 EDT
+        timestamp2 = 1727755200000000000  # 2024-10-01 00:00:00 EDT
+
+        # Validate
+        self.assertEqual(
+            self.calendar.trading_date(timestamp1), date(2024, 9, 30)
+        )
+        self.assertEqual(
+            self.calendar.trading_date(timestamp2), date(2024, 10, 1)
+        )
+        self.assertEqual(
+            self.calendar.trading_date(timestamp2 - 1), date(2024, 9, 30)
+        )
+
+    def test_day_bounds_dst(self):
+        # Test
+        start, end = self.calendar.day_bounds(date(2024, 3, 10))
+
+        # Validate
+        self.assertEqual(start, 1710046800000000000)  # 00:00 EST
+        self.assertEqual(end - start, 23 * 3600 * 1_000_000_000)
+
+    def test_session_bounds(self):
+        # Test
+        open_ns, close_ns = self.calendar.session_bounds(
+            date(2024, 9, 30), time(9, 30), time(16, 0)
+        )
+
+        # Validate
+        self.assertEqual(open_ns, 1727703000000000000)  # 09:30 EDT
+        self.assertEqual(close_ns, 1727726400000000000)  # 16:00 EDT
+        self.assertIn(
+            (date(2024, 9, 30), time(9, 30)), self.calendar.boundaries
+        )
+
+    def test_after_close(self):
+        close = time(16, 0)
+
+        # Validate
+        self.assertTrue(self.calendar.after_close(1727734758000000000, close))
+        self.assertFalse(self.calendar.after_close(1727705958000000000, close))
+        self.assertFalse(self.calendar.after_close(1727726400000000000, close))
+
+    def test_in_session(self):
+        open, close = time(9, 30), time(16, 0)
+
+        # Validate
+        self.assertTrue(
+            self.calendar.in_session(1727705958000000000, open, close)
+        )
+        self.assertTrue(
+            self.calendar.in_session(1727703000000000000, open, close)
+        )
+        self.assertFalse(
+            self.calendar.in_session(1727734758000000000, open, close)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,8 @@ from midastrader.utils.unix import (
     unix_to_iso,
     iso_to_unix,
     unix_to_date,
+    unix_to_datetime,
+    datetime_to_unix,
     resample_timestamp,
 )
 import datetime
@@ -101,6 +103,34 @@ class TestUtils(unittest.TestCase):
         # Validate
         pd.testing.assert_frame_equal(daily_df, expected_df)
 
+    def test_unix_to_datetime(self):
+        timestamps = pd.Series([1635728461000000000, 1707307200000000000])
+
+        # Test
+        utc = unix_to_datetime(timestamps)
+        est = unix_to_datetime(timestamps, "America/New_York")
+
+        # Validate
+        self.assertEqual(
+            utc.iloc[0], pd.Timestamp("2021-11-01T01:01:01", tz="UTC")
+        )
+        self.assertEqual(
+            est.iloc[1].isoformat(),
+            unix_to_iso(1707307200000000000, "America/New_York"),
+        )
+        self.assertEqual(str(est.dt.tz), "America/New_York")
+
+    def test_datetime_to_unix(self):
+        timestamps = pd.Index([1704098576204104704, 1704119427481684736])
+
+        # Test
+        result = datetime_to_unix(
+            unix_to_datetime(timestamps, "America/New_York")
+        )
+
+        # Validate
+        self.assertEqual(list(result), list(timestamps))
+
 
 if __name__ == "__main__":
     unittest.main()